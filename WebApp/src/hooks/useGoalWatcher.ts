@@ -9,6 +9,7 @@ import type {
 } from "../types/types";
 
 const STORAGE_KEY = "goalWatcher.seenGoals";
+const EVENTS_URL: string | undefined = import.meta.env.VITE_EVENTS_URL;
 
 type SeenGoalsStore = Record<string, string[]>;
 
@@ -83,6 +84,16 @@ function saveSeenKeys(gameId: string | number, goals: NhlGoal[]): void {
   safeSaveStore(store);
 }
 
+/** Forget one goal (taken back), so it fires again if it is reinstated */
+function forgetSeenKey(gameId: string | number, goalId: string): void {
+  const store = safeLoadStore();
+  const key = String(gameId);
+  const arr = store[key];
+  if (!arr) return;
+  store[key] = arr.filter((k) => k !== goalId);
+  safeSaveStore(store);
+}
+
 export type GoalWatcherOptions = {
   /** Polling period in milliseconds (default: 4000) */
   pollMs?: number;
@@ -92,6 +103,11 @@ export type GoalWatcherOptions = {
   emitExistingOnStart?: boolean;
   /** If true, remember processed goals across reloads (default: true) */
   persistAcrossSessions?: boolean;
+  /**
+   * Server-sent events feed (standalone/event_server.py). When set, goals are
+   * pushed instead of polled. Default: VITE_EVENTS_URL, if defined.
+   */
+  eventsUrl?: string;
   onGameStart?: (gameState: string, data: NhlGoalsResponse) => void;
 };
 
@@ -111,6 +127,7 @@ export function useGoalWatcher(
     fireDelayMs = 0,
     emitExistingOnStart = false,
     persistAcrossSessions = true,
+    eventsUrl = EVENTS_URL,
   } = opts;
 
   const prevGoalsRef = useRef<NhlGoal[] | null>(null);
@@ -128,6 +145,122 @@ export function useGoalWatcher(
     let cancelled = false;
     let timer: number | undefined;
 
+    const isPreGame = (s: string | null | undefined) =>
+      s === "FUT" || s === "PRE" || s === "PREGAME";
+
+    function fireGoals(newOnes: GoalWithMeta[], allGoals: NhlGoal[]): void {
+      if (cancelled || !newOnes.length) return;
+      const fire = () => {
+        if (cancelled) return;
+        for (const g of newOnes) {
+          cbRef.current(g, allGoals);
+        }
+      };
+
+      if (fireDelayMs > 0) {
+        window.setTimeout(fire, fireDelayMs);
+      } else {
+        fire();
+      }
+    }
+
+    // ---------- push mode: event server over SSE ----------
+    // EventSource reconnects on its own and resumes with Last-Event-ID.
+    if (eventsUrl) {
+      const gid = String(gameId);
+      const es = new EventSource(eventsUrl);
+      let goals: GoalWithMeta[] = [];
+      let seen: Set<string> | null = null; // null until the first snapshot
+      let header: Pick<NhlGoalsResponse, "home" | "away"> = {};
+
+      // event server goals carry eventId; use it as the stable id
+      const withId = (g: GoalWithMeta & { eventId?: number }): GoalWithMeta =>
+        g.id == null && g.eventId != null ? { ...g, id: g.eventId } : g;
+
+      // full list, sent on connect (and after a server restart)
+      const onGoals = (e: MessageEvent) => {
+        const data = JSON.parse(e.data);
+        if (String(data.gameId) !== gid) return;
+        header = { home: data.home, away: data.away };
+        const next: GoalWithMeta[] = (data.goals ?? []).map(withId);
+
+        let newOnes: GoalWithMeta[] = [];
+        if (seen == null) {
+          // same as poll mode: goals already shown before a page reload are not replayed
+          seen = persistAcrossSessions ? loadSeenKeys(gid) : new Set<string>();
+          for (const g of goals) seen.add(goalKey(g));
+          if (emitExistingOnStart) newOnes = next.filter((g) => !seen!.has(goalKey(g)));
+        } else {
+          newOnes = next.filter((g) => !seen!.has(goalKey(g)));
+        }
+
+        for (const g of next) seen.add(goalKey(g));
+        goals = next;
+        fireGoals(newOnes, next);
+        if (persistAcrossSessions) saveSeenKeys(gid, next);
+      };
+
+      // one new goal, as soon as the server sees it
+      const onGoal = (e: MessageEvent) => {
+        const data = JSON.parse(e.data);
+        if (String(data.gameId) !== gid) return;
+        header = { home: data.home, away: data.away };
+        const goal = withId(data.goal);
+        const key = goalKey(goal);
+        if (seen?.has(key) || goals.some((g) => goalKey(g) === key)) return;
+
+        seen?.add(key);
+        goals = [...goals, goal];
+        if (persistAcrossSessions) saveSeenKeys(gid, goals);
+        fireGoals([goal], goals);
+      };
+
+      const onGoalRemoved = (e: MessageEvent) => {
+        const data = JSON.parse(e.data);
+        if (String(data.gameId) !== gid) return;
+        const key = goalKey(withId(data.goal));
+        goals = goals.filter((g) => goalKey(g) !== key);
+        // a reinstated goal (challenge lost / correction) must fire again
+        seen?.delete(key);
+        if (persistAcrossSessions) forgetSeenKey(gid, key);
+      };
+
+      const onScoreboard = (e: MessageEvent) => {
+        const data = JSON.parse(e.data);
+        const game = Object.values(data.teams ?? {}).find(
+          (p) => String((p as NhlScore).id) === gid
+        ) as NhlScore | undefined;
+        const state = game?.state;
+        if (!state || cancelled) return;
+
+        const prevState = prevGameStateRef.current;
+        prevGameStateRef.current = state;
+        const gameStartCb = gameStartCbRef.current;
+        if (!gameStartCb) return;
+
+        if (
+          (prevState === null && !isPreGame(state)) ||
+          (prevState !== null && isPreGame(prevState) && !isPreGame(state))
+        ) {
+          gameStartCb(state, { ...header, goals });
+        }
+      };
+
+      es.addEventListener("goals", onGoals);
+      es.addEventListener("goal", onGoal);
+      es.addEventListener("goal_removed", onGoalRemoved);
+      es.addEventListener("scoreboard", onScoreboard);
+
+      prevGoalsRef.current = null;
+      prevGameStateRef.current = null;
+
+      return () => {
+        cancelled = true;
+        es.close();
+      };
+    }
+
+    // ---------- poll mode ----------
     async function tick(initial: boolean): Promise<void> {
       try {
         const data: NhlGoalsResponse = await getGameGoals(gameId as string | number);
@@ -155,9 +288,6 @@ export function useGoalWatcher(
             const prevState = prevGameStateRef.current;
             const gameStartCb = gameStartCbRef.current;
           
-            const isPreGame = (s: string | null | undefined) =>
-              s === "FUT" || s === "PRE" || s === "PREGAME";
-          
             if (prevState === null) {
               // First tick for this game
               prevGameStateRef.current = state;
@@ -204,20 +334,7 @@ export function useGoalWatcher(
         }
 
         // Fire callbacks (optionally delayed)
-        if (!cancelled && newOnes.length) {
-          const fire = () => {
-            if (cancelled) return;
-            for (const g of newOnes) {
-              cbRef.current(g, nextGoals);
-            }
-          };
-
-          if (fireDelayMs > 0) {
-            window.setTimeout(fire, fireDelayMs);
-          } else {
-            fire();
-          }
-        }
+        fireGoals(newOnes, nextGoals);
       } catch {
         // keep polling even if one request fails
         
@@ -238,5 +355,5 @@ export function useGoalWatcher(
       cancelled = true;
       if (timer !== undefined) window.clearTimeout(timer);
     };
-  }, [gameId, pollMs, fireDelayMs, emitExistingOnStart, persistAcrossSessions]);
+  }, [gameId, pollMs, fireDelayMs, emitExistingOnStart, persistAcrossSessions, eventsUrl]);
 }
\ No newline at end of file
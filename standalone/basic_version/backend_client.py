@@ -1,2 +1,2 @@
 # backend_client.py
-from nhl_client import fetch_game_now
+from nhl_client import fetch_game_now, fetch_games_now
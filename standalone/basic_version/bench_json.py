@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# bench_json.py
+"""
+JSON backend benchmark over recorded payloads: stdlib json vs orjson vs msgspec
+(the ones that are installed). For each payload:
+  loads   plain decode to dicts (fetch_json default, rosters)
+  typed   the decoder the client really uses: ScoreFeed records for /score/now,
+          pbp_stream.parse_goal_plays for the play-by-play
+  kept    memory still held by the typed result (what sits in the caches)
+
+  python3 bench_json.py [--score score.json] [--pbp pbp.json] [--roster MTL.json] [--runs 50]
+
+Defaults: the recorded game in WebApp/public/pbp.json and roasters/MTL.json.
+There is no recorded scoreboard in the repo, save one on the device with
+  curl -so score.json https://api-web.nhle.com/v1/score/now
+Each backend runs in its own process (config.JSON_BACKEND is read at import).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PBP = os.path.join(HERE, "..", "..", "WebApp", "public", "pbp.json")
+DEFAULT_ROSTER = os.path.join(HERE, "roasters", "MTL.json")
+
+
+def _best_ms(fn, data, runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn(data)
+        dt = (time.perf_counter() - t0) * 1000
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def _kept_kb(fn, data) -> float:
+    tracemalloc.start()
+    result = fn(data)
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return kept / 1024
+
+
+def child(backend: str, fixtures, runs: int):
+    import config
+    config.JSON_BACKEND = backend
+    import json_backend
+    import nhl_client
+    import pbp_stream
+
+    typed = {"score": nhl_client._parse_score, "pbp": pbp_stream.parse_goal_plays}
+    rows = []
+    for kind, path in fixtures:
+        with open(path, "rb") as f:
+            data = f.read()
+        fn = typed.get(kind)
+        rows.append({
+            "loads": _best_ms(json_backend.loads, data, runs),
+            "typed": _best_ms(fn, data, runs) if fn else None,
+            "kept": _kept_kb(fn or json_backend.loads, data),
+        })
+    print(json.dumps({"backend": json_backend.BACKEND, "rows": rows}))
+
+
+def bench(fixtures, runs: int):
+    sys.path.insert(0, HERE)
+    import json_backend
+
+    backends = [b for b in json_backend.BACKENDS if json_backend._installed(b)]
+    print(f"backends: {', '.join(backends)}  ({runs} runs, best of)\n")
+
+    results = {}
+    for b in backends:
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", b, "--runs", str(runs),
+             "--fixtures", json.dumps(fixtures)],
+            capture_output=True, text=True, check=True, cwd=HERE,
+        )
+        results[b] = json.loads(proc.stdout.strip().splitlines()[-1])["rows"]
+
+    print(f"{'payload':<22} {'backend':<8} {'loads ms':>9} {'typed ms':>9} {'kept KB':>8}")
+    for i, (kind, path) in enumerate(fixtures):
+        name = f"{kind} {os.path.getsize(path) // 1024}KB"
+        for b in backends:
+            r = results[b][i]
+            typed = f"{r['typed']:.3f}" if r["typed"] is not None else "-"
+            print(f"{name:<22} {b:<8} {r['loads']:>9.3f} {typed:>9} {r['kept']:>8.0f}")
+            name = ""
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--score", action="append", default=[])
+    ap.add_argument("--pbp", action="append", default=[])
+    ap.add_argument("--roster", action="append", default=[])
+    ap.add_argument("--runs", type=int, default=50)
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    ap.add_argument("--fixtures", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        sys.path.insert(0, HERE)
+        child(args.child, json.loads(args.fixtures), args.runs)
+        return
+
+    fixtures = [("score", p) for p in args.score]
+    fixtures += [("pbp", p) for p in args.pbp or [DEFAULT_PBP]]
+    fixtures += [("roster", p) for p in args.roster or ([DEFAULT_ROSTER] if os.path.exists(DEFAULT_ROSTER) else [])]
+    bench(fixtures, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+# bench_matrix.py
+"""
+LED draw benchmark: cost per frame of the score matrix and backlight effects,
+the old way (glyph strings scanned char by char, mapping math +
+strip.setPixelColor per pixel, fill() showing the background before the frame
+is drawn, goal animation drawn on the fly) vs now (compiled glyphs, index
+table, frame buffer, one bulk copy + one show() per frame, goal animation
+rendered once and played back as frame copies).
+
+  sudo python3 bench_matrix.py [--runs 200] [--show]
+  sudo python3 bench_matrix.py --check     render 0-99 at every rotation, no LEDs
+
+Runs on the Pi (rpi_ws281x needs the hardware). By default strip.show() and
+time.sleep() are stubbed out: nothing goes to the LEDs and the animation
+doesn't wait, so only the Python side of each frame is timed. --show keeps
+the real show() (the data transfer to the strip counts, gives real FPS).
+"""
+import argparse
+import math
+import random
+import time
+
+import config
+import matrix_number
+from matrix_number import MatrixNumberDisplay
+from screen_backlight_controller import ScreenBacklightController
+
+FG = (255, 255, 255)
+BG = (0, 0, 30)
+TEAM = (200, 16, 46)
+ACCENT = (0, 120, 255)
+
+
+class PerPixelDraw(MatrixNumberDisplay):
+    """Draw paths as they were before the table, the frame buffer and compiled glyphs."""
+
+    def _set_pixel(self, x, y, color):
+        if 0 <= x < self.w and 0 <= y < self.h:
+            self.strip.setPixelColor(self._xy_to_index(x, y), color)
+
+    def _set_pixel_no_bounds(self, x, y, color):
+        self.strip.setPixelColor(self._xy_to_index(x, y), color)
+
+    def _draw_bitmap(self, glyph, x0, y0, fg_color, px=None):
+        for y, row in enumerate(glyph.rows):
+            for x, ch in enumerate(row):
+                if ch == "1":
+                    self._set_pixel(x0 + x, y0 + y, fg_color)
+
+    def _fill_no_show(self, color):
+        # frames used to start with fill(bg), which showed the background
+        for i in range(self.strip.numPixels()):
+            self.strip.setPixelColor(i, color)
+        self.strip.show()
+
+    def show(self):
+        self.strip.show()
+
+    def _wipe_bg(self, bg_color, direction="lr", step_delay=0.01):
+        bg_c = matrix_number._to_color(bg_color)
+        outer, inner = (self.w, self.h) if direction == "lr" else (self.h, self.w)
+        for a in range(outer):
+            for b in range(inner):
+                x, y = (a, b) if direction == "lr" else (b, a)
+                self._set_pixel(x, y, bg_c)
+            self.strip.show()
+
+    def goal_number_animation(self, n, fg, bg, gap=1):
+        """Every frame drawn on the fly (lcd bounces from dy=3, same cost)."""
+        total_w = self.digit_w if len(str(n)) == 1 else (self.digit_w * 2 + gap)
+        cx, cy = (self.w - total_w) // 2, (self.h - self.digit_h) // 2
+        bg_int, fg_int = matrix_number._to_color(bg), matrix_number._to_color(fg)
+        alt_int = matrix_number._to_color(_scale(fg, 0.35))
+        self._wipe_bg(bg, "lr", step_delay=0.02)
+        for dx, dy, bright in [(0, 2, 0.35), (0, 1, 0.55), (0, 0, 0.75), (0, 0, 1.0), (1, 0, 1.0), (-1, 0, 1.0),
+                               (0, 0, 1.0), (0, 1, 0.85), (0, 0, 1.0), (0, 1, 0.9), (0, 0, 1.0)]:
+            self._fill_no_show(bg_int)
+            self._draw_number_at(n, cx + dx, cy + dy, _scale(fg, bright), gap)
+            self.show()
+        for _ in range(24):
+            self._fill_no_show(bg_int)
+            self._draw_number_at(n, cx, cy, fg, gap)
+            for __ in range(30):
+                x, y = random.randint(0, self.w - 1), random.randint(0, self.h - 1)
+                self._set_pixel(x, y, fg_int if random.random() > 0.4 else alt_int)
+            self.show()
+        for pulse in [0.85, 1.0, 0.9, 1.0, 0.95, 1.0]:
+            self._fill_no_show(bg_int)
+            self._draw_number_at(n, cx, cy, _scale(fg, pulse), gap)
+            self.show()
+        for _ in range(3):
+            self.show_number(n, fg=bg, bg=fg, gap=gap)
+            self.show_number(n, fg=fg, bg=bg, gap=gap)
+        self.show_number(n, fg=fg, bg=bg, gap=gap)
+
+
+def _same_strip(cls, obj):
+    """cls view of an existing display (one PixelStrip per channel on the Pi)."""
+    other = cls.__new__(cls)
+    other.__dict__.update(obj.__dict__)
+    return other
+
+
+def _sparkle_frame(d):
+    """One confetti frame of goal_number_animation."""
+    cx = (d.w - (d.digit_w * 2 + 1)) // 2
+    cy = (d.h - d.digit_h) // 2
+    fg_int = matrix_number._to_color(FG)
+    d._fill_no_show(matrix_number._to_color(BG))
+    d._draw_number_at(88, cx, cy, FG)
+    for _ in range(30):
+        d._set_pixel(random.randint(0, d.w - 1), random.randint(0, d.h - 1), fg_int)
+    d.show()
+
+
+MATRIX_FRAMES = {
+    "number 88": lambda d: d.show_number(88, FG, BG),
+    "sparkle": _sparkle_frame,
+    "emoji": lambda d: d.show_emoji("happy", FG, BG),
+    "wipe (all cols)": lambda d: d._wipe_bg(BG, "lr", 0),
+}
+
+
+# ---------- backlight: one frame of goal_animation_combo, old / new ----------
+def _scale(rgb, s):
+    return (int(rgb[0] * s), int(rgb[1] * s), int(rgb[2] * s))
+
+
+def _chase_old(b, t=0.3):
+    n = b.strip.numPixels()
+    head = int(t / 0.015) % n
+    tail_len = max(6, n // 12)
+    base = _scale(TEAM, 0.10 + 0.25 * (0.5 - 0.5 * math.cos(2 * math.pi * (t / 0.7))))
+    for i in range(n):
+        b.strip.setPixelColor(i, matrix_number._to_color(base))
+    b.strip.setPixelColor(head, matrix_number._to_color(ACCENT))
+    for k in range(1, tail_len + 1):
+        s = max(0.0, 1.0 - (k / (tail_len + 1)))
+        b.strip.setPixelColor((head - k) % n, matrix_number._to_color(_scale((255, 255, 255), s)))
+    b.strip.show()
+
+
+_tail_colors = {}    # the animation computes them once, before its loop
+
+
+def _chase_new(b, t=0.3):
+    n = b.fb.n
+    head = int(t / 0.015) % n
+    tail_len = max(6, n // 12)
+    tail_c = _tail_colors.get(n)
+    if tail_c is None:
+        tail_c = _tail_colors[n] = [
+            matrix_number._to_color(_scale((255, 255, 255), max(0.0, 1.0 - (k / (tail_len + 1)))))
+            for k in range(1, tail_len + 1)
+        ]
+    px = b.fb.buf
+    b.fb.fill(matrix_number._to_color(_scale(TEAM, 0.10 + 0.25 * (0.5 - 0.5 * math.cos(2 * math.pi * (t / 0.7))))))
+    px[head] = matrix_number._to_color(ACCENT)
+    for k in range(1, tail_len + 1):
+        px[(head - k) % n] = tail_c[k - 1]
+    b.show()
+
+
+def _sparkles_old(b):
+    n = b.strip.numPixels()
+    base = _scale(TEAM, 0.15)
+    for i in range(n):
+        b.strip.setPixelColor(i, matrix_number._to_color(base))
+    b.strip.show()      # goal_animation_sparkles filled with fill()
+    for _ in range(max(3, n // 15)):
+        b.strip.setPixelColor(random.randrange(n), matrix_number._to_color((255, 255, 255)))
+    for _ in range(max(3, n // 15)):
+        b.strip.setPixelColor(random.randrange(n), matrix_number._to_color(TEAM))
+    b.strip.show()
+
+
+def _sparkles_new(b):
+    n = b.fb.n
+    px = b.fb.buf
+    white_c, team_c = matrix_number._to_color((255, 255, 255)), matrix_number._to_color(TEAM)
+    b.fb.fill(matrix_number._to_color(_scale(TEAM, 0.15)))
+    for _ in range(max(3, n // 15)):
+        px[random.randrange(n)] = white_c
+    for _ in range(max(3, n // 15)):
+        px[random.randrange(n)] = team_c
+    b.show()
+
+
+BACKLIGHT_FRAMES = {
+    "chase": (_chase_old, _chase_new),
+    "sparkles": (_sparkles_old, _sparkles_new),
+}
+
+
+def check_rotations(d) -> bool:
+    """
+    Goal animation of 0-99 at every rotation the matrix accepts (rendered
+    only): each final frame must hold every lit cell of its digits, i.e.
+    nothing clipped. Rotations the matrix rejects are listed with the reason.
+    """
+    fg_int = matrix_number._to_color(FG)
+    ok = True
+    for rot in matrix_number.ROTATIONS:
+        c = _same_strip(MatrixNumberDisplay, d)
+        try:
+            c._set_rotation(rot)
+        except ValueError as e:
+            print(f"rotation {rot:>3}: rejected ({e})")
+            continue
+        bad = []
+        for n in range(100):
+            want = sum(len(c.digit_glyphs[ch].cells) for ch in str(n))
+            final = c.render_goal_animation(n, FG, BG).steps[-1][0]
+            if sum(1 for v in final if v == fg_int) != want:
+                bad.append(n)
+        ok = ok and not bad
+        print(f"rotation {rot:>3}: {c.w}x{c.h}, 0-99 " + (f"CLIPPED {bad}" if bad else "ok"))
+    return ok
+
+
+def _best_us(obj, fn, runs: int) -> float:
+    best = None
+    for _ in range(runs):
+        random.seed(1)
+        t0 = time.perf_counter()
+        fn(obj)
+        dt = (time.perf_counter() - t0) * 1e6
+        best = dt if best is None else min(best, dt)
+    return best
+
+
+def _goal_animation_us(d, runs: int):
+    """Whole goal_number_animation: best total and number of show() calls.
+    New path: the render is cached after the first run, this times playback."""
+    real_show = d.strip.show
+    shows = [0]
+
+    def count():
+        shows[0] += 1
+        real_show()
+
+    d.strip.show = count
+    best = None
+    for _ in range(runs):
+        shows[0] = 0
+        random.seed(1)
+        t0 = time.perf_counter()
+        d.goal_number_animation(88, FG, BG)
+        dt = (time.perf_counter() - t0) * 1e6
+        best = dt if best is None else min(best, dt)
+    d.strip.show = real_show
+    return best, shows[0]
+
+
+def _row(name, a, b):
+    print(f"{name:<20} {a:>9.1f} {b:>9.1f} {a / b:>7.1f}x {1e6 / b:>8.0f}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--runs", type=int, default=200)
+    ap.add_argument("--show", action="store_true", help="keep the real strip.show()")
+    ap.add_argument("--check", action="store_true", help="render 0-99 at every rotation and exit")
+    args = ap.parse_args()
+
+    if args.check:
+        raise SystemExit(0 if check_rotations(MatrixNumberDisplay()) else 1)
+
+    time.sleep = lambda s: None     # the animations wait between frames
+    new = MatrixNumberDisplay()
+    old = _same_strip(PerPixelDraw, new)
+    light = ScreenBacklightController(
+        led_count=config.LED_COUNT, led_pin=config.LED_PIN, led_channel=config.LED_CHANNEL,
+        brightness=config.LED_BRIGHTNESS,
+    )
+    if not args.show:
+        new.strip.show = lambda: None
+        light.strip.show = lambda: None
+
+    print(f"matrix {new.w}x{new.h}, backlight {light.fb.n} LEDs, {args.runs} runs, best of")
+    print(f"show(): {'real' if args.show else 'stubbed'}, bulk copy: "
+          f"{'memmove' if new.fb.bulk else 'setPixelColor per LED'}\n")
+
+    print(f"{'frame':<20} {'old us':>9} {'new us':>9} {'speedup':>8} {'new fps':>8}")
+    for name, fn in MATRIX_FRAMES.items():
+        _row(name, _best_us(old, fn, args.runs), _best_us(new, fn, args.runs))
+
+    runs = max(1, args.runs // 20)
+    (a, a_shows), (b, b_shows) = _goal_animation_us(old, runs), _goal_animation_us(new, runs)
+    _row("goal anim / frame", a / b_shows, b / b_shows)
+    print(f"{'goal anim shows':<20} {a_shows:>9} {b_shows:>9}")
+    render = _best_us(new, lambda d: d.render_goal_animation(88, FG, BG), runs)
+    print(f"{'goal anim render':<20} {'':>9} {render:>9.1f}   (once per number + colors, then cached)")
+    render = _best_us(light, lambda b: b.render_goal_animation_combo(TEAM, ACCENT), runs)
+    print(f"{'combo render':<20} {'':>9} {render:>9.1f}   (backlight goal combo, during the countdown)")
+
+    for name, (fn_old, fn_new) in BACKLIGHT_FRAMES.items():
+        _row(f"backlight {name}", _best_us(light, fn_old, args.runs), _best_us(light, fn_new, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# bench_pbp.py
+"""
+Play-by-play decode benchmark: json.loads + goal filter (old fetch_goals path)
+vs pbp_stream.parse_goal_plays (selective decoder).
+
+  python3 bench_pbp.py [pbp.json] [--runs 50]
+
+Defaults to the recorded game in WebApp/public/pbp.json. Peak RSS is measured
+in a fresh child process per method (Linux: the VmHWM high-water mark is reset
+right before the decode, so interpreter start-up doesn't hide the spike).
+"""
+import argparse
+import json
+import os
+import re
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import pbp_stream
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FIXTURE = os.path.join(HERE, "..", "..", "WebApp", "public", "pbp.json")
+
+
+def decode_full(text: str):
+    doc = json.loads(text)
+    goals = [ev for ev in doc.get("plays") or [] if ev.get("typeDescKey") == "goal"]
+    return doc.get("homeTeam"), doc.get("awayTeam"), goals
+
+
+def decode_stream(text: str):
+    out = pbp_stream.parse_goal_plays(text)
+    return out["homeTeam"], out["awayTeam"], [ev for _, ev in out["goal_plays"]]
+
+
+METHODS = {"json.loads": decode_full, "pbp_stream": decode_stream}
+
+
+def _status_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        return int(re.search(rf"{field}:\s+(\d+)", f.read()).group(1))
+
+
+def child(method: str, path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")            # reset VmHWM
+        before = _status_kb("VmRSS")
+        result = METHODS[method](text)
+        after = _status_kb("VmHWM")
+    except OSError:
+        # no procfs: process-lifetime peak, start-up included
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result = METHODS[method](text)
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"rss_kb": after - before, "goals": len(result[2])}))
+
+
+def bench(path: str, runs: int):
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    print(f"{os.path.basename(path)}: {len(text) / 1024:.0f} KB, {runs} runs\n")
+    print(f"{'method':<12} {'goals':>5} {'best ms':>8} {'mean ms':>8} {'py peak KB':>11} {'RSS +KB':>8}")
+
+    for name, fn in METHODS.items():
+        times = []
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            fn(text)
+            times.append((time.perf_counter() - t0) * 1000)
+
+        tracemalloc.start()
+        _, _, goals = fn(text)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", name, path],
+            capture_output=True, text=True, check=True,
+        )
+        rss = json.loads(proc.stdout)["rss_kb"]
+
+        print(f"{name:<12} {len(goals):>5} {min(times):>8.2f} {sum(times) / len(times):>8.2f} "
+              f"{peak / 1024:>11.0f} {rss:>8}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("path", nargs="?", default=DEFAULT_FIXTURE)
+    ap.add_argument("--runs", type=int, default=50)
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        child(args.child, args.path)
+    else:
+        bench(args.path, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# circuit_breaker.py
+"""
+Per-endpoint circuit breaker with exponential backoff + jitter.
+
+closed    -> requests go through; consecutive failures are counted
+open      -> after FAILURE_THRESHOLD failures: requests fail fast (no network)
+             for a backoff that doubles on every failed probe, with jitter so
+             several devices don't retry in lockstep
+half-open -> backoff elapsed: ONE probe request goes through; success closes
+             the breaker, failure re-opens it with a longer backoff
+"""
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+FAILURE_THRESHOLD = 3
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 300
+PROBE_TIMEOUT_SECONDS = 30       # a probe that never reports back frees the slot after this
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} circuit open, retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 base_seconds: float = BACKOFF_BASE_SECONDS, max_seconds: float = BACKOFF_MAX_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+        self._probe_started: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._failures < self.failure_threshold:
+                return "closed"
+            return "open" if time.monotonic() < self._open_until else "half-open"
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic())
+
+    def before_call(self):
+        """Raises CircuitOpenError instead of letting the request through."""
+        now = time.monotonic()
+        with self._lock:
+            if self._failures < self.failure_threshold:
+                return
+            if now < self._open_until:
+                raise CircuitOpenError(self.name, self._open_until - now)
+            # half-open: a single probe at a time
+            if self._probe_started is not None and (now - self._probe_started) < PROBE_TIMEOUT_SECONDS:
+                raise CircuitOpenError(self.name, 0)
+            self._probe_started = now
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0.0
+            self._probe_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_started = None
+            if self._failures >= self.failure_threshold:
+                backoff = min(self.max_seconds, self.base_seconds * 2 ** (self._failures - self.failure_threshold))
+                # "equal jitter": at least half the backoff, at most all of it
+                backoff = backoff / 2 + random.uniform(0, backoff / 2)
+                self._open_until = time.monotonic() + backoff
+
+
+# ---------------- registry ----------------
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    with _breakers_lock:
+        b = _breakers.get(name)
+        if b is None:
+            b = _breakers[name] = CircuitBreaker(name)
+        return b
+
+
+def get_states() -> Dict[str, str]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {b.name: b.state for b in breakers}
@@ -1,8 +1,9 @@
 # emoji_state.py
 from typing import Tuple, Optional
+from models import GameSnapshot
 from nhl_team_colors import get_team_colors
 
-def pick_emoji_and_colors(game: dict, my_team_abbr: str):
+def pick_emoji_and_colors(game: Optional[GameSnapshot], my_team_abbr: str):
     """
     Returns: (emoji_name, fg_rgb, bg_rgb)
       - winning: happy with my team colors
@@ -10,18 +11,12 @@ def pick_emoji_and_colors(game: dict, my_team_abbr: str):
       - losing: sad with opponent colors
     """
     my_team_abbr = my_team_abbr.upper()
+    game = game or GameSnapshot()
 
-    home = game.get("home") or {}
-    away = game.get("away") or {}
-
-    home_abbr = (home.get("abbr") or "").upper()
-    away_abbr = (away.get("abbr") or "").upper()
-
-    try:
-        home_score = int(home.get("score", 0))
-        away_score = int(away.get("score", 0))
-    except Exception:
-        home_score, away_score = 0, 0
+    home_abbr = (game.home.abbr or "").upper()
+    away_abbr = (game.away.abbr or "").upper()
+    home_score = game.home.score
+    away_score = game.away.score
 
     # find opponent
     if home_abbr == my_team_abbr:
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# event_server.py
+"""
+Game-state event feed: one box polls the NHL API (fetch_games_now + fetch_goals)
+and pushes normalized events to every display over Server-Sent Events, so the
+displays never hit the upstream API themselves.
+
+  python3 event_server.py        # http://0.0.0.0:8081/events?teams=MTL,TOR
+
+Events (data is JSON):
+  scoreboard    {"teams": {"MTL": <fetch_game_now payload>, ...}}  score / state / period changed
+  goals         {"gameId", "home", "away", "goals": [...]}        full goal list (on connect)
+  goal          {"gameId", "home", "away", "teams": [...], "goal": {...}}
+  goal_removed  {"gameId", "teams": [...], "goal": {...}}
+
+Every event has an id "<boot>-<seq>". A client reconnecting with Last-Event-ID
+(header, or ?lastEventId= for clients that can't set headers) is replayed what
+it missed from the backlog. If that is no longer in the backlog (or the server
+restarted) it gets a fresh scoreboard + goals snapshot instead.
+"""
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import config
+from goal_utils import PbpFetchGate
+from log_utils import log
+from models import GameSnapshot, Goal
+from nhl_client import fetch_games_now, fetch_goals
+from poll_scheduler import PollScheduler
+from schedule_cache import seconds_until_warmup
+
+BACKLOG_EVENTS = 500
+HEARTBEAT_SECONDS = 15
+NO_GAME_POLL_SECONDS = 300
+BOOT = str(int(time.time()))
+
+
+# ----------------- event hub -----------------
+class EventHub:
+    """Numbered backlog of events + a condition the client threads wait on."""
+
+    def __init__(self, backlog: int = BACKLOG_EVENTS):
+        self._events: deque = deque(maxlen=backlog)      # (seq, name, data_json, teams)
+        self._seq = 0
+        self._cond = threading.Condition()
+        self.scoreboard: Dict[str, Dict[str, Any]] = {}
+        self.goals: Dict[str, Dict[str, Any]] = {}       # game id -> goals payload
+
+    def publish(self, name: str, data: Dict[str, Any], teams: Optional[List[str]] = None):
+        with self._cond:
+            self._seq += 1
+            self._events.append((self._seq, name, json.dumps(data, separators=(",", ":")), teams))
+            self._cond.notify_all()
+
+    def current_seq(self) -> int:
+        with self._cond:
+            return self._seq
+
+    def resume_from(self, last_event_id: Optional[str]) -> Optional[int]:
+        """Seq to replay after, or None when the client needs a snapshot."""
+        if not last_event_id:
+            return None
+        boot, _, seq = last_event_id.partition("-")
+        if boot != BOOT or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self._cond:
+            oldest = self._events[0][0] if self._events else self._seq + 1
+            if seq > self._seq or seq < oldest - 1:
+                return None
+        return seq
+
+    def wait_after(self, seq: int, timeout: float) -> List[Tuple[int, str, str, Optional[List[str]]]]:
+        with self._cond:
+            if self._seq <= seq:
+                self._cond.wait(timeout)
+            return [e for e in self._events if e[0] > seq]
+
+
+hub = EventHub()
+
+
+def event_id(seq: int) -> str:
+    return f"{BOOT}-{seq}"
+
+
+# ----------------- poller -----------------
+class GamePoller:
+    """Same polling rules as the standalone main loop, publishing instead of animating."""
+
+    def __init__(self, teams: List[str]):
+        self.teams = teams
+        self.gates: Dict[str, PbpFetchGate] = {}
+        self.schedulers: Dict[str, PollScheduler] = {}
+        self.seen: Dict[str, Dict[Any, Goal]] = {}              # game id -> eventId -> goal
+        self._last_board = None
+
+    def _board_key(self, payloads):
+        # what makes a scoreboard event worth sending (the clock alone is not)
+        key = []
+        for team in self.teams:
+            p = payloads[team]
+            key.append((
+                p.ok, p.no_game, p.id, p.state, p.period, p.period_type,
+                p.home.score, p.away.score,
+                p.clock.get("running"), p.clock.get("inIntermission"),
+            ))
+        return key
+
+    def poll_once(self) -> float:
+        waits = [seconds_until_warmup(t) for t in self.teams]
+        if waits and all(w for w in waits):
+            return min(waits)
+
+        payloads = fetch_games_now(self.teams)
+        if not any(p.ok for p in payloads.values()):
+            log("Event server: backend returned ok=false")
+            return config.POLL_INTERVAL_SECONDS
+
+        key = self._board_key(payloads)
+        hub.scoreboard = {t: p.as_dict() for t, p in payloads.items()}
+        if key != self._last_board:
+            self._last_board = key
+            hub.publish("scoreboard", {"teams": hub.scoreboard})
+
+        games: Dict[str, Tuple[GameSnapshot, List[str]]] = {}
+        for team in self.teams:
+            data = payloads[team]
+            if data.has_game:
+                games.setdefault(str(data.id), (data, []))[1].append(team)
+
+        for gid in [g for g in self.seen if g not in games]:
+            self.seen.pop(gid, None)
+            self.gates.pop(gid, None)
+            self.schedulers.pop(gid, None)
+            hub.goals.pop(gid, None)
+
+        if not games:
+            return NO_GAME_POLL_SECONDS
+
+        return min(self.check_game(gid, data, teams) for gid, (data, teams) in games.items())
+
+    def check_game(self, gid: str, data: GameSnapshot, teams: List[str]) -> float:
+        gate = self.gates.setdefault(gid, PbpFetchGate(
+            reconcile_seconds=config.PBP_RECONCILE_SECONDS,
+            catchup_seconds=config.PBP_CATCHUP_SECONDS,
+        ))
+        scheduler = self.schedulers.setdefault(gid, PollScheduler())
+        home_score = data.home.score
+        away_score = data.away.score
+        interval = scheduler.next_interval(data)
+
+        if data.state not in ("LIVE", "CRIT", "PRE", "OFF") or \
+                not gate.should_fetch(gid, home_score, away_score):
+            return interval
+
+        payload = fetch_goals(gid)
+        if not payload.get("ok"):
+            return interval
+        goals = payload.get("goals") or []
+        gate.mark_fetched(gid, home_score, away_score, len(goals))
+
+        hub.goals[gid] = {
+            "gameId": payload.get("gameId"), "home": payload.get("home"), "away": payload.get("away"),
+            "goals": [g.as_dict() for g in goals],
+        }
+
+        first_look = gid not in self.seen
+        seen = self.seen.setdefault(gid, {})
+        for g in payload.get("removedGoals") or []:
+            if seen.pop(g.event_id, None) is not None:
+                hub.publish("goal_removed", {"gameId": gid, "teams": teams, "goal": g.as_dict()}, teams)
+        for g in goals:
+            if g.event_id in seen:
+                continue
+            seen[g.event_id] = g
+            # goals already in the game when we start are only in the snapshot
+            if not first_look:
+                hub.publish("goal", {
+                    "gameId": gid, "home": payload.get("home"), "away": payload.get("away"),
+                    "teams": teams, "goal": g.as_dict(),
+                }, teams)
+                log(f"Event server: goal {gid} {g.scorer.full_name if g.scorer else None}")
+        return interval
+
+    def run(self):
+        while True:
+            try:
+                wait = self.poll_once()
+            except Exception as e:
+                log(f"Event server poll error: {e}")
+                wait = config.POLL_INTERVAL_SECONDS
+            time.sleep(wait)
+
+
+# ----------------- SSE handler -----------------
+class EventHandler(BaseHTTPRequestHandler):
+    server_version = "nhl-events/1.0"
+
+    def _write_event(self, seq: int, name: str, data_json: str):
+        self.wfile.write(f"id: {event_id(seq)}\nevent: {name}\ndata: {data_json}\n\n".encode("utf-8"))
+
+    def _snapshot(self, teams: Optional[set]) -> int:
+        seq = hub.current_seq()
+        board = hub.scoreboard
+        if teams:
+            board = {t: p for t, p in board.items() if t in teams}
+        if hub.scoreboard:      # nothing polled yet: the first scoreboard event follows
+            self._write_event(seq, "scoreboard", json.dumps({"teams": board}))
+        for gid, goals in list(hub.goals.items()):
+            game_teams = {(goals.get("home") or {}).get("abbr"), (goals.get("away") or {}).get("abbr")}
+            if not teams or teams & game_teams:
+                self._write_event(seq, "goals", json.dumps(goals))
+        return seq
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/events":
+            self.send_error(404)
+            return
+        query = parse_qs(url.query)
+        teams = {t.strip().upper() for t in ",".join(query.get("teams", [])).split(",") if t.strip()}
+        last_id = self.headers.get("Last-Event-ID") or (query.get("lastEventId") or [None])[0]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+
+        try:
+            self.wfile.write(b"retry: 2000\n\n")
+            seq = hub.resume_from(last_id)
+            if seq is None:
+                seq = self._snapshot(teams)
+            self.wfile.flush()
+
+            while True:
+                events = hub.wait_after(seq, HEARTBEAT_SECONDS)
+                if not events:
+                    self.wfile.write(b": ping\n\n")
+                for ev_seq, name, data_json, ev_teams in events:
+                    seq = ev_seq
+                    if teams and ev_teams and not (teams & set(ev_teams)):
+                        continue
+                    self._write_event(ev_seq, name, data_json)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def main():
+    teams = [str(t).upper().strip() for t in config.TEAM_ABBRS]
+    poller = GamePoller(teams)
+    threading.Thread(target=poller.run, name="poller", daemon=True).start()
+
+    server = ThreadingHTTPServer((config.EVENTS_HOST, config.EVENTS_PORT), EventHandler)
+    server.daemon_threads = True
+    log(f"Event server on http://{config.EVENTS_HOST}:{config.EVENTS_PORT}/events for {teams}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log("Event server stopped.")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# framebuffer.py
+"""
+Frame buffer for the LED strips.
+
+Effects draw a whole frame into `buf`, a flat array of packed colors (the
+rpi_ws281x Color ints, one per LED index), then push() copies it into the
+strip and calls show() ONCE. Nothing reaches the LEDs between two pushes, so
+a frame can be cleared and redrawn as often as it likes.
+
+  fb = FrameBuffer(strip)      after strip.begin()
+  fb.fill(c)                   whole frame one color
+  fb.buf[i] = c                one LED
+  fb.load(frame)               copy a prepared frame (array of len(fb))
+  fb.push()                    -> LEDs
+  fb.play(anim)                pre-rendered Animation, one push per step
+
+The copy into the strip is one memmove into the rpi_ws281x C buffer
+(channel->leds, uint32 per LED, what setPixelColor writes to) when that
+buffer can be reached; otherwise setPixelColor per LED, still one show().
+"""
+import ctypes
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+try:
+    import _rpi_ws281x as ws
+except ImportError:
+    ws = None
+
+# 32-bit packed colors, same layout as channel->leds
+TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+
+def _led_buffer(strip, n: int):
+    """ctypes view of the strip's C-side LED buffer, None when not reachable."""
+    if ws is None:
+        return None
+    try:
+        chan = strip._channel
+        if ws.ws2811_channel_t_count_get(chan) != n:
+            return None
+        addr = int(ws.ws2811_channel_t_leds_get(chan))
+        if not addr:
+            return None
+        leds = (ctypes.c_uint32 * n).from_address(addr)
+
+        # make sure it really is the buffer setPixelColor writes to
+        before = ws.ws2811_led_get(chan, n - 1)
+        ws.ws2811_led_set(chan, n - 1, 0x00A5C3E1)
+        ok = leds[n - 1] == 0x00A5C3E1
+        ws.ws2811_led_set(chan, n - 1, before)
+        return leds if ok else None
+    except Exception:
+        return None
+
+
+class Animation:
+    """
+    Frame sequence rendered ahead of time, steps of (frame, hold seconds).
+    frame is a packed array for the whole strip (what FrameBuffer.load()
+    takes), or (LED indices, color) painted over what is shown (wipes).
+    """
+    __slots__ = ("steps", "nbytes")
+
+    def __init__(self, steps):
+        self.steps = steps
+        seen = {}
+        for frame, _ in steps:
+            seen[id(frame)] = frame
+        self.nbytes = sum(
+            len(f[0]) * 8 if isinstance(f, tuple) else len(f) * f.itemsize
+            for f in seen.values()
+        )
+
+    def __len__(self):
+        return len(self.steps)
+
+    @property
+    def duration(self) -> float:
+        return sum(hold for _, hold in self.steps)
+
+
+class AnimationCache:
+    """
+    Rendered animations by key, least recently used dropped past max_bytes.
+    get() renders under the lock: a second caller asking for the same key
+    while it renders (goal countdown pre-render vs playback) waits for that
+    render instead of doing it again.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._anims = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._anims)
+
+    def get(self, key, render) -> Animation:
+        with self._lock:
+            anim = self._anims.get(key)
+            if anim is not None:
+                self._anims.move_to_end(key)
+                return anim
+            anim = render()
+            self._anims[key] = anim
+            self.nbytes += anim.nbytes
+            while self.nbytes > self.max_bytes and len(self._anims) > 1:
+                _, old = self._anims.popitem(last=False)
+                self.nbytes -= old.nbytes
+            return anim
+
+
+class FrameBuffer:
+    __slots__ = ("strip", "n", "buf", "_leds", "_nbytes")
+
+    def __init__(self, strip):
+        self.strip = strip
+        self.n = strip.numPixels()
+        self.buf = array(TYPECODE, [0]) * self.n
+        self._leds = _led_buffer(strip, self.n) if self.n else None
+        self._nbytes = self.n * self.buf.itemsize
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def bulk(self) -> bool:
+        """True when push() is a single memmove."""
+        return self._leds is not None
+
+    def fill(self, color_int: int):
+        self.buf[:] = array(TYPECODE, [color_int]) * self.n
+
+    def load(self, frame):
+        self.buf[:] = frame
+
+    def push(self):
+        if self._leds is not None:
+            ctypes.memmove(self._leds, self.buf.buffer_info()[0], self._nbytes)
+        else:
+            set_px = self.strip.setPixelColor
+            for i, c in enumerate(self.buf):
+                set_px(i, c)
+        self.strip.show()
+
+    def play(self, anim: Animation):
+        """
+        Push each step, then wait out its hold. Holds are scheduled on the
+        monotonic clock from the first push, so time spent in push()/show()
+        doesn't pile up over a few hundred frames.
+        """
+        buf = self.buf
+        due = time.monotonic()
+        for frame, hold in anim.steps:
+            if isinstance(frame, tuple):
+                idx, c = frame
+                for i in idx:
+                    buf[i] = c
+            else:
+                buf[:] = frame
+            self.push()
+            due += hold
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
@@ -2,6 +2,9 @@
 from rpi_ws281x import PixelStrip, Color
 import time
 import random
+from array import array
+
+from framebuffer import Animation, AnimationCache, FrameBuffer, TYPECODE
 
 
 # ------------ DIGITS (6x10) ------------
@@ -113,6 +116,35 @@ def _validate_bitmap(bitmap_rows, expected_w=None, expected_h=None, name="bitmap
     return w, h
 
 
+# ------------ COMPILED GLYPHS ------------
+# The string art above is the source; drawing uses these, compiled once.
+class Glyph:
+    """'0'/'1' rows compiled once: size + the lit (x, y) cells."""
+    __slots__ = ("w", "h", "rows", "cells")
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.h = len(rows)
+        self.w = len(rows[0]) if rows else 0
+        self.cells = tuple((x, y) for y, row in enumerate(rows) for x, ch in enumerate(row) if ch == "1")
+
+
+def _compile_glyphs(bitmaps):
+    return {k: Glyph(rows) for k, rows in bitmaps.items()}
+
+
+DIGIT_GLYPHS = _compile_glyphs(DIGITS_6x9)
+EMOJI_GLYPHS = _compile_glyphs(EMOJIS_14x12)
+
+BLIT_CACHE_MAX = 256     # (glyph, x, y) -> LED indices, per display
+
+
+# ------------ PRE-RENDERED ANIMATIONS ------------
+ANIM_CACHE_MAX_BYTES = 256 * 1024    # rendered goal animations kept, per display
+
+ROTATIONS = (0, 90, 180, 270)        # clockwise; 90/270 need room for two digits
+
+
 class MatrixNumberDisplay:
     """
     14x12 matrix number + emoji display for a DIY serpentine-wired strip grid.
@@ -131,6 +163,17 @@ class MatrixNumberDisplay:
         - if serpentine_axis="cols": "up" or "down" (direction of the first run from the start corner)
 
     Defaults are the most common for bottom-right start: rows + first run goes LEFT.
+
+    rotation (0/90/180/270, clockwise) turns the picture on top of the wiring;
+    90/270 swap width and height, only allowed when a two-digit number still
+    fits the turned canvas (not on the 14x12: 13 wide vs 12).
+
+    The wiring math runs ONCE: the constructor compiles it into a flat table
+    (self._lut[y * w + x] -> LED index) and every draw path indexes that.
+
+    Drawing goes into self.fb (framebuffer.py), show() pushes it: one bulk
+    copy + one strip.show() per frame. Glyphs are drawn from their lit LED
+    indices at that position (computed on first use, then cached).
     """
 
     def __init__(
@@ -148,9 +191,11 @@ class MatrixNumberDisplay:
         serpentine_axis="rows",        # rows or cols
         first_dir="left",              # rows: left/right, cols: up/down
         digits_map=DIGITS_6x9,
+        rotation=0,                    # 0/90/180/270 clockwise
     ):
-        self.w = int(matrix_width)
-        self.h = int(matrix_height)
+        # panel = physical grid, w/h = drawing canvas (swapped at 90/270)
+        self.panel_w = int(matrix_width)
+        self.panel_h = int(matrix_height)
 
         self.serpentine = bool(serpentine)
         self.start_corner = start_corner
@@ -163,12 +208,15 @@ class MatrixNumberDisplay:
         self.digit_w, self.digit_h = _digit_size(self.digits)
         for k, bmp in self.digits.items():
             _validate_bitmap(bmp, expected_w=self.digit_w, expected_h=self.digit_h, name=f"digit '{k}'")
+        self.digit_glyphs = DIGIT_GLYPHS if digits_map is DIGITS_6x9 else _compile_glyphs(digits_map)
 
         # Validate emojis once (expected 14x12)
         for k, bmp in EMOJIS_14x12.items():
             _validate_bitmap(bmp, expected_w=14, expected_h=12, name=f"emoji '{k}'")
 
-        self.led_count = self.w * self.h
+        self._set_rotation(rotation)
+
+        self.led_count = self.panel_w * self.panel_h
         self.strip = PixelStrip(
             self.led_count,
             led_pin,
@@ -179,6 +227,7 @@ class MatrixNumberDisplay:
             led_channel,
         )
         self.strip.begin()
+        self.fb = FrameBuffer(self.strip)
 
     # ---------------- Mapping ----------------
 
@@ -188,27 +237,38 @@ class MatrixNumberDisplay:
           x: 0..w-1 left->right
           y: 0..h-1 top->bottom
 
+        rotation: applied first, canvas -> panel coordinates
         start_corner: where LED index 0 physically is
         serpentine_axis: "rows" or "cols"
         first_dir: direction of the first run from the start corner
+
+        Reference mapping: only _build_lut() calls it, drawing goes through the table.
         """
-        # y = self.h - 1 - y
-        x = self.w - 1 - x
+        pw, ph = self.panel_w, self.panel_h
+        if self.rotation == 90:
+            x, y = pw - 1 - y, x
+        elif self.rotation == 180:
+            x, y = pw - 1 - x, ph - 1 - y
+        elif self.rotation == 270:
+            x, y = y, ph - 1 - x
+
+        # y = ph - 1 - y
+        x = pw - 1 - x
         # Remap so that the "origin-space" (ox,oy) has (0,0) at start_corner
         if self.start_corner == "top_left":
             ox, oy = x, y
         elif self.start_corner == "top_right":
-            ox, oy = (self.w - 1 - x), y
+            ox, oy = (pw - 1 - x), y
         elif self.start_corner == "bottom_left":
-            ox, oy = x, (self.h - 1 - y)
+            ox, oy = x, (ph - 1 - y)
         elif self.start_corner == "bottom_right":
-            ox, oy = (self.w - 1 - x), (self.h - 1 - y)
+            ox, oy = (pw - 1 - x), (ph - 1 - y)
         else:
             raise ValueError("start_corner must be top_left/top_right/bottom_left/bottom_right")
 
         if not self.serpentine:
             # simple raster in origin-space (row-major)
-            return oy * self.w + ox
+            return oy * pw + ox
 
         if self.serpentine_axis == "rows":
             row = oy
@@ -218,8 +278,8 @@ class MatrixNumberDisplay:
             if (row % 2) == 1:
                 forward = not forward
 
-            col = ox if forward else (self.w - 1 - ox)
-            return row * self.w + col
+            col = ox if forward else (pw - 1 - ox)
+            return row * pw + col
 
         if self.serpentine_axis == "cols":
             col = ox
@@ -229,31 +289,74 @@ class MatrixNumberDisplay:
             if (col % 2) == 1:
                 forward = not forward
 
-            row = oy if forward else (self.h - 1 - oy)
-            return col * self.h + row
+            row = oy if forward else (ph - 1 - oy)
+            return col * ph + row
 
         raise ValueError("serpentine_axis must be 'rows' or 'cols'")
 
+    def _set_rotation(self, rotation):
+        """Canvas for this rotation + its index table (drops the cached blits/animations)."""
+        if rotation not in ROTATIONS:
+            raise ValueError("rotation must be 0/90/180/270")
+        w, h = (self.panel_h, self.panel_w) if rotation in (90, 270) else (self.panel_w, self.panel_h)
+        need_w = self.digit_w * 2 + 1
+        if need_w > w or self.digit_h > h:
+            raise ValueError(
+                f"rotation {rotation}: a two-digit number ({need_w}x{self.digit_h}) won't fit the "
+                f"turned {w}x{h} canvas of this {self.panel_w}x{self.panel_h} matrix. "
+                f"Set MATRIX_ROTATION to 0 or 180."
+            )
+        self.rotation = rotation
+        self.w, self.h = w, h
+        self._lut = self._build_lut()
+        self._blits = {}
+        self._anims = AnimationCache(ANIM_CACHE_MAX_BYTES)
+
+    def _build_lut(self):
+        """Flat canvas -> LED index table: lut[y * w + x]."""
+        lut = [self._xy_to_index(x, y) for y in range(self.h) for x in range(self.w)]
+        if sorted(lut) != list(range(self.panel_w * self.panel_h)):
+            raise ValueError("matrix mapping is not one LED per pixel, check the wiring knobs")
+        return lut
+
     # ---------------- Pixels ----------------
 
     def _set_pixel(self, x, y, color_int):
         if 0 <= x < self.w and 0 <= y < self.h:
-            self.strip.setPixelColor(self._xy_to_index(x, y), color_int)
+            self.fb.buf[self._lut[y * self.w + x]] = color_int
+
+    def show(self):
+        """Frame buffer -> LEDs."""
+        self.fb.push()
 
     def fill(self, color):
-        c = _to_color(color)
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, c)
-        self.strip.show()
+        self.fb.fill(_to_color(color))
+        self.show()
 
     def clear(self):
         self.fill((0, 0, 0))
 
-    def _draw_bitmap(self, bitmap_rows, x0, y0, fg_color_int):
-        for y, row in enumerate(bitmap_rows):
-            for x, ch in enumerate(row):
-                if ch == "1":
-                    self._set_pixel(x0 + x, y0 + y, fg_color_int)
+    def _glyph_indices(self, glyph, x0, y0):
+        """LED indices of the lit cells of glyph drawn at (x0, y0), clipped."""
+        key = (glyph, x0, y0)
+        idx = self._blits.get(key)
+        if idx is None:
+            if len(self._blits) >= BLIT_CACHE_MAX:
+                self._blits.clear()
+            lut, w, h = self._lut, self.w, self.h
+            idx = self._blits[key] = [
+                lut[(y0 + y) * w + x0 + x]
+                for x, y in glyph.cells
+                if 0 <= x0 + x < w and 0 <= y0 + y < h
+            ]
+        return idx
+
+    def _draw_bitmap(self, glyph, x0, y0, fg_color_int, px=None):
+        """Into the frame buffer, or into px (a packed frame)."""
+        if px is None:
+            px = self.fb.buf
+        for i in self._glyph_indices(glyph, x0, y0):
+            px[i] = fg_color_int
 
     # ---------------- Numbers ----------------
 
@@ -284,42 +387,43 @@ class MatrixNumberDisplay:
         x0 = (self.w - total_w) // 2
         y0 = (self.h - total_h) // 2
 
-        self.fill(bg_c)
+        self._fill_no_show(bg_c)
 
         if len(s) == 1:
-            self._draw_bitmap(self.digits[s], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[s], x0, y0, fg_c)
         else:
             d1, d2 = s[0], s[1]
-            self._draw_bitmap(self.digits[d1], x0, y0, fg_c)
-            self._draw_bitmap(self.digits[d2], x0 + self.digit_w + gap, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d1], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d2], x0 + self.digit_w + gap, y0, fg_c)
 
-        self.strip.show()
+        self.show()
 
     def _fill_no_show(self, color_int):
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, color_int)
+        self.fb.fill(color_int)
 
     def _set_pixel_no_bounds(self, x, y, color_int):
-        self.strip.setPixelColor(self._xy_to_index(x, y), color_int)
+        self.fb.buf[self._lut[y * self.w + x]] = color_int
 
     def _wipe_bg(self, bg_color, direction="lr", step_delay=0.01):
         bg_c = _to_color(bg_color)
+        lut, w, h = self._lut, self.w, self.h
+        px = self.fb.buf
 
         if direction == "lr":
-            for x in range(self.w):
-                for y in range(self.h):
-                    self._set_pixel(x, y, bg_c)
-                self.strip.show()
+            for x in range(w):
+                for i in range(x, w * h, w):
+                    px[lut[i]] = bg_c
+                self.show()
                 time.sleep(step_delay)
 
         elif direction == "tb":
-            for y in range(self.h):
-                for x in range(self.w):
-                    self._set_pixel(x, y, bg_c)
-                self.strip.show()
+            for y in range(h):
+                for i in range(y * w, (y + 1) * w):
+                    px[lut[i]] = bg_c
+                self.show()
                 time.sleep(step_delay)
 
-    def _draw_number_at(self, n: int, x0: int, y0: int, fg_color, gap=1):
+    def _draw_number_at(self, n: int, x0: int, y0: int, fg_color, gap=1, px=None):
         s = str(n)
         if not s.isdigit() or len(s) > 2:
             return
@@ -333,21 +437,22 @@ class MatrixNumberDisplay:
             return
 
         if len(s) == 1:
-            self._draw_bitmap(self.digits[s], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[s], x0, y0, fg_c, px)
         else:
             d1, d2 = s[0], s[1]
-            self._draw_bitmap(self.digits[d1], x0, y0, fg_c)
-            self._draw_bitmap(self.digits[d2], x0 + self.digit_w + gap, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d1], x0, y0, fg_c, px)
+            self._draw_bitmap(self.digit_glyphs[d2], x0 + self.digit_w + gap, y0, fg_c, px)
 
-    def goal_number_animation(self, n: int, fg, bg, gap=1):
+    def render_goal_animation(self, n: int, fg, bg, gap=1) -> "Animation":
         """
-        Extended GOAL animation (longer & more hype):
+        Extended GOAL animation (longer & more hype), rendered ahead of time:
         1) Slow background wipe
         2) Big pop + bounce
         3) Extended sparkle/confetti
         4) Pulse hold
         5) Invert flashes
         6) Final steady display
+        Nothing is shown, play() does that. fg/bg are (r,g,b).
         """
         s = str(n)
         if not s.isdigit() or len(s) > 2:
@@ -370,13 +475,24 @@ class MatrixNumberDisplay:
                 max(0, min(255, int(rgb[2] * factor))),
             )
 
-        # 1) SLOW BACKGROUND WIPE
         bg_int = _to_color(bg)
-        for x in range(self.w):
-            for y in range(self.h):
-                self._set_pixel(x, y, bg_int)
-            self.strip.show()
-            time.sleep(0.02)
+        fg_int = _to_color(fg)
+        frames = {}     # identical frames are stored once
+
+        def number_frame(dx, dy, color, back=bg_int):
+            key = (dx, dy, color, back)
+            px = frames.get(key)
+            if px is None:
+                px = frames[key] = array(TYPECODE, [back]) * self.led_count
+                self._draw_number_at(n, cx + dx, cy + dy, color, gap, px=px)
+            return px
+
+        steps = []
+
+        # 1) SLOW BACKGROUND WIPE (column by column over what is shown)
+        lut, w, h = self._lut, self.w, self.h
+        for x in range(w):
+            steps.append(((tuple(lut[i] for i in range(x, w * h, w)), bg_int), 0.02))
 
         # 2) POP / BOUNCE (tuned for 12px height)
         bounce_frames = [
@@ -394,44 +510,45 @@ class MatrixNumberDisplay:
         ]
 
         for dx, dy, bright in bounce_frames:
-            self.fill(bg)
-            self._draw_number_at(n, cx + dx, cy + dy, dim(fg, bright), gap)
-            self.strip.show()
-            time.sleep(0.08)
+            steps.append((number_frame(dx, dy, _to_color(dim(fg, bright))), 0.08))
 
         # 3) SPARKLES / CONFETTI
-        fg_int = _to_color(fg)
         alt_int = _to_color(dim(fg, 0.35))
 
         for _ in range(24):
-            self.fill(bg)
-            self._draw_number_at(n, cx, cy, fg, gap)
+            px = array(TYPECODE, number_frame(0, 0, fg_int))
 
             for __ in range(30):
                 x = random.randint(0, self.w - 1)
                 y = random.randint(0, self.h - 1)
-                self._set_pixel(x, y, fg_int if random.random() > 0.4 else alt_int)
+                px[lut[y * w + x]] = fg_int if random.random() > 0.4 else alt_int
 
-            self.strip.show()
-            time.sleep(0.07)
+            steps.append((px, 0.07))
 
         # 4) PULSE HOLD
         for pulse in [0.85, 1.0, 0.9, 1.0, 0.95, 1.0]:
-            self.fill(bg)
-            self._draw_number_at(n, cx, cy, dim(fg, pulse), gap)
-            self.strip.show()
-            time.sleep(0.18)
+            steps.append((number_frame(0, 0, _to_color(dim(fg, pulse))), 0.18))
 
         # 5) INVERT FLASHES
         for _ in range(3):
-            self.show_number(n, fg=bg, bg=fg, gap=gap)
-            time.sleep(0.15)
-            self.show_number(n, fg=fg, bg=bg, gap=gap)
-            time.sleep(0.15)
+            steps.append((number_frame(0, 0, bg_int, back=fg_int), 0.15))
+            steps.append((number_frame(0, 0, fg_int), 0.15))
 
         # 6) FINAL HOLD
-        self.show_number(n, fg=fg, bg=bg, gap=gap)
-        time.sleep(1.2)
+        steps.append((number_frame(0, 0, fg_int), 1.2))
+        return Animation(steps)
+
+    def goal_animation(self, n: int, fg, bg, gap=1) -> "Animation":
+        """render_goal_animation(), cached (LRU, ANIM_CACHE_MAX_BYTES per display)."""
+        key = (n, _to_color(fg), _to_color(bg), gap)
+        return self._anims.get(key, lambda: self.render_goal_animation(n, fg, bg, gap))
+
+    def play(self, anim: "Animation"):
+        """Show a pre-rendered animation: one frame copy + push per step."""
+        self.fb.play(anim)
+
+    def goal_number_animation(self, n: int, fg, bg, gap=1):
+        self.play(self.goal_animation(n, fg, bg, gap))
 
     # ---------------- Emojis ----------------
 
@@ -439,19 +556,12 @@ class MatrixNumberDisplay:
         """
         Draw 14x12 emoji covering the whole matrix (no centering needed).
         """
-        if name not in EMOJIS_14x12:
+        if name not in EMOJI_GLYPHS:
             raise ValueError(f"Unknown emoji: {name}")
 
-        bitmap = EMOJIS_14x12[name]
-        self.fill(bg)
-
-        fg_int = _to_color(fg)
-        for y, row in enumerate(bitmap):
-            for x, ch in enumerate(row):
-                if ch == "1":
-                    self._set_pixel(x, y, fg_int)
-
-        self.strip.show()
+        self._fill_no_show(_to_color(bg))
+        self._draw_bitmap(EMOJI_GLYPHS[name], 0, 0, _to_color(fg))
+        self.show()
 
     def emoji_animation(self, name: str, fg, bg, pulses: int = 4):
         """
@@ -480,12 +590,12 @@ class MatrixNumberDisplay:
         Lights 4 corners with distinct colors to verify orientation:
           TL = Red, TR = Green, BL = Blue, BR = White
         """
-        self.clear()
+        self._fill_no_show(0)
         self._set_pixel(0, 0, _to_color((255, 0, 0)))
         self._set_pixel(self.w - 1, 0, _to_color((0, 255, 0)))
         self._set_pixel(0, self.h - 1, _to_color((0, 0, 255)))
         self._set_pixel(self.w - 1, self.h - 1, _to_color((255, 255, 255)))
-        self.strip.show()
+        self.show()
 
     def scan(self, delay=0.05):
         """
@@ -494,9 +604,9 @@ class MatrixNumberDisplay:
         """
         for y in range(self.h):
             for x in range(self.w):
-                self.clear()
+                self._fill_no_show(0)
                 self._set_pixel(x, y, _to_color((255, 255, 255)))
-                self.strip.show()
+                self.show()
                 time.sleep(delay)
 
     def index_chase(self, delay=0.03):
@@ -504,9 +614,9 @@ class MatrixNumberDisplay:
         Lights LEDs by raw index (0..N-1). Useful to see physical wiring path.
         """
         for i in range(self.led_count):
-            self.clear()
-            self.strip.setPixelColor(i, _to_color((255, 255, 255)))
-            self.strip.show()
+            self._fill_no_show(0)
+            self.fb.buf[i] = _to_color((255, 255, 255))
+            self.show()
             time.sleep(delay)
 
 
@@ -0,0 +1,299 @@
+# models.py
+"""
+Compact models for what the client passes around every poll: GameSnapshot
+(one team's fetch_game_now() payload), Goal and Player.
+
+Payloads are normalized ONCE, when they are decoded (scores and jersey
+numbers become ints, a missing team becomes an empty TeamScore), into
+__slots__ objects, so the display side reads attributes instead of redoing
+.get() chains and int() conversions on every poll.
+
+The old dict shape stays available:
+  as_dict()          plain dicts, what goes out as JSON (event_server.py)
+  m["home"], m.get("scorer"), "id" in m
+                     read-only mapping view, for code that still expects
+                     the dicts: each key reads its own slot (_FIELDS), the
+                     whole as_dict() is never built for one lookup
+  Model.from_dict(d) back from that shape (events received over SSE)
+"""
+from abc import ABC, abstractmethod
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def to_int(v: Any, default: Optional[int] = None) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return default
+
+
+class DictView(ABC):
+    """
+    Read-only dict compatibility view. _FIELDS maps each as_dict() key to a
+    getter giving the same value; _keys() is the keys this instance has.
+    """
+    __slots__ = ()
+    _FIELDS: Dict[str, Callable[[Any], Any]] = {}
+
+    @abstractmethod
+    def as_dict(self) -> Dict[str, Any]:
+        ...
+
+    def _keys(self) -> Tuple[str, ...]:
+        return tuple(self._FIELDS)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys():
+            raise KeyError(key)
+        return self._FIELDS[key](self)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._FIELDS[key](self) if key in self._keys() else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys()
+
+    def keys(self):
+        return self._keys()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+# ----------------- player -----------------
+class Player(DictView):
+    __slots__ = ("id", "full_name", "position", "number", "shoots", "headshot", "team")
+    _FIELDS = {
+        "id": attrgetter("id"),
+        "fullName": attrgetter("full_name"),
+        "position": attrgetter("position"),
+        "number": attrgetter("number"),
+        "shoots": attrgetter("shoots"),
+        "headshot": attrgetter("headshot"),
+        "team": attrgetter("team"),
+    }
+
+    def __init__(self, id=None, full_name: str = "", position: Optional[str] = None, number=None,
+                 shoots: Optional[str] = None, headshot: str = "", team: Optional[str] = None):
+        self.id = to_int(id)
+        self.full_name = full_name or ""
+        self.position = position
+        self.number = to_int(number)        # jersey, None when unknown
+        self.shoots = shoots
+        self.headshot = headshot or ""
+        self.team = team
+
+    @property
+    def last_name(self) -> str:
+        return self.full_name.split(" ")[-1]
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]], team: Optional[str] = None) -> "Player":
+        """Roster / pack / landing-page dict -> Player. team overrides the dict's team."""
+        d = d or {}
+        return cls(
+            d.get("id"), d.get("fullName"), d.get("position"), d.get("number"),
+            d.get("shoots"), d.get("headshot"), team if team is not None else d.get("team"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "fullName": self.full_name,
+            "position": self.position,
+            "number": self.number,
+            "shoots": self.shoots,
+            "headshot": self.headshot,
+            "team": self.team,
+        }
+
+
+NO_PLAYER = Player()    # scorer not known yet
+
+
+# ----------------- goal -----------------
+class Goal(DictView):
+    __slots__ = ("event_id", "period", "time_in_period", "scorer", "assists", "shot_type", "strength",
+                 "home_score", "away_score", "highlight_url", "highlight_id")
+    _FIELDS = {
+        "eventId": attrgetter("event_id"),
+        "period": attrgetter("period"),
+        "timeInPeriod": attrgetter("time_in_period"),
+        "scorer": lambda g: g.scorer.as_dict() if g.scorer else None,
+        "assists": lambda g: [a.as_dict() for a in g.assists],
+        "shotType": attrgetter("shot_type"),
+        "strength": attrgetter("strength"),
+        "homeScore": attrgetter("home_score"),
+        "awayScore": attrgetter("away_score"),
+        "highlight": lambda g: {"url": g.highlight_url, "id": g.highlight_id},
+    }
+
+    def __init__(self, event_id=None, period=None, time_in_period: Optional[str] = None,
+                 scorer: Optional[Player] = None, assists: Optional[List[Player]] = None,
+                 shot_type: Optional[str] = None, strength: Optional[str] = None,
+                 home_score=None, away_score=None, highlight_url: Optional[str] = None, highlight_id=None):
+        self.event_id = event_id
+        self.period = to_int(period)
+        self.time_in_period = time_in_period
+        self.scorer = scorer
+        self.assists = assists or []
+        self.shot_type = shot_type
+        self.strength = strength
+        self.home_score = to_int(home_score)    # score after this goal
+        self.away_score = to_int(away_score)
+        self.highlight_url = highlight_url
+        self.highlight_id = highlight_id
+
+    def score_for(self, side: str) -> Optional[int]:
+        return self.home_score if side == "home" else self.away_score
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]]) -> "Goal":
+        d = d or {}
+        highlight = d.get("highlight") or {}
+        return cls(
+            d.get("eventId"), d.get("period"), d.get("timeInPeriod"),
+            Player.from_dict(d["scorer"]) if d.get("scorer") else None,
+            [Player.from_dict(a) for a in d.get("assists") or [] if a],
+            d.get("shotType"), d.get("strength"), d.get("homeScore"), d.get("awayScore"),
+            highlight.get("url"), highlight.get("id"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "eventId": self.event_id,
+            "period": self.period,
+            "timeInPeriod": self.time_in_period,
+            "scorer": self.scorer.as_dict() if self.scorer else None,
+            "assists": [a.as_dict() for a in self.assists],
+            "shotType": self.shot_type,
+            "strength": self.strength,
+            "homeScore": self.home_score,
+            "awayScore": self.away_score,
+            "highlight": {"url": self.highlight_url, "id": self.highlight_id},
+        }
+
+
+# ----------------- game -----------------
+class TeamScore(DictView):
+    __slots__ = ("abbr", "score")
+    _FIELDS = {"abbr": attrgetter("abbr"), "score": attrgetter("score")}
+
+    def __init__(self, abbr: Optional[str] = None, score=0):
+        self.abbr = abbr
+        self.score = to_int(score, 0) or 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"abbr": self.abbr, "score": self.score}
+
+
+class GameSnapshot(DictView):
+    """
+    One team's scoreboard entry, the fetch_game_now() payload:
+      ok=False                -> error (+ retry_in, seconds the score circuit stays open)
+      no_game=True            -> message
+      otherwise               -> the game
+    stale / age_seconds when it comes from the last good scoreboard (API down).
+    """
+    __slots__ = ("ok", "no_game", "message", "error", "retry_in", "id", "state", "date", "home", "away",
+                 "start_time_utc", "period", "period_type", "clock", "stale", "age_seconds")
+    _FIELDS = {
+        "ok": lambda s: bool(s.ok),
+        "error": attrgetter("error"),
+        "retryIn": attrgetter("retry_in"),
+        "noGame": lambda s: True,
+        "message": attrgetter("message"),
+        "id": attrgetter("id"),
+        "state": attrgetter("state"),
+        "date": attrgetter("date"),
+        "home": lambda s: s.home.as_dict(),
+        "away": lambda s: s.away.as_dict(),
+        "startTimeUTC": attrgetter("start_time_utc"),
+        "period": attrgetter("period"),
+        "periodType": attrgetter("period_type"),
+        "clock": attrgetter("clock"),
+        "stale": lambda s: True,
+        "ageSeconds": attrgetter("age_seconds"),
+    }
+    # which keys as_dict() has, by kind of snapshot
+    _ERROR_KEYS = ("ok", "error", "retryIn")
+    _NO_GAME_KEYS = ("ok", "noGame", "message")
+    _GAME_KEYS = ("ok", "id", "state", "date", "home", "away", "startTimeUTC", "period", "periodType", "clock")
+    _STALE_KEYS = ("stale", "ageSeconds")
+
+    def __init__(self, ok: bool = True, id=None, state: Optional[str] = None, date: Optional[str] = None,
+                 home: Optional[TeamScore] = None, away: Optional[TeamScore] = None,
+                 start_time_utc: Optional[str] = None, period=None, period_type: Optional[str] = None,
+                 clock: Optional[Dict[str, Any]] = None, no_game: bool = False, message: str = "",
+                 error: Optional[str] = None, retry_in: float = 0, stale: bool = False, age_seconds=None):
+        self.ok = ok
+        self.no_game = no_game
+        self.message = message or ""
+        self.error = error
+        self.retry_in = retry_in or 0
+        self.id = id
+        self.state = state
+        self.date = date
+        self.home = home or TeamScore()
+        self.away = away or TeamScore()
+        self.start_time_utc = start_time_utc
+        self.period = to_int(period)
+        self.period_type = period_type
+        self.clock = clock or {}            # {timeRemaining, secondsRemaining, running, inIntermission}
+        self.stale = stale
+        self.age_seconds = to_int(age_seconds)
+
+    def _keys(self) -> Tuple[str, ...]:
+        if not self.ok:
+            return self._ERROR_KEYS
+        keys = self._NO_GAME_KEYS if self.no_game else self._GAME_KEYS
+        return keys + self._STALE_KEYS if self.stale else keys
+
+    @property
+    def has_game(self) -> bool:
+        return self.ok and not self.no_game and bool(self.id)
+
+    def side(self, side: str) -> TeamScore:
+        return self.home if side == "home" else self.away
+
+    @property
+    def score_line(self) -> str:
+        return f"{self.home.abbr} {self.home.score}-{self.away.score} {self.away.abbr}"
+
+    @classmethod
+    def from_dict(cls, d: Optional[Dict[str, Any]]) -> "GameSnapshot":
+        d = d or {}
+        home = d.get("home") or {}
+        away = d.get("away") or {}
+        return cls(
+            ok=bool(d.get("ok", True)), id=d.get("id"), state=d.get("state"), date=d.get("date"),
+            home=TeamScore(home.get("abbr"), home.get("score")),
+            away=TeamScore(away.get("abbr"), away.get("score")),
+            start_time_utc=d.get("startTimeUTC"), period=d.get("period"), period_type=d.get("periodType"),
+            clock=d.get("clock"), no_game=bool(d.get("noGame")), message=d.get("message"),
+            error=d.get("error"), retry_in=d.get("retryIn"), stale=bool(d.get("stale")),
+            age_seconds=d.get("ageSeconds"),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        if not self.ok:
+            return {"ok": False, "error": self.error, "retryIn": self.retry_in}
+        if self.no_game:
+            out = {"ok": True, "noGame": True, "message": self.message}
+        else:
+            out = {
+                "ok": True,
+                "id": self.id,
+                "state": self.state,
+                "date": self.date,
+                "home": self.home.as_dict(),
+                "away": self.away.as_dict(),
+                "startTimeUTC": self.start_time_utc,
+                "period": self.period,
+                "periodType": self.period_type,
+                "clock": self.clock,
+            }
+        if self.stale:
+            out.update(stale=True, ageSeconds=self.age_seconds)
+        return out
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# nhl_proxy.py
+"""
+Small caching reverse proxy for the NHL API, shared by every device on the LAN.
+
+Run it on one box:
+    python3 nhl_proxy.py
+and point the devices at it in config.py:
+    BACKEND_BASE_URL = "http://<proxy-host>:8080/v1"
+
+- one upstream request per key per TTL, whatever the number of devices
+  (concurrent identical requests share one in-flight fetch)
+- per-endpoint TTLs: short for score/now and play-by-play, long for rosters/teams
+- serves the last good copy when upstream fails or is slow (stale-if-error):
+  upstream gets a shorter timeout than the devices' 10s, and a device with a
+  stale copy to fall back on only waits STALE_WAIT_SECONDS for it, the
+  refresh finishes in the background
+- ETag/304 and gzip towards the devices, keep-alive upstream via http_pool
+"""
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+import config
+import http_pool
+from log_utils import log
+
+UPSTREAM = config.PROXY_UPSTREAM_URL.rstrip("/")
+PREFIX = "/v1"
+CACHE_MAX_ENTRIES = 256
+STALE_MAX_SECONDS = 6 * 3600        # how old a copy we still serve when upstream is down
+UPSTREAM_TIMEOUT_SECONDS = 6        # socket timeout upstream, below the devices' own 10s
+STALE_WAIT_SECONDS = 3              # with a stale copy in hand, how long a device waits for upstream
+
+# same endpoints nhl_client uses -> seconds a response stays fresh
+ENDPOINT_TTLS = [
+    (re.compile(r"^/score/"), 2),
+    (re.compile(r"^/gamecenter/\d+/play-by-play"), 2),
+    (re.compile(r"^/gamecenter/\d+/"), 5),
+    (re.compile(r"^/(roster|club-roster)/"), 6 * 3600),
+    (re.compile(r"^/team/"), 6 * 3600),
+    (re.compile(r"^/teams"), 24 * 3600),
+    (re.compile(r"^/club-schedule"), 3600),
+    (re.compile(r"^/player/\d+/landing"), 24 * 3600),
+]
+DEFAULT_TTL = 10
+NOT_FOUND_TTL = 60
+
+
+def ttl_for(path: str) -> int:
+    for pattern, ttl in ENDPOINT_TTLS:
+        if pattern.match(path):
+            return ttl
+    return DEFAULT_TTL
+
+
+class ProxyCache:
+    """LRU of upstream responses + singleflight so N devices cost one upstream fetch."""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "stale": 0, "errors": 0, "slow": 0}
+
+    def _fetch_upstream(self, path: str, old: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        headers = {
+            "User-Agent": "nhl-python-proxy/1.0",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        }
+        if old and old.get("upstream_etag"):
+            headers["If-None-Match"] = old["upstream_etag"]
+
+        try:
+            status, resp_headers, body = http_pool.get(UPSTREAM + path, headers=headers, timeout=UPSTREAM_TIMEOUT_SECONDS)
+        except http_pool.HttpError as e:
+            if e.status == 404:
+                return {"status": 404, "body": b'{"error":"not found"}', "ttl": NOT_FOUND_TTL}
+            raise
+
+        if status == 304 and old:
+            return {**old, "fetched_at": time.time()}
+
+        if (resp_headers.get("content-encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return {
+            "status": 200,
+            "body": body,
+            "ttl": ttl_for(path),
+            "upstream_etag": resp_headers.get("etag"),
+        }
+
+    def _refresh(self, path: str, old: Optional[Dict[str, Any]], fut: Future):
+        """Leader's upstream fetch, in its own thread so waiters can give up on it."""
+        try:
+            fresh = self._finish(self._fetch_upstream(path, old))
+            with self._lock:
+                self._entries[path] = fresh
+                self._entries.move_to_end(path)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            fut.set_result(fresh)
+        except Exception as e:
+            fut.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(path, None)
+
+    def _finish(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        entry.setdefault("fetched_at", time.time())
+        entry["etag"] = '"' + hashlib.sha1(entry["body"]).hexdigest()[:16] + '"'
+        entry["gz"] = None
+        return entry
+
+    def get(self, path: str) -> Tuple[Dict[str, Any], str]:
+        """Returns (entry, cache_state) where cache_state is HIT / MISS / STALE."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and (now - entry["fetched_at"]) < entry["ttl"]:
+                self._entries.move_to_end(path)
+                self.stats["hits"] += 1
+                return entry, "HIT"
+
+            fut = self._inflight.get(path)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[path] = Future()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if leader:
+            threading.Thread(target=self._refresh, args=(path, entry, fut), daemon=True).start()
+
+        stale_ok = entry is not None and (now - entry["fetched_at"]) < STALE_MAX_SECONDS
+        try:
+            return fut.result(timeout=STALE_WAIT_SECONDS if stale_ok else None), "MISS"
+        except Exception as e:
+            with self._lock:
+                self.stats["slow" if isinstance(e, FutureTimeout) else "errors"] += 1
+            if stale_ok:
+                with self._lock:
+                    self.stats["stale"] += 1
+                reason = f"no answer in {STALE_WAIT_SECONDS}s" if isinstance(e, FutureTimeout) else e
+                log(f"Upstream error for {path}, serving stale copy: {reason}")
+                return entry, "STALE"
+            raise
+
+    def gzipped(self, entry: Dict[str, Any]) -> bytes:
+        if entry.get("gz") is None:
+            entry["gz"] = gzip.compress(entry["body"], compresslevel=5)
+        return entry["gz"]
+
+
+_cache = ProxyCache()
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"     # keep-alive towards the devices
+    server_version = "nhl-proxy/1.0"
+
+    def _send(self, status: int, body: bytes, extra: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for k, v in (extra or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self._send(200, json.dumps({**_cache.stats, "upstream": http_pool.get_stats()}).encode())
+            return
+
+        if not self.path.startswith(PREFIX + "/"):
+            self._send(404, b'{"error":"unknown path"}')
+            return
+        path = self.path[len(PREFIX):]
+
+        try:
+            entry, state = _cache.get(path)
+        except Exception as e:
+            self._send(502, b'{"error":"upstream unavailable"}', {"X-Cache": "ERROR"})
+            log(f"Proxy 502 for {path}: {e}")
+            return
+
+        headers = {
+            "X-Cache": state,
+            "ETag": entry["etag"],
+            "Cache-Control": f"max-age={entry['ttl']}",
+            "Age": str(max(0, int(time.time() - entry["fetched_at"]))),
+        }
+        if state == "STALE":
+            headers["Warning"] = '110 - "Response is Stale"'
+
+        if entry["status"] == 200 and self.headers.get("If-None-Match") == entry["etag"]:
+            self.send_response(304)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = entry["body"]
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = _cache.gzipped(entry)
+            headers["Content-Encoding"] = "gzip"
+        self._send(entry["status"], body, headers)
+
+    do_HEAD = do_GET
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+def main():
+    server = ThreadingHTTPServer((config.PROXY_HOST, config.PROXY_PORT), ProxyHandler)
+    server.daemon_threads = True
+    log(f"NHL proxy on http://{config.PROXY_HOST}:{config.PROXY_PORT}{PREFIX} -> {UPSTREAM}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        log(f"Proxy stopped. stats={_cache.stats}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
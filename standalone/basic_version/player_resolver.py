@@ -0,0 +1,181 @@
+# player_resolver.py
+"""
+Player details for scorers that are on neither roster (call-ups, fresh trades).
+
+Backed by the /player/{id}/landing endpoint (through nhl_client.fetch_json, so
+it has the keep-alive pool and its own "player" circuit breaker), cached in memory and on disk with a
+long TTL. Lookups never block: a miss schedules a background fetch and the
+caller gets the result on a later call (main re-checks after the goal countdown).
+Disk writes are batched (SAVE_DEBOUNCE_SECONDS, and on exit) to spare the SD card.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import config
+import nhl_client
+from circuit_breaker import CircuitOpenError
+from log_utils import log
+
+API_BASE = config.BACKEND_BASE_URL
+PLAYER_CACHE_PATH = os.path.join(os.path.dirname(__file__), "player_cache.json")
+PLAYER_TTL_SECONDS = 7 * 24 * 3600      # jersey numbers rarely change mid-season
+PLAYER_KEEP_SECONDS = 60 * 24 * 3600   # past the TTL an entry is still a fallback; dropped after this
+MAX_CACHED_PLAYERS = 500                # oldest entries go first past this
+SAVE_DEBOUNCE_SECONDS = 30              # one write for a burst of resolved players
+MISS_RETRY_SECONDS = 300                # don't hammer the API for an id that failed
+MAX_WORKERS = 3
+
+_lock = threading.Lock()
+_write_lock = threading.Lock()
+_players: Dict[int, Dict[str, Any]] = {}      # pid -> {"player": {...}, "fetched_at": epoch}
+_failed_at: Dict[int, float] = {}
+_inflight: set = set()
+_disk_loaded = False
+_dirty = False
+_save_timer: Optional[threading.Timer] = None
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="player")
+
+
+# ---------------- disk cache ----------------
+
+def _load_disk():
+    global _disk_loaded
+    if _disk_loaded:
+        return
+    _disk_loaded = True
+    try:
+        with open(PLAYER_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for k, v in (data or {}).items():
+            _players[int(k)] = v
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log(f"Player cache unreadable, starting empty: {e}")
+
+
+def _prune_locked(now: float):
+    for pid in [p for p, v in _players.items() if now - v["fetched_at"] > PLAYER_KEEP_SECONDS]:
+        del _players[pid]
+    extra = len(_players) - MAX_CACHED_PLAYERS
+    if extra > 0:
+        for pid in sorted(_players, key=lambda p: _players[p]["fetched_at"])[:extra]:
+            del _players[pid]
+
+
+def _mark_dirty_locked():
+    """Something changed: write it out in SAVE_DEBOUNCE_SECONDS (one timer for the whole burst)."""
+    global _dirty, _save_timer
+    _dirty = True
+    if _save_timer is None:
+        _save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, flush)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def flush():
+    """Write pending changes now (debounce timer, shutdown). No-op if nothing changed."""
+    global _dirty, _save_timer
+    with _write_lock:
+        with _lock:
+            if _save_timer is not None:
+                _save_timer.cancel()
+                _save_timer = None
+            if not _dirty:
+                return
+            _dirty = False
+            _prune_locked(time.time())
+            data = {str(k): v for k, v in _players.items()}
+        # temp file + rename: a crash mid-write leaves the old cache, never a truncated one
+        tmp = PLAYER_CACHE_PATH + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, PLAYER_CACHE_PATH)
+        except Exception as e:
+            log(f"Player cache write failed: {e}")
+            with _lock:
+                _dirty = True     # try again on the next flush
+
+
+atexit.register(flush)
+
+
+# ---------------- fetch ----------------
+
+def _normalize_landing(pid: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    first = (data.get("firstName") or {}).get("default", "")
+    last = (data.get("lastName") or {}).get("default", "")
+    return {
+        "id": pid,
+        "fullName": f"{first} {last}".strip(),
+        "number": data.get("sweaterNumber"),
+        "position": data.get("position"),
+        "team": data.get("currentTeamAbbrev"),
+    }
+
+
+def _fetch(pid: int):
+    try:
+        player = _normalize_landing(pid, nhl_client.fetch_json(f"{API_BASE}/player/{pid}/landing"))
+        with _lock:
+            _players[pid] = {"player": player, "fetched_at": time.time()}
+            _failed_at.pop(pid, None)
+            _mark_dirty_locked()
+        log(f"Player resolved: {pid} -> {player.get('fullName')} #{player.get('number')}")
+    except CircuitOpenError as e:
+        # API down: try again when the breaker lets requests through, not a full MISS_RETRY_SECONDS later
+        with _lock:
+            _failed_at[pid] = time.monotonic() - MISS_RETRY_SECONDS + e.retry_in
+        log(f"Player lookup skipped for {pid}: {e}")
+    except Exception as e:
+        with _lock:
+            _failed_at[pid] = time.monotonic()
+        log(f"Player lookup failed for {pid}: {e}")
+    finally:
+        with _lock:
+            _inflight.discard(pid)
+
+
+# ---------------- public ----------------
+
+def get_cached(pid: Any) -> Optional[Dict[str, Any]]:
+    """Cached player dict (even if past its TTL), or None. Never does I/O beyond the first disk load."""
+    try:
+        pid = int(pid)
+    except Exception:
+        return None
+    with _lock:
+        _load_disk()
+        item = _players.get(pid)
+    return item["player"] if item else None
+
+
+def resolve_async(pid: Any) -> Optional[Dict[str, Any]]:
+    """
+    Returns the cached player (or None) right away and, if it is missing or
+    older than PLAYER_TTL_SECONDS, refreshes it in the background.
+    """
+    try:
+        pid = int(pid)
+    except Exception:
+        return None
+
+    with _lock:
+        _load_disk()
+        item = _players.get(pid)
+        fresh = item is not None and (time.time() - item["fetched_at"]) < PLAYER_TTL_SECONDS
+        failed = _failed_at.get(pid)
+        recently_failed = failed is not None and (time.monotonic() - failed) < MISS_RETRY_SECONDS
+        if not fresh and not recently_failed and pid not in _inflight:
+            _inflight.add(pid)
+            _executor.submit(_fetch, pid)
+
+    return item["player"] if item else None
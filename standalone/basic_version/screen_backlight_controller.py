@@ -1,6 +1,12 @@
 # screen_backlight_controller.py
+from array import array
+
 from rpi_ws281x import PixelStrip, Color
 
+from framebuffer import Animation, AnimationCache, FrameBuffer, TYPECODE
+
+ANIM_CACHE_MAX_BYTES = 512 * 1024    # rendered goal combos kept (~170KB each at 142 LEDs)
+
 def _to_color(rgb):
     if isinstance(rgb, int):
         return rgb
@@ -8,6 +14,8 @@ def _to_color(rgb):
     return Color(int(r), int(g), int(b))
 
 class ScreenBacklightController:
+    """Effects draw into self.fb (framebuffer.py), show() pushes one frame."""
+
     def __init__(
         self,
         led_count: int,
@@ -22,12 +30,15 @@ class ScreenBacklightController:
             led_count, led_pin, led_freq_hz, led_dma, invert, brightness, led_channel
         )
         self.strip.begin()
+        self.fb = FrameBuffer(self.strip)
+        self._anims = AnimationCache(ANIM_CACHE_MAX_BYTES)
+
+    def show(self):
+        self.fb.push()
 
     def fill(self, color):
-        c = _to_color(color)
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, c)
-        self.strip.show()
+        self.fb.fill(_to_color(color))
+        self.show()
 
     def off(self):
         self.fill((0, 0, 0))
@@ -88,31 +99,29 @@ class ScreenBacklightController:
         import time
 
         n = self.strip.numPixels()
+        px = self.fb.buf
         start = time.time()
 
-        def set_all_black():
-            for i in range(n):
-                self.strip.setPixelColor(i, Color(0, 0, 0))
-
         # moving head with a fading tail
         tail_len = max(6, n // 12)
+        team_c = _to_color(team)
+        r, g, b = tail
+        tail_c = [Color(int(r * s), int(g * s), int(b * s))
+                  for s in (max(0.0, 1.0 - (k / (tail_len + 1))) for k in range(1, tail_len + 1))]
         while (time.time() - start) < duration:
             t = time.time() - start
             head = int((t / speed)) % n
 
-            set_all_black()
+            self.fb.fill(0)
 
             # head = team
-            self.strip.setPixelColor(head, _to_color(team))
+            px[head] = team_c
 
             # tail behind head = white -> dim
             for k in range(1, tail_len + 1):
-                idx = (head - k) % n
-                s = max(0.0, 1.0 - (k / (tail_len + 1)))
-                r, g, b = tail
-                self.strip.setPixelColor(idx, Color(int(r * s), int(g * s), int(b * s)))
+                px[(head - k) % n] = tail_c[k - 1]
 
-            self.strip.show()
+            self.show()
             time.sleep(0.01)
 
         self.off()
@@ -122,23 +131,25 @@ class ScreenBacklightController:
         import time, random
 
         n = self.strip.numPixels()
+        px = self.fb.buf
         start = time.time()
 
+        base_c = _to_color(tuple(int(c * 0.15) for c in team))
+        white_c = _to_color((255, 255, 255))
+        team_c = _to_color(team)
+
         # ~8.5s sparkles
         while (time.time() - start) < (duration - 1.5):
             # decay background a bit by re-filling a dim base
-            base = tuple(int(c * 0.15) for c in team)
-            self.fill(base)
+            self.fb.fill(base_c)
 
             # add random bright sparkles
             for _ in range(max(3, n // 15)):
-                i = random.randrange(n)
-                self.strip.setPixelColor(i, _to_color((255, 255, 255)))
+                px[random.randrange(n)] = white_c
             for _ in range(max(3, n // 15)):
-                i = random.randrange(n)
-                self.strip.setPixelColor(i, _to_color(team))
+                px[random.randrange(n)] = team_c
 
-            self.strip.show()
+            self.show()
             time.sleep(0.07)
 
         # 1.5s finale: 3 big flashes
@@ -158,25 +169,29 @@ class ScreenBacklightController:
             self.fill(off)
             time.sleep(delay)
 
-    def goal_animation_combo(self,team=(255, 0, 0),accent=(0, 120, 255),duration=10.0,):
-        import time, math, random
+    def render_goal_animation_combo(self, team=(255, 0, 0), accent=(0, 120, 255), duration=10.0) -> Animation:
+        """
+        goal_animation_combo() as frames, nothing shown. Same phases, timed
+        by the frame holds instead of the wall clock (chase: one LED per frame).
+        """
+        import math, random
 
-        n = self.strip.numPixels()
-        t0 = time.time()
+        n = self.fb.n
 
         def scale(rgb, s):
             r, g, b = rgb
             return (int(r * s), int(g * s), int(b * s))
 
-        def set_all(rgb):
-            c = _to_color(rgb)
-            for i in range(n):
-                self.strip.setPixelColor(i, c)
-            self.strip.show()
+        def solid(rgb):
+            return array(TYPECODE, [_to_color(rgb)]) * n
+
+        steps = []
+        elapsed = 0.0
 
-        def clear():
-            for i in range(n):
-                self.strip.setPixelColor(i, Color(0, 0, 0))
+        def add(frame, hold):
+            nonlocal elapsed
+            steps.append((frame, hold))
+            elapsed += hold
 
         # ----------------------------
         # Phase timings (sum ~ duration)
@@ -186,94 +201,69 @@ class ScreenBacklightController:
         sparkle_time = max(0.0, duration - (strobe_time + chase_time + 1.5))  # leave 1.5s finale
         finale_time = duration - (strobe_time + chase_time + sparkle_time)
 
-        # ----------------------------
-        # Phase 1: Strobe bursts (team/accent/white)
-        # ----------------------------
+        team_f, white_f, accent_f, black_f = solid(team), solid((255, 255, 255)), solid(accent), solid((0, 0, 0))
+
+        # Phase 1: Strobe bursts (team -> white -> accent -> black)
         strobe_dt = 0.08
-        end1 = t0 + strobe_time
-        while time.time() < end1:
-            # quick burst: team -> white -> accent -> black
-            set_all(team); time.sleep(strobe_dt)
-            set_all((255, 255, 255)); time.sleep(strobe_dt)
-            set_all(accent); time.sleep(strobe_dt)
-            set_all((0, 0, 0)); time.sleep(strobe_dt)
+        end1 = strobe_time
+        while elapsed < end1:
+            add(team_f, strobe_dt)
+            add(white_f, strobe_dt)
+            add(accent_f, strobe_dt)
+            add(black_f, strobe_dt)
 
-        # ----------------------------
         # Phase 2: Chase with white tail + breathing background
-        # ----------------------------
         end2 = end1 + chase_time
         tail_len = max(6, n // 12)
         step_dt = 0.015  # speed of movement
-        while time.time() < end2:
-            t = time.time() - end1
+        accent_c = _to_color(accent)
+        tail_c = [_to_color(scale((255, 255, 255), max(0.0, 1.0 - (k / (tail_len + 1)))))
+                  for k in range(1, tail_len + 1)]
+        while elapsed < end2:
+            t = elapsed - end1
             head = int(t / step_dt) % n
-
-            # breathing base (dim team color)
             breathe = 0.10 + 0.25 * (0.5 - 0.5 * math.cos(2 * math.pi * (t / 0.7)))
-            base = scale(team, breathe)
-
-            # draw base
-            for i in range(n):
-                self.strip.setPixelColor(i, _to_color(base))
-
-            # head (accent)
-            self.strip.setPixelColor(head, _to_color(accent))
-
-            # tail (white fade)
+            px = solid(scale(team, breathe))
+            px[head] = accent_c
             for k in range(1, tail_len + 1):
-                idx = (head - k) % n
-                s = max(0.0, 1.0 - (k / (tail_len + 1)))
-                self.strip.setPixelColor(idx, _to_color(scale((255, 255, 255), s)))
-
-            self.strip.show()
-            time.sleep(0.01)
+                px[(head - k) % n] = tail_c[k - 1]
+            add(px, step_dt)
 
-        # ----------------------------
         # Phase 3: Sparkles (team + white glitter)
-        # ----------------------------
         end3 = end2 + sparkle_time
-        while time.time() < end3:
-            # dim base
-            base = scale(team, 0.12)
-            for i in range(n):
-                self.strip.setPixelColor(i, _to_color(base))
-
-            # random white sparkles
+        base_f = solid(scale(team, 0.12))
+        white_c = _to_color((255, 255, 255))
+        while elapsed < end3:
+            px = array(TYPECODE, base_f)
             for _ in range(max(3, n // 18)):
-                i = random.randrange(n)
-                self.strip.setPixelColor(i, _to_color((255, 255, 255)))
-
-            # random accent sparkles
+                px[random.randrange(n)] = white_c
             for _ in range(max(2, n // 24)):
-                i = random.randrange(n)
-                self.strip.setPixelColor(i, _to_color(accent))
-
-            self.strip.show()
-            time.sleep(0.07)
+                px[random.randrange(n)] = accent_c
+            add(px, 0.07)
 
-        # ----------------------------
-        # Phase 4: Finale (big flashes + fade out)
-        # ----------------------------
-        # Use whatever time remains (about 1.5s)
-        # 2-3 punchy flashes, then fade
+        # Phase 4: Finale (2-3 punchy flashes, then fade out in what is left)
         punches = 3 if finale_time >= 1.4 else 2
         punch_on = 0.12
         punch_off = 0.10
-
         for _ in range(punches):
-            set_all((255, 255, 255)); time.sleep(punch_on)
-            set_all(team); time.sleep(punch_on)
-            set_all((0, 0, 0)); time.sleep(punch_off)
-
-        # fade out (rest)
-        fade_left = max(0.2, (t0 + duration) - time.time())
-        f0 = time.time()
-        while True:
-            t = time.time() - f0
-            if t >= fade_left:
-                break
-            s = 1.0 - (t / fade_left)
-            set_all(scale(team, s))
-            time.sleep(0.03)
-
-        self.off()
\ No newline at end of file
+            add(white_f, punch_on)
+            add(team_f, punch_on)
+            add(black_f, punch_off)
+
+        fade_left = max(0.2, duration - elapsed)
+        t = 0.0
+        while t < fade_left:
+            add(solid(scale(team, 1.0 - (t / fade_left))), 0.03)
+            t += 0.03
+
+        add(black_f, 0.0)
+        return Animation(steps)
+
+    def goal_animation(self, team=(255, 0, 0), accent=(0, 120, 255), duration=10.0) -> Animation:
+        """render_goal_animation_combo(), cached (LRU, ANIM_CACHE_MAX_BYTES)."""
+        key = (_to_color(team), _to_color(accent), duration)
+        return self._anims.get(key, lambda: self.render_goal_animation_combo(team, accent, duration))
+
+    def goal_animation_combo(self, team=(255, 0, 0), accent=(0, 120, 255), duration=10.0):
+        """Strobe, chase, sparkles, finale: rendered once per colors, played back."""
+        self.fb.play(self.goal_animation(team, accent, duration))
@@ -3,6 +3,20 @@
 # ---------- BACKEND ----------
 BACKEND_BASE_URL = "https://api-web.nhle.com/v1"
 TEAM_ABBR = "MTL"
+TEAM_ABBRS = [TEAM_ABBR]   # watch several teams from one /score/now fetch, e.g. ["MTL", "TOR"]
+JSON_BACKEND = "auto"      # "auto" (msgspec > orjson > json, whichever is installed), or force one
+
+# ---------- LAN PROXY (nhl_proxy.py) ----------
+# run nhl_proxy.py on one box and set BACKEND_BASE_URL = "http://<proxy-host>:8080/v1" on the devices
+PROXY_UPSTREAM_URL = "https://api-web.nhle.com/v1"
+PROXY_HOST         = "0.0.0.0"
+PROXY_PORT         = 8080
+
+# ---------- EVENT FEED (event_server.py) ----------
+# set EVENTS_URL = "http://<server-host>:8081/events" to get pushed events instead of polling
+EVENTS_URL  = None
+EVENTS_HOST = "0.0.0.0"
+EVENTS_PORT = 8081
 
 # ---------- LCD ----------
 LCD_I2C_ADDRESS = 0x27
@@ -12,6 +26,21 @@ LCD_ROWS = 2
 
 # ---------- POLLING ----------
 POLL_INTERVAL_SECONDS = 5
+PBP_RECONCILE_SECONDS = 60   # play-by-play re-check when the score did not change
+PBP_CATCHUP_SECONDS   = 60   # keep pulling play-by-play this long while it lags the score
+
+# game-clock-aware intervals (poll_scheduler.py)
+POLL_LIVE_SECONDS               = 2
+POLL_STOPPAGE_SECONDS           = 6
+POLL_SHOOTOUT_SECONDS           = 4
+POLL_INTERMISSION_MAX_SECONDS   = 120
+STOPPAGE_GRACE_SECONDS          = 30    # keep polling fast right after the clock stops (goals stop it too)
+FINAL_MINUTES_SECONDS           = 300   # last 5 minutes of the 3rd / OT: always fast
+INTERMISSION_WAKE_EARLY_SECONDS = 45    # be back to fast polling before the intermission timer ends
+
+# schedule-aware sleeping (schedule_cache.py)
+PREGAME_WARMUP_SECONDS          = 30 * 60   # start polling /score/now this long before puck drop
+PUCK_DROP_LEAD_SECONDS          = 60        # in FUT/PRE, wake up this long before the start time
 
 # ---------- LED STRIP ----------
 LED_COUNT      = 142
@@ -22,6 +51,9 @@ LED_DMA        = 10
 LED_BRIGHTNESS = 60
 LED_INVERT     = False
 
+# ---------- SCORE MATRIX ----------
+MATRIX_ROTATION = 0     # 0/180 clockwise, if the matrix is mounted turned (90/270: two digits don't fit)
+
 # ---------- BUTTON ----------
 BUTTON_PIN       = 17
 DECREMENT_DELAY  = 0.2
@@ -0,0 +1,79 @@
+# event_client.py
+"""
+Server-Sent Events client for event_server.py (subscriber mode of main.py).
+
+listen() blocks forever: connects, hands every event to on_event(name, data),
+and reconnects with Last-Event-ID when the stream drops so nothing is missed.
+"""
+import http.client
+import json
+import time
+from typing import Any, Callable, List
+from urllib.parse import urlencode, urlparse
+
+from log_utils import log
+
+READ_TIMEOUT_SECONDS = 45       # server pings every 15s, so this means the link is dead
+RECONNECT_MIN_SECONDS = 1
+RECONNECT_MAX_SECONDS = 30
+
+
+def _open(url: str, teams: List[str], last_id):
+    u = urlparse(url)
+    conn_cls = http.client.HTTPSConnection if u.scheme == "https" else http.client.HTTPConnection
+    conn = conn_cls(u.hostname, u.port, timeout=READ_TIMEOUT_SECONDS)
+    path = (u.path or "/events") + "?" + urlencode({"teams": ",".join(teams)})
+    headers = {"Accept": "text/event-stream", "User-Agent": "nhl-python-client/1.0"}
+    if last_id:
+        headers["Last-Event-ID"] = last_id
+    conn.request("GET", path, headers=headers)
+    resp = conn.getresponse()
+    if resp.status != 200:
+        conn.close()
+        raise RuntimeError(f"HTTP {resp.status} from {url}")
+    return conn, resp
+
+
+def listen(url: str, teams: List[str], on_event: Callable[[str, Any], None]):
+    last_id = None
+    backoff = RECONNECT_MIN_SECONDS
+    while True:
+        conn = None
+        try:
+            conn, resp = _open(url, teams, last_id)
+            log(f"Event stream connected: {url} (resume from {last_id})")
+            on_event("connected", {"resumed": last_id is not None})
+            backoff = RECONNECT_MIN_SECONDS
+
+            name, data, ev_id = "message", [], None
+            while True:
+                raw = resp.readline()
+                if not raw:
+                    raise ConnectionError("stream closed")
+                line = raw.decode("utf-8").rstrip("\r\n")
+                if not line:
+                    # blank line = dispatch
+                    if data:
+                        if ev_id is not None:
+                            last_id = ev_id
+                        on_event(name, json.loads("\n".join(data)))
+                    name, data, ev_id = "message", [], None
+                    continue
+                if line.startswith(":"):
+                    continue
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "event":
+                    name = value
+                elif field == "data":
+                    data.append(value)
+                elif field == "id":
+                    ev_id = value
+        except Exception as e:
+            log(f"Event stream lost: {e}. Reconnecting in {backoff}s")
+            on_event("disconnected", {"error": str(e)})
+        finally:
+            if conn is not None:
+                conn.close()
+        time.sleep(backoff)
+        backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
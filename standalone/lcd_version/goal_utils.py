@@ -1,22 +1,66 @@
 # goal_utils.py
+import time
 from typing import Optional, Dict, Any, List
+from models import Goal
 
 def get_latest_scorer_number(goals_payload: Dict[str, Any]) -> Optional[int]:
     """
     goals_payload = result of fetch_goals(game_id)
     Returns scorer jersey number (int) for the most recent goal, or None.
     """
-    goals: List[Dict[str, Any]] = (goals_payload.get("goals") or [])
-    if not goals:
+    goals: List[Goal] = (goals_payload.get("goals") or [])
+    if not goals or goals[-1].scorer is None:
         return None
+    return goals[-1].scorer.number
 
-    last_goal = goals[-1]
-    scorer = last_goal.get("scorer") or {}
-    num = scorer.get("number")
-    if num is None:
-        return None
 
-    try:
-        return int(num)
-    except Exception:
-        return None
+class PbpFetchGate:
+    """
+    Decides when the play-by-play is worth downloading.
+
+    /score/now already gives home/away totals, so play-by-play is only pulled when:
+      - there is no baseline yet for this game
+      - the home+away total changed since the last play-by-play we looked at
+      - the play-by-play is still behind the scoreboard (goal not listed yet),
+        for at most catchup_seconds after the change
+      - reconcile_seconds passed (slow check that catches overturned goals)
+    """
+
+    def __init__(self, reconcile_seconds: float = 60, catchup_seconds: float = 60):
+        self.reconcile_seconds = reconcile_seconds
+        self.catchup_seconds = catchup_seconds
+        self.reset()
+
+    def reset(self):
+        self._game_id = None
+        self._total = None          # score total seen by the last play-by-play fetch
+        self._fetched_at = 0.0
+        self._behind_since = None   # scoreboard ahead of play-by-play since...
+
+    def should_fetch(self, game_id, home_score: int, away_score: int, now: Optional[float] = None) -> bool:
+        now = time.monotonic() if now is None else now
+        if game_id != self._game_id or self._total is None:
+            return True
+        if (home_score + away_score) != self._total:
+            return True
+        if self._behind_since is not None and (now - self._behind_since) < self.catchup_seconds:
+            return True
+        return (now - self._fetched_at) >= self.reconcile_seconds
+
+    def mark_fetched(self, game_id, home_score: int, away_score: int, goal_count: int, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        total = home_score + away_score
+
+        if game_id != self._game_id:
+            self.reset()
+            self._game_id = game_id
+
+        if goal_count < total:
+            # keep polling play-by-play until it lists the new goal (or we give up)
+            if self._behind_since is None or total != self._total:
+                self._behind_since = now
+        else:
+            self._behind_since = None
+
+        self._total = total
+        self._fetched_at = now
@@ -0,0 +1,178 @@
+# http_pool.py
+import http.client
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+# ---- CONFIG ----
+MAX_IDLE_PER_HOST = 4          # sockets kept open per host
+IDLE_TIMEOUT_SECONDS = 55      # drop sockets the server probably already closed
+MAX_REDIRECTS = 5
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# errors that mean "the kept-alive socket died under us" -> reconnect once
+_STALE_SOCKET_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    http.client.CannotSendRequest,
+    http.client.ResponseNotReady,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, reason: str, url: str):
+        super().__init__(f"HTTP {status} {reason} for {url}")
+        self.status = status
+        self.reason = reason
+        self.url = url
+
+
+class HttpPool:
+    """
+    Tiny keep-alive connection pool on top of http.client.
+
+    urllib.request.urlopen opens a fresh socket (DNS + TCP + TLS) for every call.
+    Here we keep a few idle connections per (scheme, host, port) and reuse them,
+    reconnecting transparently when the server closed one in the meantime.
+    """
+
+    def __init__(self, max_idle_per_host: int = MAX_IDLE_PER_HOST, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "reused": 0,
+            "handshakes": 0,
+            "reconnects": 0,
+            "redirects": 0,
+        }
+
+    # ---------------- connections ----------------
+
+    def _bump(self, key: str):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _acquire(self, host_key, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(host_key) or []
+            while idle:
+                conn, last_used = idle.pop()
+                if now - last_used < self.idle_timeout and conn.sock is not None:
+                    conn.timeout = timeout
+                    conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+
+        scheme, host, port = host_key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        conn.connect()
+        self._bump("handshakes")
+        return conn, False
+
+    def _release(self, host_key, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(host_key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def close_all(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+            self._idle.clear()
+
+    # ---------------- requests ----------------
+
+    def _request_once(self, url: str, headers: Dict[str, str], timeout: float):
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        host_key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn, reused = self._acquire(host_key, timeout)
+        try:
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except _STALE_SOCKET_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # server dropped the idle socket -> one fresh attempt
+                self._bump("reconnects")
+                conn, reused = self._acquire(host_key, timeout)
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+
+            body = resp.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if reused:
+            self._bump("reused")
+
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(host_key, conn)
+
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        return resp.status, resp.reason, resp_headers, body
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10):
+        """
+        GET url, following redirects.
+        Returns (status, headers, body_bytes). headers keys are lower-cased.
+        Raises HttpError for status >= 400 (same as urlopen did).
+        """
+        headers = dict(headers or {})
+        self._bump("requests")
+
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, resp_headers, body = self._request_once(url, headers, timeout)
+            location = resp_headers.get("location")
+            if status in _REDIRECT_CODES and location:
+                self._bump("redirects")
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if status >= 400:
+                raise HttpError(status, reason, url)
+            return status, resp_headers, body
+
+        raise HttpError(status, "Too many redirects", url)
+
+
+# ---------------- module-level default pool ----------------
+_default_pool = HttpPool()
+
+
+def get(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10):
+    return _default_pool.get(url, headers=headers, timeout=timeout)
+
+
+def get_stats() -> Dict[str, int]:
+    with _default_pool._lock:
+        return dict(_default_pool.stats)
+
+
+def close_all():
+    _default_pool.close_all()
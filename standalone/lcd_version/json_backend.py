@@ -0,0 +1,184 @@
+# json_backend.py
+"""
+JSON decoding backend for the NHL client.
+
+Uses msgspec or orjson when installed (pip install msgspec / orjson), the
+stdlib json module otherwise. config.JSON_BACKEND forces one ("auto" picks
+msgspec > orjson > json).
+
+  loads(data)          str/bytes -> Python objects, with the active backend
+  load(f)              same, from a file opened in "rb" or "r"
+  record(name, **f)    compact struct type keeping only the fields f (name=type)
+  decode(data, Rec)    str/bytes -> Rec
+
+Records are how we decode the payloads we poll all the time (score/now,
+play-by-play): only the fields the client reads are kept, in __slots__
+objects instead of dicts.
+  - msgspec: records are msgspec Structs, decoded straight from the bytes with
+    type checking; keys we didn't ask for are skipped by the C decoder and
+    never become Python objects
+  - orjson / json: the document is decoded as usual, then projected onto
+    __slots__ records (same attributes), so what stays cached is small
+Field types: int, float, str, bool, Any (kept as decoded), RAW (left
+undecoded with msgspec, see raw_value), another record, or [record] for a
+list. A missing key, null or a value of the wrong type gives None.
+"""
+import json
+from typing import Any, Dict, List, Optional, Union
+
+import config
+from log_utils import log
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKENDS = ("msgspec", "orjson", "json")
+
+
+def _installed(name: str) -> bool:
+    return name == "json" or (name == "orjson" and orjson is not None) or (name == "msgspec" and msgspec is not None)
+
+
+def _pick(wanted: str) -> str:
+    wanted = (wanted or "auto").strip().lower()
+    if wanted != "auto":
+        if _installed(wanted):
+            return wanted
+        log(f"JSON backend {wanted} is not installed, picking one")
+    return next(b for b in BACKENDS if _installed(b))
+
+
+BACKEND = _pick(getattr(config, "JSON_BACKEND", "auto"))
+
+# backend name -> loads, for everything installed (bench_json.py compares them)
+LOADERS = {"json": json.loads}
+if orjson is not None:
+    LOADERS["orjson"] = orjson.loads
+if msgspec is not None:
+    LOADERS["msgspec"] = msgspec.json.decode
+
+loads = LOADERS[BACKEND]
+
+
+def load(f) -> Any:
+    return loads(f.read())
+
+
+# ----------------- records -----------------
+RAW = object()      # field type: sub-document decoded only when asked (raw_value)
+
+
+class Record:
+    """__slots__ record projected from a decoded dict (orjson / json backends)."""
+    __slots__ = ()
+    FIELDS: Dict[str, Any] = {}
+
+    def __init__(self, **values):
+        for k in self.FIELDS:
+            setattr(self, k, values.get(k))
+
+    @classmethod
+    def from_obj(cls, obj: Any):
+        if not isinstance(obj, dict):
+            return None
+        rec = cls.__new__(cls)
+        for k, t in cls.FIELDS.items():
+            setattr(rec, k, _project(obj.get(k), t))
+        return rec
+
+    def __repr__(self):
+        inner = ", ".join(f"{k}={getattr(self, k)!r}" for k in self.FIELDS)
+        return f"{type(self).__name__}({inner})"
+
+
+def _project(v: Any, t: Any) -> Any:
+    if v is None or t is Any or t is RAW:
+        return v
+    if isinstance(t, list):
+        return [_project(x, t[0]) for x in v] if isinstance(v, list) else None
+    if isinstance(t, type) and issubclass(t, Record):
+        return t.from_obj(v)
+    if isinstance(v, t) and not (t is int and isinstance(v, bool)):
+        return v
+    if t is float and isinstance(v, int) and not isinstance(v, bool):
+        return float(v)
+    if t is int and isinstance(v, str):
+        try:
+            return int(v)
+        except ValueError:
+            return None
+    return None
+
+
+def _msgspec_type(t: Any) -> Any:
+    if isinstance(t, list):
+        return List[_msgspec_type(t[0])]
+    return t
+
+
+def record(name: str, **fields) -> type:
+    """Compact struct type for a JSON object, keeping only `fields` (see module doc)."""
+    if BACKEND == "msgspec":
+        # Raw can't sit in a union: RAW fields are plain Raw (JSON null -> Raw(b"null"))
+        spec = [(k, msgspec.Raw if t is RAW else Optional[_msgspec_type(t)], None) for k, t in fields.items()]
+        rec = msgspec.defstruct(name, spec, module=__name__)
+        rec.FIELDS = fields     # plain class attribute, not a struct field
+        return rec
+    return type(name, (Record,), {"__slots__": tuple(fields), "FIELDS": fields})
+
+
+_decoders: Dict[type, Any] = {}
+
+
+def decode(data: Union[str, bytes], rec: type) -> Any:
+    """str/bytes -> rec (None if the top level is not an object)."""
+    if BACKEND == "msgspec":
+        dec = _decoders.get(rec)
+        if dec is None:
+            # strict=False: "12" for an int field is accepted like in the fallback
+            dec = _decoders[rec] = msgspec.json.Decoder(Optional[rec], strict=False)
+        try:
+            return dec.decode(data)
+        except msgspec.ValidationError:
+            # a field changed type upstream: project like the other backends do
+            return _to_struct(msgspec.json.decode(data), rec)
+    return rec.from_obj(loads(data))
+
+
+def _to_struct(v: Any, t: Any) -> Any:
+    """decode() fallback with msgspec: decoded value -> t, same rules as Record.from_obj."""
+    if v is None:
+        return None
+    if t is RAW:
+        return msgspec.Raw(msgspec.json.encode(v))
+    if isinstance(t, list):
+        return [_to_struct(x, t[0]) for x in v] if isinstance(v, list) else None
+    if hasattr(t, "FIELDS"):
+        if not isinstance(v, dict):
+            return None
+        return t(**{k: _to_struct(v.get(k), ft) for k, ft in t.FIELDS.items()})
+    return _project(v, t)
+
+
+def raw_value(v: Any) -> Any:
+    """Value of a RAW field: decoded now with msgspec, already decoded otherwise."""
+    if msgspec is not None and isinstance(v, msgspec.Raw):
+        return msgspec.json.decode(v)
+    return v
+
+
+def as_dict(rec: Any) -> Any:
+    """Record (or list of records) -> plain dicts, RAW fields decoded. Other values pass through."""
+    if isinstance(rec, list):
+        return [as_dict(x) for x in rec]
+    fields = getattr(type(rec), "FIELDS", None)
+    if fields is None:
+        return raw_value(rec)
+    return {k: as_dict(getattr(rec, k)) for k in fields}
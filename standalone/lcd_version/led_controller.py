@@ -3,6 +3,8 @@ from matrix_number import MatrixNumberDisplay
 from screen_backlight_controller import ScreenBacklightController
 import config
 
+GOAL_COMBO_SECONDS = 10.0
+
 class LedController:
     def __init__(self):
         # A) Score matrix (15x12 on GPIO 18 for example)
@@ -13,6 +15,7 @@ class LedController:
             led_channel=0,     # channel 0
             led_brightness=80,
             serpentine=True,
+            rotation=config.MATRIX_ROTATION,
         )
 
         # B) Back-of-screen strip (example: 60 LEDs on GPIO 13 channel 1)
@@ -39,6 +42,13 @@ class LedController:
         self.matrix.clear()
         self.backlight.off()
 
+    def prepare_goal_show(self, n, fg, bg):
+        """Render the goal show ahead of time (n=None: scorer unknown, backlight only).
+        The animations below then start straight from the cache."""
+        if n is not None:
+            self.matrix.goal_animation(n, fg=fg, bg=bg)
+        self.backlight.goal_animation(team=fg, accent=bg, duration=GOAL_COMBO_SECONDS)
+
     def goal_matrix_animation(self, n, fg, bg):
         self.matrix.goal_number_animation(n, fg=fg, bg=bg)
-        self.backlight.goal_animation_combo(team=fg, accent=bg, duration=10.0)
+        self.backlight.goal_animation_combo(team=fg, accent=bg, duration=GOAL_COMBO_SECONDS)
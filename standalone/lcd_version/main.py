@@ -1,217 +1,787 @@
 #!/usr/bin/env python3
+import asyncio
+import math
+import threading
 import time
 
 import config
 from log_utils import log
 from lcd_display import LcdDisplay
-from led_controller import LedController
-from backend_client import fetch_game_now
+from led_controller import GOAL_COMBO_SECONDS, LedController
+from backend_client import fetch_games_now
 
 # ✅ add this import
-from nhl_client import fetch_goals
+from nhl_client import fetch_goals, get_http_stats
 
 from button_controller import DelayController
 from nhl_team_colors import get_team_colors
 from emoji_state import pick_emoji_and_colors
+from goal_utils import PbpFetchGate
+from models import NO_PLAYER, GameSnapshot, Goal, Player
+from poll_scheduler import PollScheduler
+from schedule_cache import next_game_start, seconds_until_warmup
+from player_resolver import flush as flush_player_cache, get_cached as get_cached_player
+import event_client
+
+BUTTON_POLL_SECONDS = 0.05
+NO_GAME_POLL_SECONDS = 1200      # 20 minutes when no game (schedule unknown)
+NO_GAME_RECHECK_SECONDS = 60     # schedule says a game is on but /score/now disagrees
+EMOJI_AFTER_GOAL_SECONDS = 20
+ENRICH_WAIT_SECONDS = 15         # after the backlight part, how long the jersey number may still take
+PENDING_ALERT_SECONDS = 300      # a score-change alert the play-by-play never confirmed (overturned)
+
+
+class TeamWatch:
+    """Per watched team: the game it is in and its emoji state (display side)."""
+
+    def __init__(self, team: str):
+        self.team = team
+        self.data: GameSnapshot | None = None   # last fetch_game_now() payload
+        self.game_id = None
+        self.emoji_shown_for_game_id = None
+        self.emoji_task: asyncio.Task | None = None
+
+    def cancel_emoji(self):
+        if self.emoji_task is not None:
+            self.emoji_task.cancel()
+            self.emoji_task = None
+
+
+class GoalAlert:
+    """
+    One goal on its way to the display. Created as soon as a /score/now total
+    goes up (scorer unknown), enriched when the play-by-play lists the goal.
+    """
+
+    def __init__(self, team: str, side: str, score_after, goal: Goal | None = None):
+        self.team = team                    # scoring team
+        self.side = side                    # "home" / "away"
+        self.score_after = score_after      # that side's score once the goal counts
+        self.goal = goal
+        self.created = time.monotonic()
+        self.enriched = asyncio.Event()
+        self.removed = False                # goal taken back before its show
+        if goal is not None:
+            self.enriched.set()
+
+    def enrich(self, goal: Goal):
+        self.goal = goal
+        self.enriched.set()
+
+    def take_back(self):
+        self.removed = True
+
+    @property
+    def scorer(self) -> Player:
+        return (self.goal.scorer if self.goal else None) or NO_PLAYER
+
+
+def _score_after(goals) -> tuple:
+    """(home, away) after the last goal of a play-by-play goal list."""
+    for g in reversed(goals):
+        if g.home_score is not None and g.away_score is not None:
+            return (g.home_score, g.away_score)
+    return (0, 0)
+
+
+class GameWatch:
+    """Per game: goal detection, shared by every watched team playing in it."""
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.goal_ids: set | None = None    # play-by-play goal event ids already seen
+        self.goal_score = None              # (home, away) after the last play-by-play goal seen
+        self.alerted = None                 # {"home": n, "away": n} scores already alerted
+        self.pending: list = []             # GoalAlerts waiting for the play-by-play
+        self.recent: list = []              # GoalAlerts of the last PENDING_ALERT_SECONDS (take-backs)
+        self.pbp_gate = PbpFetchGate(
+            reconcile_seconds=config.PBP_RECONCILE_SECONDS,
+            catchup_seconds=config.PBP_CATCHUP_SECONDS,
+        )
+        self.scheduler = PollScheduler()
+
+
+class Runtime:
+    """
+    asyncio runtime: polling, goal alerts, button, LCD and LED animations run as
+    separate tasks. A slow or stalled NHL request no longer freezes the button or
+    the LCD, and polling keeps going while a goal animation plays.
+
+    Blocking work (HTTP, I2C, LED frames) runs in worker threads. LED animations
+    go through one queue so only one thread ever drives the strips.
+
+    With config.EVENTS_URL set, the poll task is replaced by a subscriber to
+    event_server.py: scoreboard and goal events are pushed to us and this device
+    never calls the NHL API.
+
+    Several teams can be watched (config.TEAM_ABBRS) from one /score/now request
+    per cycle. Goal detection runs once per game; alerts are routed to the display
+    from the point of view of the watched team(s) in that game. The LCD score line
+    follows the first team in the list that has a game.
+    """
+
+    def __init__(self):
+        self.lcd = LcdDisplay()
+        self.leds = LedController()
+        self.delay_ctrl = DelayController(self.lcd)
+
+        self.lcd_queue: asyncio.Queue | None = None
+        self.anim_queue: asyncio.Queue | None = None
+
+        self.teams = [str(t).upper().strip() for t in config.TEAM_ABBRS]
+        self.watches = {t: TeamWatch(t) for t in self.teams}
+        self.games: dict = {}               # game id -> GameWatch
+        self.alerts_active = 0              # goal alerts own the LCD while > 0
+        self.poll_interval = config.POLL_INTERVAL_SECONDS
+        self.tasks: set = set()             # goal alerts etc. in flight (the loop only keeps weak refs)
+
+    # ---------------- helpers ----------------
+
+    def show_text(self, line1: str, line2: str = ""):
+        self.lcd_queue.put_nowait(("text", line1, line2))
+
+    def show_delay(self):
+        self.lcd_queue.put_nowait(("delay", self.delay_ctrl.get_delay()))
+
+    def play(self, name: str, fn, on_error=None) -> asyncio.Future:
+        """Queue a blocking LED job. The returned future resolves once it has played."""
+        done = asyncio.get_running_loop().create_future()
+        self.anim_queue.put_nowait((name, fn, on_error, done))
+        return done
+
+    def spawn(self, coro) -> asyncio.Task:
+        """create_task that keeps a reference until it is done and logs it if it crashes."""
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self._task_done)
+        return task
+
+    def _task_done(self, task: asyncio.Task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log(f"Task {task.get_coro().__qualname__} error: {task.exception()!r}")
+
+    def play_emoji(self, emoji: str, fg, bg, label: str):
+        def job():
+            self.leds.matrix.emoji_animation(emoji, fg=fg, bg=bg, pulses=4)
+            log(f"Emoji shown ({label}): {emoji}")
+        return self.play(f"Emoji {label}", job)
+
+    def schedule_emoji(self, watch: TeamWatch, delay_seconds: float):
+        """Show the score-based emoji once, delay_seconds from now (replaces a pending one)."""
+        watch.cancel_emoji()
+        watch.emoji_task = asyncio.create_task(self._emoji_later(watch, delay_seconds))
+
+    async def _emoji_later(self, watch: TeamWatch, delay_seconds: float):
+        await asyncio.sleep(delay_seconds)
+        try:
+            emoji, efg, ebg = pick_emoji_and_colors(watch.data, watch.team)
+            self.play_emoji(emoji, efg, ebg, f"scheduled {watch.team}")
+        except Exception as e:
+            log(f"Emoji scheduled display error: {e}")
+
+    def reset_team(self, watch: TeamWatch):
+        watch.game_id = None
+        watch.emoji_shown_for_game_id = None
+        watch.cancel_emoji()
+
+    def show_no_game(self, msg: str, wait: float):
+        log(f"No game: sleeping {int(wait)}s")
+        self.show_text("NO GAME", msg[:config.LCD_COLS])
+        self.show_delay()
+
+        for watch in self.watches.values():
+            self.reset_team(watch)
+        self.games.clear()
+
+    def show_board(self):
+        """Redraw the score line from the last scoreboard (the LCD may show something else)."""
+        if self.alerts_active:
+            return
+        data = next((w.data for w in self.watches.values() if w.game_id and w.data), None)
+        self.show_text(data.score_line if data is not None else "NO GAME", "")
+        self.show_delay()
+
+    async def next_game_text(self) -> str:
+        starts = await asyncio.gather(*(asyncio.to_thread(next_game_start, t) for t in self.teams))
+        starts = [s for s in starts if s is not None]
+        if not starts:
+            return "No games left"
+        return time.strftime("Next %a %H:%M", time.localtime(min(starts)))
+
+    # ---------------- tasks ----------------
+
+    async def button_task(self):
+        while True:
+            self.delay_ctrl.update()
+            await asyncio.sleep(BUTTON_POLL_SECONDS)
 
-def get_poll_interval_seconds(state: str | None) -> int:
-    if state in ("LIVE", "CRIT"):
-        return 2
-    if state == "PRE":
-        return 60
-    # OFF, FINAL, unknown, no game
-    return 600
+    async def lcd_task(self):
+        while True:
+            msg = await self.lcd_queue.get()
+            try:
+                if msg[0] == "text":
+                    await asyncio.to_thread(self.lcd.show_text, msg[1], msg[2])
+                else:
+                    await asyncio.to_thread(self.lcd.show_delay_only, msg[1])
+            except Exception as e:
+                log(f"LCD error: {e}")
 
-def main():
-    log("Script started.")
+    async def animation_task(self):
+        while True:
+            name, fn, on_error, done = await self.anim_queue.get()
+            try:
+                await asyncio.to_thread(fn)
+            except Exception as e:
+                log(f"{name} error: {e}")
+                if on_error:
+                    on_error(e)
+            finally:
+                if not done.done():
+                    done.set_result(None)
+
+    async def poll_task(self):
+        while True:
+            try:
+                self.poll_interval = await self.poll_once()
+            except Exception as e:
+                log(f"ERROR in main loop: {e}")
+                err_msg = str(e)[:config.LCD_COLS]
+                self.show_text("SCRIPT ERROR", err_msg)
+            await asyncio.sleep(self.poll_interval)
+
+    # ---------------- polling ----------------
+
+    async def seconds_until_warmup(self):
+        """Smallest warm-up wait over the watched teams (None if any schedule is unknown)."""
+        waits = await asyncio.gather(*(asyncio.to_thread(seconds_until_warmup, t) for t in self.teams))
+        if any(w is None for w in waits):
+            return None
+        return min(waits)
+
+    async def poll_once(self) -> float:
+        """One scoreboard fetch + goal checks for every watched team. Returns seconds until the next poll."""
+        # ------------- OFF-DAY (SCHEDULE) -------------
+        # nothing to fetch until the warm-up window before the next puck drop
+        wait = await self.seconds_until_warmup()
+        if wait:
+            self.show_no_game(await self.next_game_text(), wait)
+            return wait
+
+        # one /score/now for all watched teams
+        payloads = await asyncio.to_thread(fetch_games_now, self.teams)
+
+        # schedule unknown -> blind re-poll, game expected now -> re-check soon
+        no_game_wait = NO_GAME_POLL_SECONDS if wait is None else NO_GAME_RECHECK_SECONDS
+        games_now = self.apply_scoreboard(payloads, no_game_wait)
+        if games_now is None:
+            # circuit open: wait for the next probe instead of retrying at a fixed rate
+            retry_in = max(p.retry_in for p in payloads.values())
+            return max(config.POLL_INTERVAL_SECONDS, retry_in)
+        if not games_now:
+            return no_game_wait
+
+        # ------------- GOALS (per game) -------------
+        intervals = []
+        for game, data, teams in self.track_games(games_now):
+            intervals.append(await self.check_game(game, data, teams))
+
+        return min(intervals) if intervals else config.POLL_INTERVAL_SECONDS
+
+    def apply_scoreboard(self, payloads, no_game_wait: float):
+        """
+        Per-team display updates for one scoreboard (polled or pushed).
+        Returns {game id: (data, [watched teams in it])}, {} for no game, None on error.
+        """
+        # ------------- ERROR -------------
+        if not any(p.ok for p in payloads.values()):
+            log("Backend returned ok=false")
+            self.show_text("BACKEND ERR", "ok=false")
+            return None
+
+        # ------------- NO GAME -------------
+        if all(p.no_game for p in payloads.values()):
+            msg = next(iter(payloads.values())).message if len(self.teams) == 1 else "No watched games"
+            log(f"No game: {msg}")
+            self.show_no_game(msg, no_game_wait)
+            return {}
+
+        # ------------- GAME DATA (per team) -------------
+        lcd_line = None
+        stale_age = None    # seconds, when the scoreboard is the last good one (API down)
+        games_now = {}      # game id -> (data, [watched teams in it])
+        for team in self.teams:
+            data = payloads[team]
+            watch = self.watches[team]
+            if not data.ok or data.no_game:
+                self.reset_team(watch)
+                continue
+
+            watch.data = data
+            if data.stale:
+                stale_age = data.age_seconds or 0
+            if lcd_line is None:
+                lcd_line = data.score_line
+
+            game_id = data.id
+            games_now.setdefault(game_id, (data, []))[1].append(team)
+
+            # ------------- NEW GAME -------------
+            if game_id and game_id != watch.game_id:
+                log(f"New game detected for {team}: {game_id}")
+                log(f"HTTP pool stats: {get_http_stats()}")
+                self.reset_team(watch)
+                watch.game_id = game_id
+
+            # ------------- EMOJI AT GAME START (ONCE) -------------
+            if game_id and watch.emoji_shown_for_game_id != game_id:
+                try:
+                    emoji, efg, ebg = pick_emoji_and_colors(data, team)
+                    self.play_emoji(emoji, efg, ebg, f"game start {team}")
+                    watch.emoji_shown_for_game_id = game_id
+                except Exception as e:
+                    log(f"Emoji start display error: {e}")
+
+        if stale_age is not None:
+            log(f"API down, showing scoreboard from {stale_age}s ago")
+
+        if lcd_line and not self.alerts_active:
+            if stale_age is not None:
+                age = f"{stale_age}s" if stale_age < 120 else f"{stale_age // 60}m"
+                self.show_text(lcd_line, f"OLD DATA {age}")
+            else:
+                self.show_text(lcd_line, "")
+                self.show_delay()
+
+        return games_now
+
+    def track_games(self, games_now):
+        """(GameWatch, data, teams) per current game; forgets games nobody watches anymore."""
+        for gid in [g for g in self.games if g not in games_now]:
+            del self.games[gid]
+        out = []
+        for game_id, (data, teams) in games_now.items():
+            game = self.games.get(game_id)
+            if game is None:
+                game = self.games[game_id] = GameWatch(game_id)
+            out.append((game, data, teams))
+        return out
+
+    async def check_game(self, game: GameWatch, data: GameSnapshot, teams) -> float:
+        """Goal detection for one game. Returns the poll interval this game wants."""
+        home_score = data.home.score
+        away_score = data.away.score
+        log(f"Score Update: {data.score_line}")
+
+        game_id = game.game_id
+        state = data.state
+        interval = game.scheduler.next_interval(data)
+        log(f"Game state: {state}, Poll interval: {interval}s ({game.scheduler.reason})")
+
+        # ------------- GOALS, PHASE 1 (SCOREBOARD) -------------
+        self.score_alerts(game, data, teams)
+
+        # ------------- GOALS, PHASE 2 (SCORER / JERSEY NUMBER) -------------
+        # play-by-play is the big request: only pull it when the score totals
+        # moved (or for the slow reconciliation check)
+        if game_id and state in ("LIVE", "CRIT", "PRE", "OFF") and \
+                game.pbp_gate.should_fetch(game_id, home_score, away_score):
+            goals_payload = await asyncio.to_thread(fetch_goals, game_id)
+
+            if goals_payload.get("ok"):
+                goals_list = goals_payload.get("goals") or []
+                goal_count = len(goals_list)
+                game.pbp_gate.mark_fetched(game_id, home_score, away_score, goal_count)
+
+                # baseline init
+                if game.goal_ids is None:
+                    game.goal_ids = {g.event_id for g in goals_list}
+                    game.goal_score = _score_after(goals_list)
+
+                # diff by event id, not by count: a goal taken back (challenge /
+                # review) and a new one between two fetches leave the count alone
+                else:
+                    removed = goals_payload.get("removedGoals") or []
+                    for g in removed:
+                        game.goal_ids.discard(g.event_id)
+                        self.goal_removed(game, g)
+                    if removed:
+                        game.goal_score = _score_after([g for g in goals_list if g.event_id in game.goal_ids])
+
+                    # new goal(s): enrich the alerts already running, polling continues
+                    new_goals = [g for g in goals_list if g.event_id not in game.goal_ids]
+                    if new_goals:
+                        game.goal_ids.update(g.event_id for g in new_goals)
+                        self.goal_alerts(game, data, new_goals, teams)
+
+        return interval
+
+    def score_alerts(self, game: GameWatch, data: GameSnapshot, teams):
+        """Phase 1: a /score/now total went up -> alert right away, scorer unknown yet."""
+        now = time.monotonic()
+        game.pending = [a for a in game.pending if (now - a.created) < PENDING_ALERT_SECONDS]
+        game.recent = [a for a in game.recent if (now - a.created) < PENDING_ALERT_SECONDS]
+
+        scores = {side: data.side(side).score for side in ("home", "away")}
+        if game.alerted is None:
+            game.alerted = scores
+            return
+
+        for side, score in scores.items():
+            if score < game.alerted[side]:
+                # goal taken back: the next one must alert again, a countdown for it stops
+                game.alerted[side] = score
+                for a in game.recent:
+                    if a.side == side and (a.score_after or 0) > score:
+                        a.take_back()
+            while game.alerted[side] < score:
+                game.alerted[side] += 1
+                team = (data.side(side).abbr or "").upper()
+                alert = GoalAlert(team, side, game.alerted[side])
+                game.pending.append(alert)
+                game.recent.append(alert)
+                log(f"Score change: {team} {game.alerted[side]}, alerting before the play-by-play")
+                self.route_alert(alert, teams)
+
+    def goal_alerts(self, game: GameWatch, data: GameSnapshot, goals, teams):
+        """Phase 2: play-by-play goals enrich the pending alerts (or alert, if they beat the scoreboard)."""
+        for goal in goals:
+            side = self.goal_side(game, data, goal)
+            if goal.home_score is not None and goal.away_score is not None:
+                game.goal_score = (goal.home_score, goal.away_score)
+            if side is None:
+                log(f"Goal {goal.event_id}: can't tell which side scored, no alert")
+                continue
+            team = (data.side(side).abbr or "").upper()
+            score_after = goal.score_for(side)
+
+            candidates = [a for a in game.pending if a.side == side]
+            if score_after is None:
+                alert = candidates[0] if len(candidates) == 1 else None
+            else:
+                alert = next((a for a in candidates if a.score_after == score_after), None)
+            if alert is not None:
+                game.pending.remove(alert)
+                alert.enrich(goal)
+                log(f"Goal enriched: {alert.scorer.full_name} #{alert.scorer.number}")
+                continue
+
+            # play-by-play listed it before /score/now moved
+            if game.alerted is not None and score_after is not None:
+                game.alerted[side] = max(game.alerted[side], score_after)
+            alert = GoalAlert(team, side, score_after, goal)
+            game.recent.append(alert)
+            self.route_alert(alert, teams)
+
+    def goal_side(self, game: GameWatch, data: GameSnapshot, goal: Goal):
+        """
+        "home" / "away" for a play-by-play goal: the side whose score went up since
+        the previous goal, else the scorer's team, else the one pending scoreboard
+        alert with that score. None when nothing says.
+        """
+        if game.goal_score is not None and goal.home_score is not None and goal.away_score is not None:
+            home, away = game.goal_score
+            if goal.home_score > home and goal.away_score <= away:
+                return "home"
+            if goal.away_score > away and goal.home_score <= home:
+                return "away"
+        scorer_team = ((goal.scorer.team if goal.scorer else None) or "").upper()
+        for side in ("home", "away"):
+            if scorer_team and scorer_team == (data.side(side).abbr or "").upper():
+                return side
+        sides = {a.side for a in game.pending if a.score_after is not None and a.score_after == goal.score_for(a.side)}
+        return sides.pop() if len(sides) == 1 else None
+
+    def goal_removed(self, game: GameWatch, goal: Goal):
+        log(f"Goal removed: {goal.scorer.full_name if goal.scorer else None} ({goal.event_id})")
+        for a in game.recent:
+            if a.goal is not None and a.goal.event_id == goal.event_id:
+                a.take_back()
+
+    def route_alert(self, alert: GoalAlert, teams):
+        """
+        Pick whose point of view the alert is shown from. If both teams of the game
+        are watched, only the scoring team celebrates (no extra sad emoji).
+        """
+        targets = [alert.team] if alert.team in teams else teams
+        for team in targets:
+            self.spawn(self.goal_alert(alert, self.watches[team]))
+
+    # ---------------- subscriber mode ----------------
+
+    async def subscribe_task(self):
+        """Pushed events from event_server.py instead of polling (the server does goal detection)."""
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        def on_event(name, data):
+            loop.call_soon_threadsafe(events.put_nowait, (name, data))
+
+        threading.Thread(
+            target=event_client.listen, args=(config.EVENTS_URL, self.teams, on_event),
+            name="events", daemon=True,
+        ).start()
 
-    lcd = LcdDisplay()
-    leds = LedController()
-    delay_ctrl = DelayController(lcd)
+        while True:
+            name, data = await events.get()
+            try:
+                self.handle_event(name, data)
+            except Exception as e:
+                log(f"Event {name} error: {e}")
+
+    def current_games(self):
+        """{game id: (data, [watched teams in it])} from the last scoreboard."""
+        games = {}
+        for team, watch in self.watches.items():
+            if watch.game_id and watch.data:
+                games.setdefault(watch.game_id, (watch.data, []))[1].append(team)
+        return games
+
+    def handle_event(self, name: str, data):
+        if name == "scoreboard":
+            board = data.get("teams") or {}
+            payloads = {
+                t: GameSnapshot.from_dict(board[t]) if board.get(t)
+                else GameSnapshot(no_game=True, message="Not on event server")
+                for t in self.teams
+            }
+            games_now = self.apply_scoreboard(payloads, 0) or {}
+            for game, game_data, teams in self.track_games(games_now):
+                self.score_alerts(game, game_data, teams)
+
+        elif name == "goal":
+            game_id = str(data.get("gameId"))
+            for game, game_data, teams in self.track_games(self.current_games()):
+                if str(game.game_id) == game_id:
+                    self.goal_alerts(game, game_data, [Goal.from_dict(data.get("goal"))], teams)
+
+        elif name == "goal_removed":
+            game_id = str(data.get("gameId"))
+            g = Goal.from_dict(data.get("goal"))
+            game = next((gw for gw in self.games.values() if str(gw.game_id) == game_id), None)
+            if game is not None:
+                self.goal_removed(game, g)
+            else:
+                log(f"Goal removed: {g.scorer.full_name if g.scorer else None} ({g.event_id})")
+
+        elif name == "disconnected":
+            self.show_text("EVENTS OFFLINE", "Reconnecting...")
+
+        elif name == "connected" and data.get("resumed"):
+            # a resume only replays missed events (no snapshot, no scoreboard unless it
+            # changed): put the score line back over "EVENTS OFFLINE"
+            self.show_board()
+
+    # ---------------- goal alert ----------------
+
+    async def goal_alert(self, alert: GoalAlert, watch: TeamWatch):
+        self.alerts_active += 1
+        try:
+            await self._goal_alert(alert, watch)
+        finally:
+            self.alerts_active -= 1
+
+    def alert_jersey(self, alert: GoalAlert):
+        """Jersey number once the play-by-play (or the landing-page lookup) has it, else None."""
+        scorer = alert.scorer
+        jersey = scorer.number
+        if jersey is None and scorer.id:
+            resolved = get_cached_player(scorer.id)
+            if resolved and resolved.get("number") is not None:
+                jersey = resolved.get("number")
+                log(f"Jersey resolved from player cache: #{jersey}")
+        return jersey
+
+    async def prepare_goal_show(self, alert: GoalAlert, fg, bg):
+        """
+        Render the goal show in a worker thread while the countdown runs. A jersey
+        that turns up during the render gets its matrix animation right after.
+        """
+        t0 = time.monotonic()
+        rendered = ()
+        try:
+            while True:
+                jersey = self.alert_jersey(alert)
+                n = int(jersey) if jersey is not None else None
+                if n == rendered:
+                    break
+                await asyncio.to_thread(self.leds.prepare_goal_show, n, fg, bg)
+                rendered = n
+            log(f"Goal show pre-rendered in {time.monotonic() - t0:.2f}s (jersey={n})")
+        except Exception as e:
+            log(f"Goal show pre-render error: {e}")
+
+    def show_scorer(self, alert: GoalAlert, line1: str):
+        jersey = self.alert_jersey(alert)
+        name = alert.scorer.last_name
+        self.show_text(line1, f"#{jersey} {name}" if jersey is not None else name)
+
+    async def _goal_alert(self, alert: GoalAlert, watch: TeamWatch):
+        scorer_team = alert.team
+        my_team = watch.team
+
+        log(f"GOAL DETECTED! scorer={alert.scorer.full_name or None} jersey={alert.scorer.number} team={scorer_team}")
+
+        # countdown then backlight animation (button keeps working in its own task).
+        # Starts on the score change; the scorer is patched onto the LCD when the
+        # play-by-play catches up. The delay runs from the score change on the
+        # monotonic clock; our goal show renders meanwhile so it starts at zero.
+        delay = max(0.0, float(self.delay_ctrl.get_delay()))
+        deadline = alert.created + delay
+        local_delay = max(0, math.ceil(deadline - time.monotonic()))
+        self.show_text("GOAL DETECTED", f"Wait {local_delay}s")
+        log(f"Waiting {local_delay}s before triggering animation...")
+
+        own_goal = not scorer_team or scorer_team == my_team
+        fg_color, bg_color = get_team_colors(scorer_team or my_team)
+        prep = self.spawn(self.prepare_goal_show(alert, fg_color, bg_color)) if own_goal else None
+
+        patched = alert.goal is not None
+        for i in range(local_delay, 0, -1):
+            if alert.removed:
+                break
+            log(f"Countdown: {i}s remaining")
+            tick_end = deadline - (i - 1)
+            if not patched:
+                try:
+                    await asyncio.wait_for(alert.enriched.wait(), max(0.0, tick_end - time.monotonic()))
+                    patched = True
+                    self.show_scorer(alert, f"GOAL {scorer_team} {i}s")
+                    if own_goal and prep.done():
+                        # jersey known after the render: add its matrix animation
+                        # (a render still running picks the jersey up itself)
+                        prep = self.spawn(self.prepare_goal_show(alert, fg_color, bg_color))
+                except asyncio.TimeoutError:
+                    continue
+            await asyncio.sleep(max(0.0, tick_end - time.monotonic()))
 
-    lcd.show_text("NHL SCORE", "Starting...")
-    time.sleep(1)
-    lcd.show_delay_only(delay_ctrl.get_delay())
+        if alert.removed:
+            if prep is not None:
+                prep.cancel()
+            log("Goal taken back during the countdown, no goal show")
+            return
 
-    last_game_id = None
-    last_goal_count = None
+        if prep is not None:
+            if not prep.done():
+                log("Goal show still rendering at zero, waiting for it")
+            await prep
 
-    emoji_due_at = None
-    emoji_shown_for_game_id = None
-    current_poll_interval = config.POLL_INTERVAL_SECONDS
+        if not own_goal:
+            self.show_text("GOAL AGAINST", f"{scorer_team} scored")
+            try:
+                # use your team colors (or swap to scorer_team if you prefer)
+                fg, bg = get_team_colors(scorer_team)
 
-    try:
-        while True:
+                def sad():
+                    self.leds.matrix.emoji_animation("sad", fg=fg, bg=bg, pulses=4)
+                    log("Opponent goal -> sad emoji shown. (No jersey / no flash)")
+
+                await self.play(
+                    "Opponent sad emoji", sad,
+                    on_error=lambda e: self.show_text("GOAL AGAINST", "EMOJI ERR"),
+                )
+            except Exception as e:
+                log(f"Opponent sad emoji error: {e}")
+                self.show_text("GOAL AGAINST", "EMOJI ERR")
+
+            # ✅ still schedule the "state of the game" emoji 20s later
+            self.schedule_emoji(watch, EMOJI_AFTER_GOAL_SECONDS)
+            log("Score-based emoji scheduled in 20 seconds (after opponent goal).")
+            return
+
+        jersey = self.alert_jersey(alert)
+
+        if jersey is None:
+            # scorer still unknown: celebrate on the backlight first, the
+            # play-by-play usually lands while it runs
+            self.show_text("GOAL!!!", f"{scorer_team} scored")
+            await self.play(
+                "Backlight goal",
+                lambda: self.leds.backlight.goal_animation_combo(team=fg_color, accent=bg_color, duration=GOAL_COMBO_SECONDS),
+            )
+            if not alert.enriched.is_set():
+                try:
+                    await asyncio.wait_for(alert.enriched.wait(), ENRICH_WAIT_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+            jersey = self.alert_jersey(alert)
+            if jersey is not None:
+                try:
+                    jersey_int = int(jersey)
+                    self.show_scorer(alert, "GOAL!!!")
+                    await self.play(
+                        "Matrix jersey display",
+                        lambda: self.leds.matrix.goal_number_animation(jersey_int, fg=fg_color, bg=bg_color),
+                        on_error=lambda e: self.show_text("GOAL!!!", "JERSEY ERR"),
+                    )
+                except Exception as e:
+                    log(f"Matrix jersey display error: {e}")
+                    self.show_text("GOAL!!!", "JERSEY ERR")
+            else:
+                self.show_text("GOAL!!!", "JERSEY N/A")
+
+        else:
             try:
-                data = fetch_game_now(config.TEAM_ABBR)
-                delay_ctrl.update()
-
-                # ------------- NO GAME -------------
-                if data.get("noGame"):
-                    msg = data.get("message", "")
-                    log(f"No game: {msg}")
-                    lcd.show_text("NO GAME", msg[:config.LCD_COLS])
-                    lcd.show_delay_only(delay_ctrl.get_delay())
-
-                    last_game_id = None
-                    last_goal_count = None
-                    emoji_due_at = None
-                    emoji_shown_for_game_id = None
-
-                    current_poll_interval = 1200  # 10 minutes when no game
-                    t_end = time.time() + current_poll_interval
-                    while time.time() < t_end:
-                        delay_ctrl.update()
-                        time.sleep(0.05)
-                    continue
+                jersey_int = int(jersey)
+
+                self.show_scorer(alert, "GOAL!!!")
+                await self.play(
+                    "Matrix jersey display",
+                    lambda: self.leds.goal_matrix_animation(jersey_int, fg=fg_color, bg=bg_color),
+                    on_error=lambda e: self.show_text("GOAL!!!", "JERSEY ERR"),
+                )
+            except Exception as e:
+                log(f"Matrix jersey display error: {e}")
+                self.show_text("GOAL!!!", "JERSEY ERR")
 
-                # ------------- ERROR -------------
-                if not data.get("ok"):
-                    log("Backend returned ok=false")
-                    lcd.show_text("BACKEND ERR", "ok=false")
-                    t_end = time.time() + config.POLL_INTERVAL_SECONDS
-                    while time.time() < t_end:
-                        delay_ctrl.update()
-                        time.sleep(0.05)
-                    continue
+        self.show_text("GOAL!!!", "GO HABS GO")
 
-                # ------------- GAME DATA -------------
-                home = data.get("home") or {}
-                away = data.get("away") or {}
-
-                home_score = int(home.get("score", 0))
-                away_score = int(away.get("score", 0))
-
-                line1 = f"{home.get('abbr')} {home_score}-{away_score} {away.get('abbr')}"
-                lcd.show_text(line1, "")
-                lcd.show_delay_only(delay_ctrl.get_delay())
-                log(f"Score Update: {line1}")
-
-                game_id = data.get("id")
-                state = data.get("state")
-                current_poll_interval = get_poll_interval_seconds(state)
-                log(f"Game state: {state}, Poll interval: {current_poll_interval}s")
-
-                # ------------- NEW GAME -------------
-                if game_id and game_id != last_game_id:
-                    log(f"New game detected: {game_id}")
-                    last_game_id = game_id
-                    last_goal_count = None
-                    emoji_shown_for_game_id = None
-                    emoji_due_at = None
-
-                # ------------- EMOJI AT GAME START (ONCE) -------------
-                if game_id and emoji_shown_for_game_id != game_id:
-                    try:
-                        emoji, efg, ebg = pick_emoji_and_colors(data, config.TEAM_ABBR)
-                        leds.matrix.emoji_animation(emoji, fg=efg, bg=ebg, pulses=4)
-                        emoji_shown_for_game_id = game_id
-                        log(f"Emoji shown at game start: {emoji}")
-                    except Exception as e:
-                        log(f"Emoji start display error: {e}")
-
-                # ------------- GOALS (JERSEY NUMBER) -------------
-                if game_id and state in ("LIVE", "CRIT", "PRE", "OFF"):
-                    goals_payload = fetch_goals(game_id)
-
-                    if goals_payload.get("ok"):
-                        goals_list = goals_payload.get("goals") or []
-                        goal_count = len(goals_list)
-
-                        # baseline init
-                        if last_goal_count is None:
-                            last_goal_count = goal_count
-
-                        # new goal(s)
-                        elif goal_count > last_goal_count:
-                            new_goals = goals_list[last_goal_count:]
-                            last_goal_count = goal_count
-
-                            last_goal = new_goals[-1]
-                            scorer = last_goal.get("scorer") or {}
-
-                            jersey = scorer.get("number")
-                            scorer_team = (scorer.get("team") or "").upper()
-                            my_team = (config.TEAM_ABBR or "").upper()
-
-                            log(f"GOAL DETECTED! scorer={scorer.get('fullName')} jersey={jersey} team={scorer_team}")
-
-                            # countdown then backlight animation
-                            local_delay = int(round(delay_ctrl.get_delay()))
-                            local_delay = max(0, local_delay)
-                            lcd.show_text("GOAL DETECTED", f"Wait {local_delay}s")
-                            log(f"Waiting {local_delay}s before triggering animation...")
-                            for i in range(local_delay, 0, -1):
-                                log(f"Countdown: {i}s remaining")
-                                # keep button responsive during countdown
-                                t_end = time.time() + 1
-                                while time.time() < t_end:
-                                    delay_ctrl.update()
-                                    time.sleep(0.05)
-
-                            if scorer_team and scorer_team != my_team:
-                                lcd.show_text("GOAL AGAINST", f"{scorer_team} scored")
-                                try:
-                                    # use your team colors (or swap to scorer_team if you prefer)
-                                    fg, bg = get_team_colors(scorer_team)
-                                    leds.matrix.emoji_animation("sad", fg=fg, bg=bg, pulses=4)
-                                    log("Opponent goal -> sad emoji shown. (No jersey / no flash)")
-                                except Exception as e:
-                                    log(f"Opponent sad emoji error: {e}")
-                                    lcd.show_text("GOAL AGAINST", "EMOJI ERR")
-
-                                # ✅ still schedule the "state of the game" emoji 20s later
-                                emoji_due_at = time.time() + 20
-                                log("Score-based emoji scheduled in 20 seconds (after opponent goal).")
-
-                                continue
-
-                            if jersey is not None and scorer_team:
-                                try:
-                                    jersey_int = int(jersey)
-                                    fg_color, bg_color = get_team_colors(scorer_team)
-
-                                    lcd.show_text("GOAL!!!", f"{scorer_team} #{jersey_int}")
-                                    leds.goal_matrix_animation(jersey_int, fg=fg_color, bg=bg_color)
-
-                                except Exception as e:
-                                    log(f"Matrix jersey display error: {e}")
-                                    lcd.show_text("GOAL!!!", "JERSEY ERR")
-                            else:
-                                lcd.show_text("GOAL!!!", "JERSEY N/A")
-
-                            lcd.show_text("GOAL!!!", "GO HABS GO")
-
-                            # ✅ schedule emoji 20s AFTER goal animation
-                            emoji_due_at = time.time() + 20
-                            log("Emoji scheduled in 20 seconds after goal animation.")
-
-                # ------------- SCHEDULED EMOJI (ONCE) -------------
-                if emoji_due_at is not None and time.time() >= emoji_due_at:
-                    try:
-                        emoji, efg, ebg = pick_emoji_and_colors(data, config.TEAM_ABBR)
-                        leds.matrix.emoji_animation(emoji, fg=efg, bg=ebg, pulses=4)
-                        log(f"Emoji shown (scheduled): {emoji}")
-                    except Exception as e:
-                        log(f"Emoji scheduled display error: {e}")
-                    finally:
-                        emoji_due_at = None
+        # ✅ schedule emoji 20s AFTER goal animation
+        self.schedule_emoji(watch, EMOJI_AFTER_GOAL_SECONDS)
+        log("Emoji scheduled in 20 seconds after goal animation.")
 
-            except Exception as e:
-                log(f"ERROR in main loop: {e}")
-                err_msg = str(e)[:config.LCD_COLS]
-                lcd.show_text("SCRIPT ERROR", err_msg)
+    # ---------------- entry ----------------
+
+    async def run(self):
+        self.lcd_queue = asyncio.Queue()
+        self.anim_queue = asyncio.Queue()
+
+        tasks = [
+            asyncio.create_task(self.button_task()),
+            asyncio.create_task(self.lcd_task()),
+            asyncio.create_task(self.animation_task()),
+        ]
+
+        self.show_text("NHL SCORE", "Starting...")
+        await asyncio.sleep(1)
+        self.show_delay()
+
+        if config.EVENTS_URL:
+            tasks.append(asyncio.create_task(self.subscribe_task()))
+        else:
+            tasks.append(asyncio.create_task(self.poll_task()))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in (*tasks, *self.tasks):
+                task.cancel()
 
-            t_end = time.time() + current_poll_interval
-            while time.time() < t_end:
-                delay_ctrl.update()
-                time.sleep(0.05)
+    def shutdown(self):
+        log(f"HTTP pool stats: {get_http_stats()}")
+        flush_player_cache()
+        self.lcd.clear()
+        self.leds.turn_off()
+        self.lcd.close()
 
+
+def main():
+    log("Script started.")
+    runtime = Runtime()
+    try:
+        asyncio.run(runtime.run())
     except KeyboardInterrupt:
         log("Script interrupted by user.")
-        lcd.clear()
-        leds.turn_off()
-        lcd.close()
+        runtime.shutdown()
 
 
 if __name__ == "__main__":
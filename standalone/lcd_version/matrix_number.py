@@ -2,6 +2,9 @@
 from rpi_ws281x import PixelStrip, Color
 import time
 import random
+from array import array
+
+from framebuffer import Animation, AnimationCache, FrameBuffer, TYPECODE
 
 
 
@@ -86,10 +89,43 @@ def _digit_size(digits_map):
     w = len(any_digit[0]) if h else 0
     return w, h
 
+# ------------ COMPILED GLYPHS ------------
+# The string art above is the source; drawing uses these, compiled once.
+class Glyph:
+    """'0'/'1' rows compiled once: size + the lit (x, y) cells."""
+    __slots__ = ("w", "h", "rows", "cells")
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.h = len(rows)
+        self.w = len(rows[0]) if rows else 0
+        self.cells = tuple((x, y) for y, row in enumerate(rows) for x, ch in enumerate(row) if ch == "1")
+
+def _compile_glyphs(bitmaps):
+    return {k: Glyph(rows) for k, rows in bitmaps.items()}
+
+DIGIT_GLYPHS = _compile_glyphs(DIGITS_6x9)
+EMOJI_GLYPHS = _compile_glyphs(EMOJIS_15x12)
+
+BLIT_CACHE_MAX = 256     # (glyph, x, y) -> LED indices, per display
+
+# ------------ PRE-RENDERED ANIMATIONS ------------
+ANIM_CACHE_MAX_BYTES = 256 * 1024    # rendered goal animations kept, per display
+ROTATIONS = (0, 90, 180, 270)        # clockwise; 90/270 need room for two digits
+
 class MatrixNumberDisplay:
     """
     One instance = one LED matrix wiring/layout config.
     Call .show_number(n, fg=(r,g,b), bg=(r,g,b)).
+
+    rotation (0/90/180/270, clockwise) turns the picture on top of the wiring;
+    90/270 swap width and height, only allowed when a two-digit number still
+    fits the turned canvas (not on the 15x12: 13 wide vs 12). The mapping is
+    compiled once into self._lut[y * w + x] -> LED index, the draw paths only
+    index it.
+    Frames are drawn into self.fb (framebuffer.py) and show() pushes them:
+    one bulk copy + one strip.show() per frame. Glyphs are drawn from their
+    lit LED indices at that position (computed on first use, then cached).
     """
     def __init__(
         self,
@@ -103,13 +139,18 @@ class MatrixNumberDisplay:
         led_channel=0,
         serpentine=True,
         digits_map=DIGITS_6x9,
+        rotation=0,             # 0/90/180/270 clockwise
     ):
-        self.w = matrix_width
-        self.h = matrix_height
+        # panel = physical grid, w/h = drawing canvas (swapped at 90/270)
+        self.panel_w = matrix_width
+        self.panel_h = matrix_height
         self.serpentine = serpentine
         self.digits = digits_map
+        self.digit_w, self.digit_h = _digit_size(self.digits)
+        self.digit_glyphs = DIGIT_GLYPHS if digits_map is DIGITS_6x9 else _compile_glyphs(digits_map)
+        self._set_rotation(rotation)
 
-        self.led_count = self.w * self.h
+        self.led_count = self.panel_w * self.panel_h
         self.strip = PixelStrip(
             self.led_count,
             led_pin,
@@ -120,39 +161,87 @@ class MatrixNumberDisplay:
             led_channel,
         )
         self.strip.begin()
-
-        self.digit_w, self.digit_h = _digit_size(self.digits)
-
+        self.fb = FrameBuffer(self.strip)
+
+
+    def _set_rotation(self, rotation):
+        """Canvas for this rotation + its index table (drops the cached blits/animations)."""
+        if rotation not in ROTATIONS:
+            raise ValueError("rotation must be 0/90/180/270")
+        w, h = (self.panel_h, self.panel_w) if rotation in (90, 270) else (self.panel_w, self.panel_h)
+        need_w = self.digit_w * 2 + 1
+        if need_w > w or self.digit_h > h:
+            raise ValueError(
+                f"rotation {rotation}: a two-digit number ({need_w}x{self.digit_h}) won't fit the "
+                f"turned {w}x{h} canvas of this {self.panel_w}x{self.panel_h} matrix. "
+                f"Set MATRIX_ROTATION to 0 or 180."
+            )
+        self.rotation = rotation
+        self.w, self.h = w, h
+        self._lut = self._build_lut()
+        self._blits = {}
+        self._anims = AnimationCache(ANIM_CACHE_MAX_BYTES)
 
     def _xy_to_index(self, x, y):
+        # reference mapping, only _build_lut() calls it
+        pw, ph = self.panel_w, self.panel_h
+        if self.rotation == 90:
+            x, y = pw - 1 - y, x
+        elif self.rotation == 180:
+            x, y = pw - 1 - x, ph - 1 - y
+        elif self.rotation == 270:
+            x, y = y, ph - 1 - x
+
         # rotate display 180°
-        x = self.w - 1 - x
-        y = self.h - 1 - y
+        x = pw - 1 - x
+        y = ph - 1 - y
 
         # serpentine mapping based on the (rotated) row
         if self.serpentine and (y % 2 == 1):
-            x = self.w - 1 - x
+            x = pw - 1 - x
 
-        return y * self.w + x
+        return y * pw + x
+
+    def _build_lut(self):
+        """Flat canvas -> LED index table: lut[y * w + x]."""
+        return [self._xy_to_index(x, y) for y in range(self.h) for x in range(self.w)]
 
     def _set_pixel(self, x, y, color):
         if 0 <= x < self.w and 0 <= y < self.h:
-            self.strip.setPixelColor(self._xy_to_index(x, y), color)
+            self.fb.buf[self._lut[y * self.w + x]] = color
+
+    def show(self):
+        """Frame buffer -> LEDs."""
+        self.fb.push()
 
     def fill(self, color):
-        c = _to_color(color)
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, c)
-        self.strip.show()
+        self.fb.fill(_to_color(color))
+        self.show()
 
     def clear(self):
         self.fill((0, 0, 0))
 
-    def _draw_bitmap(self, bitmap_rows, x0, y0, fg_color):
-        for y, row in enumerate(bitmap_rows):
-            for x, ch in enumerate(row):
-                if ch == "1":
-                    self._set_pixel(x0 + x, y0 + y, fg_color)
+    def _glyph_indices(self, glyph, x0, y0):
+        """LED indices of the lit cells of glyph drawn at (x0, y0), clipped."""
+        key = (glyph, x0, y0)
+        idx = self._blits.get(key)
+        if idx is None:
+            if len(self._blits) >= BLIT_CACHE_MAX:
+                self._blits.clear()
+            lut, w, h = self._lut, self.w, self.h
+            idx = self._blits[key] = [
+                lut[(y0 + y) * w + x0 + x]
+                for x, y in glyph.cells
+                if 0 <= x0 + x < w and 0 <= y0 + y < h
+            ]
+        return idx
+
+    def _draw_bitmap(self, glyph, x0, y0, fg_color, px=None):
+        """Into the frame buffer, or into px (a packed frame)."""
+        if px is None:
+            px = self.fb.buf
+        for i in self._glyph_indices(glyph, x0, y0):
+            px[i] = fg_color
 
     def show_number(self, n: int, fg=(255, 255, 255), bg=(0, 0, 30), gap=1):
         """
@@ -174,43 +263,44 @@ class MatrixNumberDisplay:
         y0 = (self.h - total_h) // 2
 
         # background
-        self.fill(bg_c)
+        self._fill_no_show(bg_c)
 
         # digits
         if len(s) == 1:
-            self._draw_bitmap(self.digits[s], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[s], x0, y0, fg_c)
         else:
             d1, d2 = s[0], s[1]
-            self._draw_bitmap(self.digits[d1], x0, y0, fg_c)
-            self._draw_bitmap(self.digits[d2], x0 + self.digit_w + gap, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d1], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d2], x0 + self.digit_w + gap, y0, fg_c)
 
-        self.strip.show()
+        self.show()
 
     def _fill_no_show(self, color_int):
-        for i in range(self.strip.numPixels()):
-            self.strip.setPixelColor(i, color_int)
+        self.fb.fill(color_int)
 
     def _set_pixel_no_bounds(self, x, y, color_int):
-        self.strip.setPixelColor(self._xy_to_index(x, y), color_int)
+        self.fb.buf[self._lut[y * self.w + x]] = color_int
 
     def _wipe_bg(self, bg_color, direction="lr", step_delay=0.01):
         bg_c = _to_color(bg_color)
+        lut, w, h = self._lut, self.w, self.h
+        px = self.fb.buf
 
         if direction == "lr":
-            for x in range(self.w):
-                for y in range(self.h):
-                    self._set_pixel(x, y, bg_c)
-                self.strip.show()
+            for x in range(w):
+                for i in range(x, w * h, w):
+                    px[lut[i]] = bg_c
+                self.show()
                 time.sleep(step_delay)
 
         elif direction == "tb":
-            for y in range(self.h):
-                for x in range(self.w):
-                    self._set_pixel(x, y, bg_c)
-                self.strip.show()
+            for y in range(h):
+                for i in range(y * w, (y + 1) * w):
+                    px[lut[i]] = bg_c
+                self.show()
                 time.sleep(step_delay)
 
-    def _draw_number_at(self, n: int, x0: int, y0: int, fg_color, gap=1):
+    def _draw_number_at(self, n: int, x0: int, y0: int, fg_color, gap=1, px=None):
         s = str(n)
         if not s.isdigit() or len(s) > 2:
             return
@@ -218,25 +308,23 @@ class MatrixNumberDisplay:
         fg_c = _to_color(fg_color)
 
         if len(s) == 1:
-            self._draw_bitmap(self.digits[s], x0, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[s], x0, y0, fg_c, px)
         else:
             d1, d2 = s[0], s[1]
-            self._draw_bitmap(self.digits[d1], x0, y0, fg_c)
-            self._draw_bitmap(self.digits[d2], x0 + self.digit_w + gap, y0, fg_c)
+            self._draw_bitmap(self.digit_glyphs[d1], x0, y0, fg_c, px)
+            self._draw_bitmap(self.digit_glyphs[d2], x0 + self.digit_w + gap, y0, fg_c, px)
 
-    def goal_number_animation(self, n: int, fg, bg, gap=1):
+    def render_goal_animation(self, n: int, fg, bg, gap=1) -> "Animation":
         """
-        Extended GOAL animation (longer & more hype):
+        Extended GOAL animation (longer & more hype), rendered ahead of time:
         1) Slow background wipe
         2) Big pop + bounce
         3) Extended sparkle/confetti
         4) Pulse hold
         5) Invert flashes
         6) Final steady display
+        Nothing is shown, play() does that. fg/bg are (r,g,b).
         """
-        import time
-        import random
-
         s = str(n)
         if not s.isdigit() or len(s) > 2:
             raise ValueError("Only supports 0-99")
@@ -254,15 +342,26 @@ class MatrixNumberDisplay:
                 max(0, min(255, int(rgb[2] * factor))),
             )
 
+        bg_int = _to_color(bg)
+        fg_int = _to_color(fg)
+        frames = {}     # identical frames are stored once
+
+        def number_frame(dx, dy, color, back=bg_int):
+            key = (dx, dy, color, back)
+            px = frames.get(key)
+            if px is None:
+                px = frames[key] = array(TYPECODE, [back]) * self.led_count
+                self._draw_number_at(n, cx + dx, cy + dy, color, gap, px=px)
+            return px
+
+        steps = []
+
         # -------------------------------------------------
-        # 1) SLOW BACKGROUND WIPE (feels intentional)
+        # 1) SLOW BACKGROUND WIPE (column by column over what is shown)
         # -------------------------------------------------
-        bg_int = _to_color(bg)
-        for x in range(self.w):
-            for y in range(self.h):
-                self._set_pixel(x, y, bg_int)
-            self.strip.show()
-            time.sleep(0.02)   # slower than before
+        lut, w, h = self._lut, self.w, self.h
+        for x in range(w):
+            steps.append(((tuple(lut[i] for i in range(x, w * h, w)), bg_int), 0.02))
 
         # -------------------------------------------------
         # 2) BIG POP / BOUNCE (more frames)
@@ -282,82 +381,73 @@ class MatrixNumberDisplay:
         ]
 
         for dx, dy, bright in bounce_frames:
-            self.fill(bg)
-            self._draw_number_at(n, cx + dx, cy + dy, dim(fg, bright), gap)
-            self.strip.show()
-            time.sleep(0.08)
+            steps.append((number_frame(dx, dy, _to_color(dim(fg, bright))), 0.08))
 
         # -------------------------------------------------
         # 3) EXTENDED SPARKLES / CONFETTI
         # -------------------------------------------------
-        fg_int = _to_color(fg)
         alt_int = _to_color(dim(fg, 0.35))
 
         for _ in range(24):   # ← longer sparkle phase
-            self.fill(bg)
-            self._draw_number_at(n, cx, cy, fg, gap)
+            px = array(TYPECODE, number_frame(0, 0, fg_int))
 
             for __ in range(30):
                 x = random.randint(0, self.w - 1)
                 y = random.randint(0, self.h - 1)
-                self._set_pixel(
-                    x, y,
-                    fg_int if random.random() > 0.4 else alt_int
-                )
+                px[lut[y * w + x]] = fg_int if random.random() > 0.4 else alt_int
 
-            self.strip.show()
-            time.sleep(0.07)
+            steps.append((px, 0.07))
 
         # -------------------------------------------------
         # 4) PULSE HOLD (breathing effect)
         # -------------------------------------------------
         for pulse in [0.85, 1.0, 0.9, 1.0, 0.95, 1.0]:
-            self.fill(bg)
-            self._draw_number_at(n, cx, cy, dim(fg, pulse), gap)
-            self.strip.show()
-            time.sleep(0.18)
+            steps.append((number_frame(0, 0, _to_color(dim(fg, pulse))), 0.18))
 
         # -------------------------------------------------
         # 5) INVERT FLASHES (dramatic end)
         # -------------------------------------------------
         for _ in range(3):
-            self.show_number(n, fg=bg, bg=fg, gap=gap)
-            time.sleep(0.15)
-            self.show_number(n, fg=fg, bg=bg, gap=gap)
-            time.sleep(0.15)
+            steps.append((number_frame(0, 0, bg_int, back=fg_int), 0.15))
+            steps.append((number_frame(0, 0, fg_int), 0.15))
 
         # -------------------------------------------------
         # 6) FINAL HOLD (let it breathe)
         # -------------------------------------------------
-        self.show_number(n, fg=fg, bg=bg, gap=gap)
-        time.sleep(1.2)
+        steps.append((number_frame(0, 0, fg_int), 1.2))
+        return Animation(steps)
+
+    def goal_animation(self, n: int, fg, bg, gap=1) -> "Animation":
+        """render_goal_animation(), cached (LRU, ANIM_CACHE_MAX_BYTES per display)."""
+        key = (n, _to_color(fg), _to_color(bg), gap)
+        return self._anims.get(key, lambda: self.render_goal_animation(n, fg, bg, gap))
+
+    def play(self, anim: "Animation"):
+        """Show a pre-rendered animation: one frame copy + push per step."""
+        self.fb.play(anim)
+
+    def goal_number_animation(self, n: int, fg, bg, gap=1):
+        self.play(self.goal_animation(n, fg, bg, gap))
 
     def show_emoji(self, name: str, fg, bg=(0, 0, 0)):
         """
         Draw 14x12 emoji centered on the matrix.
         fg/bg accept (r,g,b) tuples.
         """
-        if name not in EMOJIS_15x12:
+        if name not in EMOJI_GLYPHS:
             raise ValueError(f"Unknown emoji: {name}")
 
-        bitmap = EMOJIS_15x12[name]
-        h = len(bitmap)
-        w = len(bitmap[0]) if h else 0
-
-        x0 = (self.w - w) // 2
-        y0 = (self.h - h) // 2
+        glyph = EMOJI_GLYPHS[name]
+        x0 = (self.w - glyph.w) // 2
+        y0 = (self.h - glyph.h) // 2
 
         # background
-        self.fill(bg)
+        self._fill_no_show(_to_color(bg))
 
         # draw emoji
-        fg_int = _to_color(fg)
-        for y, row in enumerate(bitmap):
-            for x, ch in enumerate(row):
-                if ch == "1":
-                    self._set_pixel(x0 + x, y0 + y, fg_int)
+        self._draw_bitmap(glyph, x0, y0, _to_color(fg))
 
-        self.strip.show()
+        self.show()
 
 
     def emoji_animation(self, name: str, fg, bg, pulses: int = 4):
@@ -1,218 +1,713 @@
 # nhl_client.py
-import json
+import gzip
 import os
+import threading
 import time
-import urllib.request
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 import config
-from typing import Any, Dict, List, Optional
+import http_pool
+import json_backend
+import pbp_stream
+from circuit_breaker import CircuitOpenError, get_breaker
+from models import GameSnapshot, Goal, Player, TeamScore
+import player_resolver
+import roster_pack
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 # ---- CONFIG (match your old config.cjs) ----
 API_BASE = config.BACKEND_BASE_URL   # same base your node used
 CACHE_TTL_SECONDS = 60                     # adjust as you like
+VALIDATOR_CACHE_MAX = 64                   # urls we remember ETag/Last-Modified for
+MEMO_CACHE_MAX = 128                       # memoized results (scoreboards, pbp, rosters, ...)
+SCORE_TTL_SECONDS = 1                      # pollers asking within a second share one /score/now
+PBP_TTL_SECONDS = 1
+STALE_IF_ERROR_SECONDS = 15 * 60           # keep showing the last good scoreboard this long through an outage
 
 # Optional: local roster cache folder
 ROSTER_DIR = os.path.join(os.path.dirname(__file__), "rosters")  # ./rosters/MTL.json etc
+# the files ship as ./roasters/ in this repo, accept both spellings
+ROSTER_DIRS = [ROSTER_DIR, os.path.join(os.path.dirname(__file__), "roasters")]
+ROSTER_STAT_INTERVAL_SECONDS = 30          # how often we stat() a roster file for changes
+LIVE_ROSTER_TTL_SECONDS = 6 * 3600         # live fallback rosters barely change during a day
+ROSTER_HEDGE_SECONDS = 1.0                 # start the next roster url if the previous one hasn't answered
+ROSTER_TIMEOUT_SECONDS = 10                # give up on the whole roster url chain after this
+ROSTER_URL_TIMEOUT_SECONDS = 4             # socket timeout of one roster url (a hedge loser is dropped, not awaited)
 
 
-# ----------------- tiny cache -----------------
-_cache: Dict[str, Dict[str, Any]] = {}
+# ----------------- memo cache -----------------
+class MemoCache:
+    """
+    Bounded LRU with a TTL per key, and singleflight loads: callers missing the
+    same key at the same time wait for ONE fetch and share its result (or its
+    exception). Failed loads are not cached.
+    """
 
-def _cache_get(key: str):
-    item = _cache.get(key)
-    if not item:
-        return None
-    if time.time() > item["exp"]:
-        _cache.pop(key, None)
-        return None
-    return item["val"]
+    def __init__(self, max_entries: int = MEMO_CACHE_MAX):
+        self.max_entries = max_entries
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()    # key -> (expires_at, val)
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+    def get(self, key: str):
+        with self._lock:
+            return self._get_locked(key)
+
+    def _get_locked(self, key: str):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if time.monotonic() >= item[0]:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return item[1]
+
+    def set(self, key: str, val: Any, ttl_seconds: float = CACHE_TTL_SECONDS):
+        with self._lock:
+            self._items[key] = (time.monotonic() + ttl_seconds, val)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate(self, key: Optional[str] = None):
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any],
+                    ttl_seconds: Union[float, Callable[[Any], float]] = CACHE_TTL_SECONDS) -> Any:
+        """ttl_seconds can be a function of the loaded value (e.g. shorter for empty results)."""
+        with self._lock:
+            val = self._get_locked(key)
+            if val is not None:
+                self.stats["hits"] += 1
+                return val
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = Future()
+                self.stats["misses"] += 1
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            return fut.result()
+
+        try:
+            val = loader()
+            ttl = ttl_seconds(val) if callable(ttl_seconds) else ttl_seconds
+            if val is not None and ttl > 0:
+                self.set(key, val, ttl)
+            fut.set_result(val)
+            return val
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
 
-def _cache_set(key: str, val: Any, ttl_seconds: int = CACHE_TTL_SECONDS):
-    _cache[key] = {"val": val, "exp": time.time() + ttl_seconds}
+
+_cache = MemoCache()
 
 
 # ----------------- http -----------------
-def fetch_json(url: str, timeout: int = 10) -> Any:
-    req = urllib.request.Request(
-        url,
-        headers={
-            "User-Agent": "nhl-python-client/1.0",
-            "Accept": "application/json",
-        },
-    )
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read().decode("utf-8")
-        return json.loads(data)
+# url -> {"etag", "last_modified", "val"} so unchanged polls come back as a tiny 304
+_validators: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_validators_lock = threading.Lock()
+_not_modified_count = 0
+
+
+def _decode_body(body: bytes, content_encoding: Optional[str]) -> bytes:
+    enc = (content_encoding or "").strip().lower()
+    if enc == "gzip":
+        return gzip.decompress(body)
+    if enc == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # some servers send raw deflate without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def _endpoint(url: str) -> str:
+    """Breaker name for a url: score, gamecenter, roster, teams, club-schedule-season, ..."""
+    path = url[len(API_BASE):] if url.startswith(API_BASE) else url
+    name = path.strip("/").split("/", 1)[0].split("?", 1)[0]
+    return "roster" if name in ("roster", "club-roster", "team") else name
+
+
+def fetch_json(url: str, timeout: int = 10, parse: Callable[[bytes], Any] = json_backend.loads) -> Any:
+    """
+    GET + decode. parse turns the body bytes into the value (json_backend.loads
+    by default; the scoreboard and fetch_goals pass their typed decoders).
+    """
+    global _not_modified_count
+
+    headers = {
+        "User-Agent": "nhl-python-client/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+    }
+
+    # a 304 hands back the value parsed last time, so it is cached per parser
+    vkey = url if parse is json_backend.loads else f"{url}#{getattr(parse, '__name__', 'parse')}"
+    with _validators_lock:
+        cached = _validators.get(vkey)
+        if cached:
+            _validators.move_to_end(vkey)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    # fail fast while this endpoint's circuit is open (no request at all)
+    breaker = get_breaker(_endpoint(url))
+    breaker.before_call()
+
+    # goes through the keep-alive pool: no new DNS/TCP/TLS handshake per poll
+    try:
+        status, resp_headers, body = http_pool.get(url, headers=headers, timeout=timeout)
+    except http_pool.HttpError as e:
+        # 4xx = the server is fine, the url is not (roster fallbacks 404 on purpose)
+        if e.status >= 500 or e.status == 429:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+    except Exception:
+        breaker.record_failure()
+        raise
+    breaker.record_success()
+
+    if status == 304 and cached:
+        with _validators_lock:
+            _not_modified_count += 1
+        return cached["val"]
+
+    val = parse(_decode_body(body, resp_headers.get("content-encoding")))
+
+    etag = resp_headers.get("etag")
+    last_modified = resp_headers.get("last-modified")
+    with _validators_lock:
+        if etag or last_modified:
+            _validators[vkey] = {"etag": etag, "last_modified": last_modified, "val": val}
+            _validators.move_to_end(vkey)
+            while len(_validators) > VALIDATOR_CACHE_MAX:
+                _validators.popitem(last=False)
+        else:
+            _validators.pop(vkey, None)
+
+    return val
+
+
+def get_http_stats() -> Dict[str, int]:
+    """Connection pool counters (requests, reused, handshakes, reconnects, redirects) + 304 hits + memo cache."""
+    stats = http_pool.get_stats()
+    stats["not_modified"] = _not_modified_count
+    for k, v in _cache.stats.items():
+        stats[f"memo_{k}"] = v
+    return stats
 
 
 # ----------------- score/game now -----------------
-def get_score_data(date_str: Optional[str] = None) -> Dict[str, Any]:
+# /score/now decoded into compact records: only what _game_summary reads
+ScoreTeam = json_backend.record("ScoreTeam", abbrev=str, score=int)
+ScorePeriod = json_backend.record("ScorePeriod", number=int, periodType=str)
+ScoreClock = json_backend.record(
+    "ScoreClock", timeRemaining=str, secondsRemaining=int, running=bool, inIntermission=bool,
+)
+ScoreGame = json_backend.record(
+    "ScoreGame",
+    id=int, gameState=str, gameDate=str, startTimeUTC=str, period=int,
+    homeTeam=ScoreTeam, awayTeam=ScoreTeam, periodDescriptor=ScorePeriod, clock=ScoreClock,
+)
+ScoreFeed = json_backend.record("ScoreFeed", currentDate=str, games=[ScoreGame])
+
+
+def _parse_score(data: bytes) -> Any:
+    feed = json_backend.decode(data, ScoreFeed)
+    if feed is None:
+        raise ValueError("scoreboard is not a JSON object")
+    return feed
+
+
+# url -> (epoch fetched, data): last good scoreboard, served through outages
+_last_good: Dict[str, Tuple[float, Any]] = {}
+_revalidating: set = set()
+_stale_lock = threading.Lock()
+
+
+def _score_url(date_str: Optional[str]) -> str:
+    if date_str and len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        return f"{API_BASE}/score/{date_str}"
+    return f"{API_BASE}/score/now"
+
+
+def _load_score(url: str) -> Any:
+    data = _cache.get_or_load(url, lambda: fetch_json(url, parse=_parse_score), SCORE_TTL_SECONDS)
+    with _stale_lock:
+        _last_good[url] = (time.time(), data)
+    return data
+
+
+def _revalidate(url: str):
+    """Background retries (paced by the breaker backoff) until the scoreboard loads again."""
+    breaker = get_breaker("score")
+    try:
+        while True:
+            with _stale_lock:
+                fetched_at = _last_good[url][0]
+            if time.time() - fetched_at > STALE_IF_ERROR_SECONDS:
+                return
+            time.sleep(max(1.0, breaker.retry_in()))
+            try:
+                _load_score(url)
+                return
+            except Exception:
+                continue
+    finally:
+        with _stale_lock:
+            _revalidating.discard(url)
+
+
+def get_score_data_with_age(date_str: Optional[str] = None) -> Tuple[Any, float]:
+    """
+    Scoreboard (ScoreFeed record) + its age in seconds (0 when fresh).
+    stale-if-error: if the fetch fails (or the circuit is open) the last good
+    scoreboard is returned instead, up to STALE_IF_ERROR_SECONDS old, and a
+    background thread keeps revalidating. While it does, callers get the stale
+    copy right away instead of waiting on a failing upstream.
+    """
+    url = _score_url(date_str)
+    with _stale_lock:
+        last = _last_good.get(url)
+        revalidating = url in _revalidating
+
+    if not (revalidating and last):
+        try:
+            return _load_score(url), 0.0
+        except Exception:
+            if last is None or (time.time() - last[0]) > STALE_IF_ERROR_SECONDS:
+                raise
+
+    with _stale_lock:
+        if url not in _revalidating:
+            _revalidating.add(url)
+            threading.Thread(target=_revalidate, args=(url,), name="score-revalidate", daemon=True).start()
+    return last[1], time.time() - last[0]
+
+
+def get_score_data(date_str: Optional[str] = None) -> Any:
     """
     Equivalent to your Node getScoreData(dateStr):
       - if date_str == YYYY-MM-DD -> /score/{date}
       - else -> /score/now
+    Returns a ScoreFeed record (json_backend.as_dict() for plain dicts).
     """
-    if date_str and len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
-        url = f"{API_BASE}/score/{date_str}"
-    else:
-        url = f"{API_BASE}/score/now"
-    return fetch_json(url)
+    return get_score_data_with_age(date_str)[0]
+
+
+def _game_summary(g: Any, data: Any, date_str: Optional[str]) -> GameSnapshot:
+    home = g.homeTeam or ScoreTeam()
+    away = g.awayTeam or ScoreTeam()
+    period = g.periodDescriptor or ScorePeriod()
+    return GameSnapshot(
+        id=g.id,
+        state=g.gameState,
+        date=date_str or data.currentDate or g.gameDate,
+        home=TeamScore(home.abbrev, home.score),
+        away=TeamScore(away.abbrev, away.score),
+        # for the polling scheduler
+        start_time_utc=g.startTimeUTC,
+        period=period.number or g.period,
+        period_type=period.periodType,
+        clock=json_backend.as_dict(g.clock) if g.clock else {},
+    )
+
+
+def find_games_for_teams(team_abbrs: List[str], date_str: Optional[str] = None) -> Dict[str, GameSnapshot]:
+    """
+    Same as find_game_for_team for several teams, from ONE scoreboard request.
+    Returns { abbr: GameSnapshot } (no_game=True for teams not playing).
+    Served from the last good scoreboard during an outage: then every entry
+    also has stale=True and age_seconds.
+    """
+    teams = [str(t).upper().strip() for t in team_abbrs]
+    out: Dict[str, GameSnapshot] = {}
+
+    data, age = get_score_data_with_age(date_str)
+    for g in data.games or []:
+        if g is None:
+            continue
+        for side in (g.homeTeam, g.awayTeam):
+            abbr = side.abbrev if side else None
+            if abbr in teams and abbr not in out and g.id:
+                out[abbr] = _game_summary(g, data, date_str)
+    for t in teams:
+        if t not in out:
+            out[t] = GameSnapshot(no_game=True, message=f"No game found for {t} on {date_str or 'today'}")
+    if age:
+        for game in out.values():
+            game.stale = True
+            game.age_seconds = int(age)
+    return out
 
 
-def find_game_for_team(team_abbr: str, date_str: Optional[str] = None) -> Dict[str, Any]:
+def find_game_for_team(team_abbr: str, date_str: Optional[str] = None) -> GameSnapshot:
     """
     Equivalent to Node findGameForTeam(teamAbbr, dateStr)
-    Returns dict with keys: id, state, date, home{abbr,score}, away{abbr,score}
+    Returns a GameSnapshot: id, state, date, home/away (abbr, score),
+    start_time_utc, period, period_type, clock{secondsRemaining,running,inIntermission}
     """
     team_abbr = str(team_abbr).upper().strip()
-    data = get_score_data(date_str)
-    games = data.get("games") or []
-    for g in games:
-        home = g.get("homeTeam") or {}
-        away = g.get("awayTeam") or {}
-        if home.get("abbrev") == team_abbr or away.get("abbrev") == team_abbr:
-            return {
-                "id": g.get("id"),
-                "state": g.get("gameState"),
-                "date": date_str or data.get("currentDate") or g.get("gameDate"),
-                "home": {"abbr": home.get("abbrev"), "score": home.get("score", 0) or 0},
-                "away": {"abbr": away.get("abbrev"), "score": away.get("score", 0) or 0},
-            }
-    return {"id": None, "state": None, "home": None, "away": None}
+    return find_games_for_teams([team_abbr], date_str)[team_abbr]
 
 
-def fetch_game_now(team_abbr: str, date_str: Optional[str] = None) -> Dict[str, Any]:
+def fetch_games_now(team_abbrs: List[str], date_str: Optional[str] = None) -> Dict[str, GameSnapshot]:
     """
-    Drop-in replacement for your current backend_client.fetch_game_now().
-    Returns the SAME SHAPE your main() expects:
-      - ok, noGame?, message?, id, home, away
+    fetch_game_now for several teams from one /score/now request.
+    Returns { abbr: same as fetch_game_now() }
     """
+    teams = [str(t).upper().strip() for t in team_abbrs]
     try:
-        result = find_game_for_team(team_abbr, date_str)
-        if not result.get("id"):
-            return {
-                "ok": True,
-                "noGame": True,
-                "message": f"No game found for {team_abbr.upper()} on {date_str or 'today'}",
-            }
-
-        return {"ok": True, **result}
+        return find_games_for_teams(teams, date_str)
     except Exception as e:
-        return {"ok": False, "error": str(e)}
+        # retry_in: how long the score circuit stays open (0 if it is not)
+        retry_in = e.retry_in if isinstance(e, CircuitOpenError) else get_breaker("score").retry_in()
+        return {t: GameSnapshot(ok=False, error=str(e), retry_in=retry_in) for t in teams}
+
+
+def fetch_game_now(team_abbr: str, date_str: Optional[str] = None) -> GameSnapshot:
+    """
+    Drop-in replacement for your current backend_client.fetch_game_now().
+    Returns a GameSnapshot (models.py), .as_dict() / .get() give the old shape:
+      - ok, noGame?, message?, id, home, away
+      - stale?, ageSeconds? when served from the last good scoreboard
+      - error, retryIn when ok=false
+    """
+    team_abbr = str(team_abbr).upper().strip()
+    return fetch_games_now([team_abbr], date_str)[team_abbr]
 
 
 # ----------------- roster helpers -----------------
-def read_roster_local(team_abbr: str) -> List[Dict[str, Any]]:
+# Process-wide roster index: team -> {"path", "mtime", "checked_at", "players", "by_id"}
+# Files are parsed once and only re-read when their mtime changes (checked at most
+# every ROSTER_STAT_INTERVAL_SECONDS), so goal enrichment does no disk I/O on the hot path.
+_roster_index: Dict[str, Dict[str, Any]] = {}
+_roster_index_lock = threading.Lock()
+
+
+def _find_roster_file(team_abbr: str) -> Optional[str]:
+    for d in ROSTER_DIRS:
+        for name in (f"{team_abbr}.json", f"{team_abbr.lower()}.json"):
+            p = os.path.join(d, name)
+            if os.path.exists(p):
+                return p
+    return None
+
+
+def _index_players(players: List[Player]) -> Dict[int, Player]:
+    return {p.id: p for p in players if p.id is not None}
+
+
+def _local_roster_entry(team_abbr: str) -> Dict[str, Any]:
+    now = time.monotonic()
+    with _roster_index_lock:
+        entry = _roster_index.get(team_abbr)
+        if entry and (now - entry["checked_at"]) < ROSTER_STAT_INTERVAL_SECONDS:
+            return entry
+
+        path = (entry or {}).get("path") or _find_roster_file(team_abbr)
+        mtime = None
+        if path:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                # file moved/removed -> look again
+                path = _find_roster_file(team_abbr)
+                mtime = os.stat(path).st_mtime if path else None
+
+        if entry and entry["path"] == path and entry["mtime"] == mtime:
+            entry["checked_at"] = now
+            return entry
+
+        players: List[Player] = []
+        if path:
+            with open(path, "rb") as f:
+                data = json_backend.load(f)
+            # your format: [ {id, fullName, position, number, shoots, headshot, team}, ... ]
+            if isinstance(data, list):
+                players = [Player.from_dict(p) for p in data if isinstance(p, dict)]
+
+        entry = {
+            "path": path,
+            "mtime": mtime,
+            "checked_at": now,
+            "players": players,
+            "by_id": _index_players(players),
+        }
+        _roster_index[team_abbr] = entry
+        return entry
+
+
+def read_roster_local(team_abbr: str) -> List[Player]:
     team_abbr = str(team_abbr).upper().strip()
+    return _local_roster_entry(team_abbr)["players"]
 
-    candidates = [
-        os.path.join(ROSTER_DIR, f"{team_abbr}.json"),
-        os.path.join(ROSTER_DIR, f"{team_abbr.lower()}.json"),
+
+def _roster_urls(team_abbr: str) -> List[str]:
+    return [
+        f"{API_BASE}/roster/{team_abbr}/current",
+        f"{API_BASE}/club-roster/{team_abbr}/current",
+        f"{API_BASE}/team/{team_abbr}/roster",
     ]
 
-    path = next((p for p in candidates if os.path.exists(p)), None)
-    if not path:
-        return []
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def _normalize_roster(data: Dict[str, Any], team_abbr: str) -> Optional[List[Player]]:
+    """Players in our shape, or None if data is not a roster we know."""
+    # club-roster shape
+    if data.get("forwards") or data.get("defensemen") or data.get("goalies"):
+        parts = (data.get("forwards") or []) + (data.get("defensemen") or []) + (data.get("goalies") or [])
+        players = []
+        for p in parts:
+            full = f"{(p.get('firstName') or {}).get('default','')} {(p.get('lastName') or {}).get('default','')}".strip()
+            players.append(Player(
+                id=p.get("id"),
+                full_name=full,
+                position=p.get("positionCode"),
+                number=p.get("sweaterNumber"),
+                shoots=p.get("shootsCatches"),
+                headshot=p.get("headshot") or "",
+                team=team_abbr,
+            ))
+        return players
+
+    # legacy shape
+    if isinstance(data.get("roster"), list):
+        players = []
+        for r in data["roster"]:
+            person = r.get("person") or {}
+            position = r.get("position") or {}
+            players.append(Player(
+                id=person.get("id") or r.get("id"),
+                full_name=person.get("fullName") or r.get("fullName"),
+                position=position.get("name") or position.get("code"),
+                number=r.get("sweaterNumber"),
+                shoots=r.get("shootsCatches"),
+                headshot=r.get("headshot") or "",
+                team=team_abbr,
+            ))
+        return players
+
+    return None
+
+
+def _try_roster_url(url: str, team_abbr: str, timeout: float) -> Optional[List[Player]]:
+    try:
+        return _normalize_roster(fetch_json(url, timeout=timeout), team_abbr) or None
+    except Exception:
+        return None
 
-    # your format: [ {id, fullName, position, number, shoots, headshot, team}, ... ]
-    return data if isinstance(data, list) else []
 
+def _start_roster_url(url: str, team_abbr: str, timeout: float) -> Future:
+    """
+    One roster url on its own daemon thread. A hedge loser still stuck on a slow
+    socket is simply dropped: it holds no shared worker the next lookup waits for.
+    """
+    fut: Future = Future()
+    threading.Thread(
+        target=lambda: fut.set_result(_try_roster_url(url, team_abbr, timeout)),
+        name="roster", daemon=True,
+    ).start()
+    return fut
 
 
-def fetch_roster_live(team_abbr: str) -> List[Dict[str, Any]]:
+# team -> index of the roster url shape that answered last time
+_roster_shape: Dict[str, int] = {}
+
+
+def fetch_roster_live(team_abbr: str) -> List[Player]:
     """
     Equivalent to roster.cjs live fallback logic:
       tries:
         /roster/{abbr}/current
         /club-roster/{abbr}/current
         /team/{abbr}/roster   (legacy)
-    Normalizes to: {id, fullName, position, number, shoots, headshot, team}
+    Normalizes to Player (id, full_name, position, number, shoots, headshot, team)
+
+    Hedged: the url shape that worked last time for this team goes first; every
+    ROSTER_HEDGE_SECONDS without a valid answer the next url is started too. The
+    first valid roster wins and the requests still running are left to time out
+    on their own, so one dead endpoint costs about a second instead of a full timeout.
     """
     team_abbr = str(team_abbr).upper().strip()
-    urls = [
-        f"{API_BASE}/roster/{team_abbr}/current",
-        f"{API_BASE}/club-roster/{team_abbr}/current",
-        f"{API_BASE}/team/{team_abbr}/roster",
-    ]
+    urls = _roster_urls(team_abbr)
+    first = _roster_shape.get(team_abbr, 0)
+    order = [first] + [i for i in range(len(urls)) if i != first]
+
+    deadline = time.monotonic() + ROSTER_TIMEOUT_SECONDS
+    running: Dict[Future, int] = {}
+    for n, i in enumerate(order):
+        timeout = min(ROSTER_URL_TIMEOUT_SECONDS, max(1.0, deadline - time.monotonic()))
+        running[_start_roster_url(urls[i], team_abbr, timeout)] = i
+        last = n == len(order) - 1
+        while running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            done, _ = wait(running, timeout=remaining if last else min(ROSTER_HEDGE_SECONDS, remaining),
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                if last:
+                    continue
+                break       # hedge: start the next url alongside
+            for fut in done:
+                idx = running.pop(fut)
+                players = fut.result()
+                if players:
+                    _roster_shape[team_abbr] = idx
+                    return players
+            if not last and not running:
+                break       # everything started so far failed: next url now
+    return []
 
-    for u in urls:
-        try:
-            data = fetch_json(u)
-            # club-roster shape
-            if data.get("forwards") or data.get("defensemen") or data.get("goalies"):
-                parts = (data.get("forwards") or []) + (data.get("defensemen") or []) + (data.get("goalies") or [])
-                players = []
-                for p in parts:
-                    full = f"{(p.get('firstName') or {}).get('default','')} {(p.get('lastName') or {}).get('default','')}".strip()
-                    players.append({
-                        "id": p.get("id"),
-                        "fullName": full,
-                        "position": p.get("positionCode"),
-                        "number": p.get("sweaterNumber"),
-                        "shoots": p.get("shootsCatches"),
-                        "headshot": p.get("headshot") or "",
-                        "team": team_abbr,
-                    })
-                return players
-
-            # legacy shape
-            if isinstance(data.get("roster"), list):
-                players = []
-                for r in data["roster"]:
-                    person = r.get("person") or {}
-                    position = r.get("position") or {}
-                    players.append({
-                        "id": person.get("id") or r.get("id"),
-                        "fullName": person.get("fullName") or r.get("fullName"),
-                        "position": position.get("name") or position.get("code"),
-                        "number": r.get("sweaterNumber"),
-                        "shoots": r.get("shootsCatches"),
-                        "headshot": r.get("headshot") or "",
-                        "team": team_abbr,
-                    })
-                return players
-        except Exception:
-            pass
 
-    return []
+def _live_roster_entry(team_abbr: str) -> Dict[str, Any]:
+    def load():
+        players = fetch_roster_live(team_abbr)
+        return {"players": players, "by_id": _index_players(players)}
 
+    # don't pin an empty result for hours if the API was just down
+    return _cache.get_or_load(
+        f"roster_live:{team_abbr}", load,
+        lambda entry: LIVE_ROSTER_TTL_SECONDS if entry["players"] else CACHE_TTL_SECONDS,
+    )
 
-def get_roster(team_abbr: str, source: str = "auto") -> List[Dict[str, Any]]:
-    team_abbr = str(team_abbr).upper().strip()
 
+def _roster_entry(team_abbr: str, source: str) -> Dict[str, Any]:
     if source in ("local", "auto"):
-        local = read_roster_local(team_abbr)
-        if local:
+        local = _local_roster_entry(team_abbr)
+        if local["players"] or source == "local":
             return local
-        if source == "local":
-            return []
 
     # fallback only if file missing
-    return fetch_roster_live(team_abbr)
+    return _live_roster_entry(team_abbr)
+
+
+def get_roster(team_abbr: str, source: str = "auto") -> List[Player]:
+    team_abbr = str(team_abbr).upper().strip()
+    if source == "live":
+        return fetch_roster_live(team_abbr)
+    return _roster_entry(team_abbr, source)["players"]
+
+
+def get_roster_index(team_abbr: str, source: str = "auto") -> Dict[int, Player]:
+    """player id -> Player for one team (same source rules as get_roster)."""
+    team_abbr = str(team_abbr).upper().strip()
+    return _roster_entry(team_abbr, source)["by_id"]
 
 
+def find_player(pid: Any, teams: List[str]) -> Optional[Player]:
+    """O(1) player lookup across the given teams' rosters."""
+    try:
+        pid_int = int(pid)
+    except Exception:
+        return None
+    for t in teams:
+        p = get_roster_index(t).get(pid_int)
+        if p is not None:
+            return p
+    return None
+
 
 # ----------------- goals (play-by-play) -----------------
+# Per-game cursor so a poll only builds Goals for plays it has not seen yet.
+# gid -> {"plays_len", "last_key", "goals": OrderedDict[eventId -> (sig, goal)]}
+_goal_cursors: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_goal_cursors_lock = threading.Lock()
+GOAL_CURSOR_MAX_GAMES = 4
+
+
+def _goal_sig(d: Dict[str, Any]):
+    # if any of these change on a known goal (scorer fix, assist change) rebuild it
+    return (
+        d.get("scoringPlayerId"),
+        d.get("assist1PlayerId"),
+        d.get("assist2PlayerId"),
+        d.get("homeScore"),
+        d.get("awayScore"),
+    )
+
+
+def _build_goal(ev: Dict[str, Any], home_abbr: str, get_player) -> Goal:
+    d = ev.get("details") or {}
+    team_abbr = d.get("eventOwnerTeamAbbrev") or home_abbr
+
+    scorer = get_player(d.get("scoringPlayerId"), d, team_abbr)
+    assist1 = get_player(d.get("assist1PlayerId"), d, team_abbr)
+    assist2 = get_player(d.get("assist2PlayerId"), d, team_abbr)
+
+    return Goal(
+        event_id=ev.get("eventId"),
+        period=(ev.get("periodDescriptor") or {}).get("number"),
+        time_in_period=ev.get("timeInPeriod"),
+        scorer=scorer,
+        assists=[a for a in [assist1, assist2] if a],
+        shot_type=d.get("shotType"),
+        strength=d.get("strength"),
+        home_score=d.get("homeScore"),
+        away_score=d.get("awayScore"),
+        highlight_url=d.get("highlightClipSharingUrl"),
+        highlight_id=d.get("highlightClip"),
+    )
+
+
+def reset_goal_cursor(game_id: Optional[str] = None):
+    with _goal_cursors_lock:
+        if game_id is None:
+            _goal_cursors.clear()
+        else:
+            _goal_cursors.pop(str(game_id).strip(), None)
+
+
 def fetch_goals(game_id: str) -> Dict[str, Any]:
     """
     Equivalent to /api/game/:gameId/goals from games.cjs
     Returns:
-      { ok:true, gameId, home:{abbr}, away:{abbr}, goals:[...] }
+      { ok:true, gameId, home:{abbr}, away:{abbr}, goals:[Goal], removedGoals:[Goal] }
+
+    Incremental: Goals up to the per-game cursor are not built again, as long
+    as the play list before the cursor AND the goals in it (event id + scorer,
+    assists, score: _goal_sig) are unchanged. Goal plays are few and already
+    decoded, so their signatures are compared on every fetch: a goal fixed or
+    taken back in place (same play count / last event) is caught too. On a
+    mismatch we rescan, reuse the unchanged Goals and report the goals that
+    disappeared in removedGoals.
     """
     try:
         gid = str(game_id).strip()
         if not (gid.isdigit() and len(gid) == 10):
             return {"ok": False, "error": "Invalid gameId"}
 
-        pbp = fetch_json(f"{API_BASE}/gamecenter/{gid}/play-by-play")
+        pbp_url = f"{API_BASE}/gamecenter/{gid}/play-by-play"
+        # selective decode: team headers, play keys and goal plays only (pbp_stream.py)
+        pbp = _cache.get_or_load(
+            pbp_url, lambda: fetch_json(pbp_url, parse=pbp_stream.parse_goal_plays), PBP_TTL_SECONDS
+        )
         home_abbr = (pbp.get("homeTeam") or {}).get("abbrev") or "HOME"
         away_abbr = (pbp.get("awayTeam") or {}).get("abbrev") or "AWAY"
+        play_keys = pbp["play_keys"]
+        goal_plays = pbp["goal_plays"]
 
-        home_roster = get_roster(home_abbr, source="auto")
-        away_roster = get_roster(away_abbr, source="auto")
-        roster_map = {int(p["id"]): p for p in (home_roster + away_roster) if p.get("id")}
+        teams = [home_abbr, away_abbr]
 
         def get_player(pid, details, fallback_team):
             if not pid:
@@ -221,43 +716,78 @@ def fetch_goals(game_id: str) -> Dict[str, Any]:
                 pid_int = int(pid)
             except Exception:
                 return None
-            if pid_int in roster_map:
-                return roster_map[pid_int]
+            # compiled league-wide pack first (mmap + binary search, no JSON);
+            # a traded player still on his old team's file scored for the event owner
+            packed = roster_pack.lookup(pid_int, ROSTER_DIRS)
+            if packed is not None:
+                return Player.from_dict(packed, team=packed["team"] if packed["team"] in teams else fallback_team)
+            # not packed (no roster file for him yet): per-team index, live roster when a file is missing
+            player = find_player(pid_int, teams)
+            if player is not None:
+                return player
+            # unknown id: use the landing-page cache, fetched in the background on a miss
+            resolved = player_resolver.resolve_async(pid_int)
+            if resolved is not None:
+                return Player.from_dict(resolved, team=fallback_team)
             # fallback minimal object like your node code
-            return {
-                "id": pid_int,
-                "fullName": details.get("scoringPlayerName")
-                           or details.get("assist1PlayerName")
-                           or details.get("assist2PlayerName")
-                           or "Unknown",
-                "team": fallback_team,
+            return Player(
+                id=pid_int,
+                full_name=details.get("scoringPlayerName")
+                          or details.get("assist1PlayerName")
+                          or details.get("assist2PlayerName")
+                          or "Unknown",
+                team=fallback_team,
+            )
+
+        with _goal_cursors_lock:
+            cur = _goal_cursors.get(gid)
+            removed: List[Dict[str, Any]] = []
+
+            prefix_ok = (
+                cur is not None
+                and len(play_keys) >= cur["plays_len"]
+                and (cur["plays_len"] == 0 or play_keys[cur["plays_len"] - 1] == cur["last_key"])
+                and [
+                    (ev.get("eventId"), _goal_sig(ev.get("details") or {}))
+                    for idx, ev in goal_plays if idx < cur["plays_len"]
+                ] == [(eid, sig) for eid, (sig, _) in cur["goals"].items()]
+            )
+
+            if prefix_ok:
+                goals_by_id = cur["goals"]
+                start = cur["plays_len"]
+            else:
+                # first look at this game, or something before the cursor changed
+                old = cur["goals"] if cur else OrderedDict()
+                goals_by_id = OrderedDict()
+                for _, ev in goal_plays:
+                    d = ev.get("details") or {}
+                    eid = ev.get("eventId")
+                    sig = _goal_sig(d)
+                    prev = old.get(eid)
+                    if prev is not None and prev[0] == sig:
+                        goals_by_id[eid] = prev
+                    else:
+                        goals_by_id[eid] = (sig, _build_goal(ev, home_abbr, get_player))
+                removed = [g for eid, (_, g) in old.items() if eid not in goals_by_id]
+                start = len(play_keys)
+
+            for idx, ev in goal_plays:
+                if idx < start:
+                    continue
+                d = ev.get("details") or {}
+                goals_by_id[ev.get("eventId")] = (_goal_sig(d), _build_goal(ev, home_abbr, get_player))
+
+            _goal_cursors[gid] = {
+                "plays_len": len(play_keys),
+                "last_key": play_keys[-1] if play_keys else None,
+                "goals": goals_by_id,
             }
+            _goal_cursors.move_to_end(gid)
+            while len(_goal_cursors) > GOAL_CURSOR_MAX_GAMES:
+                _goal_cursors.popitem(last=False)
 
-        goals_out = []
-        for ev in pbp.get("plays") or []:
-            if ev.get("typeDescKey") != "goal":
-                continue
-            d = ev.get("details") or {}
-            team_abbr = d.get("eventOwnerTeamAbbrev") or home_abbr
-
-            scorer = get_player(d.get("scoringPlayerId"), d, team_abbr)
-            assist1 = get_player(d.get("assist1PlayerId"), d, team_abbr)
-            assist2 = get_player(d.get("assist2PlayerId"), d, team_abbr)
-
-            goals_out.append({
-                "period": ((ev.get("periodDescriptor") or {}).get("number")),
-                "timeInPeriod": ev.get("timeInPeriod"),
-                "scorer": scorer,
-                "assists": [a for a in [assist1, assist2] if a],
-                "shotType": d.get("shotType"),
-                "strength": d.get("strength"),
-                "homeScore": d.get("homeScore"),
-                "awayScore": d.get("awayScore"),
-                "highlight": {
-                    "url": d.get("highlightClipSharingUrl"),
-                    "id": d.get("highlightClip"),
-                },
-            })
+            goals_out = [g for _, g in goals_by_id.values()]
 
         return {
             "ok": True,
@@ -265,6 +795,7 @@ def fetch_goals(game_id: str) -> Dict[str, Any]:
             "home": {"abbr": home_abbr},
             "away": {"abbr": away_abbr},
             "goals": goals_out,
+            "removedGoals": removed,
         }
     except Exception as e:
         return {"ok": False, "error": str(e)}
@@ -275,22 +806,43 @@ def fetch_teams() -> List[Dict[str, Any]]:
     """
     Equivalent to GET /api/teams from teams.cjs with caching.
     """
-    cached = _cache_get("teams")
-    if cached is not None:
-        return cached
-
-    data = fetch_json(f"{API_BASE}/teams")
-    out = []
-    for t in (data.get("teams") or []):
-        tri = t.get("triCode")
-        if not tri:
-            continue
-        out.append({
-            "id": t.get("id"),
-            "triCode": tri,
-            "locationName": t.get("locationName") or "",
-            "teamName": t.get("teamName") or "",
-        })
-
-    _cache_set("teams", out, ttl_seconds=CACHE_TTL_SECONDS)
-    return out
+    def load():
+        data = fetch_json(f"{API_BASE}/teams")
+        out = []
+        for t in (data.get("teams") or []):
+            tri = t.get("triCode")
+            if not tri:
+                continue
+            out.append({
+                "id": t.get("id"),
+                "triCode": tri,
+                "locationName": t.get("locationName") or "",
+                "teamName": t.get("teamName") or "",
+            })
+        return out
+
+    return _cache.get_or_load("teams", load, CACHE_TTL_SECONDS)
+
+
+# ----------------- club schedule -----------------
+def fetch_club_schedule(team_abbr: str) -> List[Dict[str, Any]]:
+    """
+    Season schedule for one club (/club-schedule-season/{abbr}/now).
+    Returns: [ {id, startTimeUTC, gameState, home, away}, ... ]
+    """
+    team_abbr = str(team_abbr).upper().strip()
+
+    def load():
+        data = fetch_json(f"{API_BASE}/club-schedule-season/{team_abbr}/now")
+        out = []
+        for g in (data.get("games") or []):
+            out.append({
+                "id": g.get("id"),
+                "startTimeUTC": g.get("startTimeUTC"),
+                "gameState": g.get("gameState"),
+                "home": (g.get("homeTeam") or {}).get("abbrev"),
+                "away": (g.get("awayTeam") or {}).get("abbrev"),
+            })
+        return out
+
+    return _cache.get_or_load(f"schedule:{team_abbr}", load, CACHE_TTL_SECONDS)
@@ -0,0 +1,118 @@
+# pbp_stream.py
+"""
+Selective play-by-play decoder for fetch_goals.
+
+json.loads builds the whole document as dicts (every play, rosterSpots,
+summary, ...) just for us to keep a handful of goals. This walks the top level
+of the document instead and decodes ONE value at a time with the stdlib C
+scanner (JSONDecoder.raw_decode):
+  - homeTeam / awayTeam: kept
+  - plays: each play is decoded, its (eventId, sortOrder) kept for the
+    incremental cursor, and the dict thrown away unless it is a goal
+  - everything else: decoded and dropped right away
+So only one play is alive at a time, never the whole tree.
+
+With the msgspec JSON backend (json_backend.py) the document is decoded
+straight into typed records instead: unknown keys are skipped in C and each
+play's details stay undecoded bytes unless the play is a goal.
+
+  parse_goal_plays(text) -> {
+      "homeTeam": {...}, "awayTeam": {...},
+      "play_keys": [(eventId, sortOrder), ...],     # every play, in order
+      "goal_plays": [(index in plays, play dict), ...],
+  }
+"""
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, Union
+
+import json_backend
+from json_backend import RAW, record
+
+KEEP_KEYS = ("homeTeam", "awayTeam")
+
+_decoder = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+def _skip_ws(s: str, i: int) -> int:
+    return _WS.match(s, i).end()
+
+
+def _expect(s: str, i: int, ch: str) -> int:
+    if s[i:i + 1] != ch:
+        raise ValueError(f"Expecting {ch!r} at char {i}")
+    return i + 1
+
+
+def _plays(s: str, i: int, out: Dict[str, Any]) -> int:
+    """Walks the plays array starting at s[i] == '['. Returns the index after ']'."""
+    keys = out["play_keys"]
+    goals = out["goal_plays"]
+    i = _skip_ws(s, _expect(s, i, "["))
+    if s[i:i + 1] == "]":
+        return i + 1
+    while True:
+        ev, i = _decoder.raw_decode(s, i)
+        if isinstance(ev, dict):
+            keys.append((ev.get("eventId"), ev.get("sortOrder")))
+            if ev.get("typeDescKey") == "goal":
+                goals.append((len(keys) - 1, ev))
+        i = _skip_ws(s, i)
+        if s[i:i + 1] == ",":
+            i = _skip_ws(s, i + 1)
+            continue
+        return _expect(s, i, "]")
+
+
+# ----------------- typed decode (msgspec) -----------------
+PbpPlay = record(
+    "PbpPlay",
+    eventId=int, sortOrder=int, typeDescKey=str,
+    periodDescriptor=Any, timeInPeriod=str, details=RAW,
+)
+PbpDoc = record("PbpDoc", homeTeam=Any, awayTeam=Any, plays=[PbpPlay])
+
+
+def _parse_typed(data: Union[str, bytes]) -> Dict[str, Any]:
+    doc = json_backend.decode(data, PbpDoc)
+    if doc is None:
+        raise ValueError("play-by-play is not a JSON object")
+    plays = [p for p in doc.plays or [] if p is not None]
+    return {
+        "homeTeam": doc.homeTeam or {},
+        "awayTeam": doc.awayTeam or {},
+        "play_keys": [(p.eventId, p.sortOrder) for p in plays],
+        "goal_plays": [(i, json_backend.as_dict(p)) for i, p in enumerate(plays) if p.typeDescKey == "goal"],
+    }
+
+
+# ----------------- selective walk (stdlib) -----------------
+def parse_goal_plays(data: Union[str, bytes]) -> Dict[str, Any]:
+    if json_backend.BACKEND == "msgspec":
+        return _parse_typed(data)
+    text = data.decode("utf-8") if isinstance(data, bytes) else data
+    out: Dict[str, Any] = {"homeTeam": {}, "awayTeam": {}, "play_keys": [], "goal_plays": []}
+
+    i = _skip_ws(text, _expect(text, _skip_ws(text, 0), "{"))
+    if text[i:i + 1] == "}":
+        return out
+    while True:
+        i = _expect(text, i, '"')
+        key, i = scanstring(text, i)
+        i = _skip_ws(text, _expect(text, _skip_ws(text, i), ":"))
+
+        if key == "plays":
+            i = _plays(text, i, out)
+        elif key in KEEP_KEYS:
+            out[key], i = _decoder.raw_decode(text, i)
+        else:
+            _, i = _decoder.raw_decode(text, i)
+
+        i = _skip_ws(text, i)
+        if text[i:i + 1] == ",":
+            i = _skip_ws(text, i + 1)
+            continue
+        _expect(text, i, "}")
+        return out
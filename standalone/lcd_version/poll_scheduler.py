@@ -0,0 +1,99 @@
+# poll_scheduler.py
+import time
+from typing import Optional
+
+import config
+from models import GameSnapshot
+from time_utils import parse_utc
+
+
+def get_poll_interval_seconds(state: str | None) -> int:
+    if state in ("LIVE", "CRIT"):
+        return 2
+    if state == "PRE":
+        return 60
+    # OFF, FINAL, unknown, no game
+    return 600
+
+
+class PollScheduler:
+    """
+    Game-clock-aware poll interval, fed with the fetch_game_now() payload.
+
+    LIVE/CRIT:
+      - clock running, or the final minutes of the 3rd / OT -> POLL_LIVE_SECONDS
+      - clock just stopped (a goal stops the clock too)     -> POLL_LIVE_SECONDS for STOPPAGE_GRACE_SECONDS
+      - longer stoppage                                     -> POLL_STOPPAGE_SECONDS
+      - intermission -> sleep until INTERMISSION_WAKE_EARLY_SECONDS before the
+        intermission timer runs out (capped at POLL_INTERMISSION_MAX_SECONDS)
+      - shootout                                             -> POLL_SHOOTOUT_SECONDS
+    FUT/PRE: sleep until PUCK_DROP_LEAD_SECONDS before the start time (capped by the
+    old fixed interval, the start time can still move).
+    Anything else falls back to get_poll_interval_seconds(state).
+    """
+
+    def __init__(self):
+        self.reason = ""
+        self._game_id = None
+        self._clock_stopped_at: Optional[float] = None
+
+    def next_interval(self, game: GameSnapshot, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        state = game.state
+
+        if game.id != self._game_id:
+            self._game_id = game.id
+            self._clock_stopped_at = None
+
+        start = parse_utc(game.start_time_utc)
+        if state in ("FUT", "PRE") and start is not None:
+            to_start = start - time.time()
+            wait = to_start - config.PUCK_DROP_LEAD_SECONDS
+            self.reason = f"puck drop in {int(to_start)}s"
+            return max(config.POLL_LIVE_SECONDS, min(wait, get_poll_interval_seconds(state)))
+
+        if state not in ("LIVE", "CRIT"):
+            self.reason = f"state {state}"
+            return get_poll_interval_seconds(state)
+
+        clock = game.clock
+        if not clock:
+            self.reason = "no clock info"
+            return config.POLL_LIVE_SECONDS
+
+        seconds_left = clock.get("secondsRemaining")
+        running = bool(clock.get("running"))
+
+        if clock.get("inIntermission"):
+            self._clock_stopped_at = None
+            if seconds_left is None:
+                self.reason = "intermission"
+                return config.POLL_STOPPAGE_SECONDS
+            wait = seconds_left - config.INTERMISSION_WAKE_EARLY_SECONDS
+            wait = max(config.POLL_LIVE_SECONDS, min(wait, config.POLL_INTERMISSION_MAX_SECONDS))
+            self.reason = f"intermission, {seconds_left}s left"
+            return wait
+
+        if game.period_type == "SO":
+            self.reason = "shootout"
+            return config.POLL_SHOOTOUT_SECONDS
+
+        if running:
+            self._clock_stopped_at = None
+            self.reason = "clock running"
+            return config.POLL_LIVE_SECONDS
+
+        # clock stopped
+        period = game.period or 0
+        if period >= 3 and seconds_left is not None and seconds_left <= config.FINAL_MINUTES_SECONDS:
+            self.reason = "final minutes"
+            return config.POLL_LIVE_SECONDS
+
+        if self._clock_stopped_at is None:
+            self._clock_stopped_at = now
+        if (now - self._clock_stopped_at) < config.STOPPAGE_GRACE_SECONDS:
+            self.reason = "clock just stopped"
+            return config.POLL_LIVE_SECONDS
+
+        self.reason = "stoppage"
+        return config.POLL_STOPPAGE_SECONDS
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# roster_pack.py
+"""
+League-wide compiled roster pack.
+
+Build step: compiles every ./roasters/*.json (or ./rosters/*.json) into one compact
+binary file holding only what fetch_goals needs (id, fullName, number, team, position,
+headshot for the goal cards), sorted by player id so it doubles as a cross-team index.
+
+Loader: memory-maps the file and binary-searches the id column, so a lookup is a
+few struct.unpack_from calls and no JSON parsing. fetch_goals looks players up here
+first; it also finds traded players whose id is on neither team's file of the game.
+A loaded pack re-checks the roster files' mtimes every PACK_CHECK_SECONDS and is
+rebuilt when one changed.
+
+  python3 roster_pack.py            # rebuild ./rosters.pack
+"""
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_ROSTER_DIRS = [os.path.join(HERE, "rosters"), os.path.join(HERE, "roasters")]
+DEFAULT_PACK_PATH = os.path.join(HERE, "rosters.pack")
+PACK_CHECK_SECONDS = 300        # how often a loaded pack compares itself to the roster files
+
+# ---- file layout (little endian) ----
+# header : magic(8) count(u32) strings_offset(u32)
+# records: id(u32) name_off(u32) name_len(u16) number(i8, -1 = none) team(3s) position(2s)
+#          headshot_off(u32) headshot_len(u16)
+# strings: utf-8 names and headshot urls, back to back
+MAGIC = b"NHLRPK02"
+HEADER = struct.Struct("<8sII")
+RECORD = struct.Struct("<IIHb3s2sIH")
+_ID = struct.Struct("<I")
+
+
+def _roster_files(roster_dirs: List[str]) -> List[str]:
+    files = []
+    for d in roster_dirs:
+        files.extend(glob.glob(os.path.join(d, "*.json")))
+    return files
+
+
+def build_pack(roster_dirs: Optional[List[str]] = None, out_path: str = DEFAULT_PACK_PATH) -> int:
+    """Compile roster json files into out_path. Returns number of players written."""
+    roster_dirs = roster_dirs or DEFAULT_ROSTER_DIRS
+
+    # newest file wins when a traded player shows up on two teams
+    files = sorted(_roster_files(roster_dirs), key=os.path.getmtime)
+    players: Dict[int, Dict[str, Any]] = {}
+    for path in files:
+        team = os.path.splitext(os.path.basename(path))[0].upper()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            continue
+        for p in data:
+            try:
+                pid = int(p["id"])
+            except Exception:
+                continue
+            players[pid] = {
+                "fullName": p.get("fullName") or "",
+                "number": p.get("number"),
+                "team": (p.get("team") or team).upper(),
+                "position": p.get("position") or "",
+                "headshot": p.get("headshot") or "",
+            }
+
+    records = bytearray()
+    strings = bytearray()
+    for pid in sorted(players):
+        p = players[pid]
+        name = p["fullName"].encode("utf-8")[:0xFFFF]
+        head = p["headshot"].encode("utf-8")[:0xFFFF]
+        try:
+            number = int(p["number"])
+        except Exception:
+            number = -1
+        if not (0 <= number <= 127):
+            number = -1
+        records += RECORD.pack(
+            pid,
+            len(strings),
+            len(name),
+            number,
+            p["team"].encode("ascii", "replace")[:3],
+            p["position"].encode("ascii", "replace")[:2],
+            len(strings) + len(name),
+            len(head),
+        )
+        strings += name
+        strings += head
+
+    strings_offset = HEADER.size + len(records)
+    tmp = out_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(players), strings_offset))
+        f.write(records)
+        f.write(strings)
+    os.replace(tmp, out_path)
+    return len(players)
+
+
+class RosterPack:
+    def __init__(self, path: str = DEFAULT_PACK_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._strings_offset = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a roster pack")
+
+    def close(self):
+        self._mm.close()
+
+    def __len__(self):
+        return self.count
+
+    def _find(self, pid: int) -> int:
+        lo, hi = 0, self.count - 1
+        base = HEADER.size
+        size = RECORD.size
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            (mid_id,) = _ID.unpack_from(self._mm, base + mid * size)
+            if mid_id == pid:
+                return mid
+            if mid_id < pid:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return -1
+
+    def get(self, pid: Any) -> Optional[Dict[str, Any]]:
+        try:
+            pid = int(pid)
+        except Exception:
+            return None
+        i = self._find(pid)
+        if i < 0:
+            return None
+        _, name_off, name_len, number, team, position, head_off, head_len = RECORD.unpack_from(
+            self._mm, HEADER.size + i * RECORD.size
+        )
+        start = self._strings_offset + name_off
+        head = self._strings_offset + head_off
+        return {
+            "id": pid,
+            "fullName": self._mm[start:start + name_len].decode("utf-8"),
+            "number": None if number < 0 else number,
+            "team": team.rstrip(b"\0").decode("ascii"),
+            "position": position.rstrip(b"\0").decode("ascii"),
+            "headshot": self._mm[head:head + head_len].decode("utf-8"),
+        }
+
+
+# ---------------- module-level lazy pack ----------------
+_pack: Optional[RosterPack] = None
+_pack_loaded = False
+_pack_checked = 0.0
+_pack_lock = threading.Lock()
+
+
+def _pack_is_stale(pack_path: str, roster_dirs: List[str]) -> bool:
+    if not os.path.exists(pack_path):
+        return True
+    pack_mtime = os.path.getmtime(pack_path)
+    return any(os.path.getmtime(p) > pack_mtime for p in _roster_files(roster_dirs))
+
+
+def get_pack(roster_dirs: Optional[List[str]] = None, pack_path: str = DEFAULT_PACK_PATH) -> Optional[RosterPack]:
+    """
+    Loads the pack once per process, (re)building it first when it is missing,
+    from an older layout, or older than the roster files. Checked again every
+    PACK_CHECK_SECONDS. Returns None if there is nothing to pack.
+    """
+    global _pack, _pack_loaded, _pack_checked
+    if _pack_loaded and (time.monotonic() - _pack_checked) < PACK_CHECK_SECONDS:
+        return _pack
+    with _pack_lock:
+        now = time.monotonic()
+        if _pack_loaded and (now - _pack_checked) < PACK_CHECK_SECONDS:
+            return _pack
+        roster_dirs = roster_dirs or DEFAULT_ROSTER_DIRS
+        try:
+            rebuilt = False
+            if _pack_is_stale(pack_path, roster_dirs) and _roster_files(roster_dirs):
+                build_pack(roster_dirs, pack_path)
+                rebuilt = True
+            if (rebuilt or _pack is None) and os.path.exists(pack_path):
+                try:
+                    _pack = RosterPack(pack_path)
+                except ValueError:
+                    # pack from an older layout
+                    build_pack(roster_dirs, pack_path)
+                    _pack = RosterPack(pack_path)
+        except Exception:
+            _pack = None
+        # a replaced pack is not closed: lookups may still be reading its mmap
+        _pack_loaded = True
+        _pack_checked = now
+        return _pack
+
+
+def lookup(pid: Any, roster_dirs: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    pack = get_pack(roster_dirs)
+    return pack.get(pid) if pack else None
+
+
+if __name__ == "__main__":
+    n = build_pack()
+    print(f"Wrote {n} players to {DEFAULT_PACK_PATH} ({os.path.getsize(DEFAULT_PACK_PATH)} bytes)")
@@ -0,0 +1,139 @@
+# schedule_cache.py
+"""
+Club schedule cache so main can sleep until a warm-up window before puck drop
+instead of re-polling /score/now all day. Persisted to disk so a reboot does
+not refetch it; refreshed every SCHEDULE_TTL_SECONDS (postponements, flex dates).
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+import config
+from log_utils import log
+from nhl_client import fetch_club_schedule
+from time_utils import parse_utc
+
+SCHEDULE_CACHE_PATH = os.path.join(os.path.dirname(__file__), "schedule_cache.json")
+SCHEDULE_TTL_SECONDS = 12 * 3600
+GAME_WINDOW_SECONDS = 5 * 3600          # a game counts as "on" this long after its start time
+MAX_SLEEP_SECONDS = 12 * 3600           # wake up at least this often to refresh the schedule
+FETCH_RETRY_SECONDS = 600               # after a failed fetch, don't retry on every poll
+
+_lock = threading.Lock()                # guards the dicts below, never held across a fetch
+_write_lock = threading.Lock()          # one writer of the json file at a time
+_mem: Dict[str, Dict[str, Any]] = {}    # team -> {"fetched_at": epoch, "games": [...]}
+_failed_at: Dict[str, float] = {}
+_inflight: Dict[str, Future] = {}       # team -> fetch in progress, other callers wait on it
+
+
+def _read_disk() -> Dict[str, Any]:
+    try:
+        with open(SCHEDULE_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f) or {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log(f"Schedule cache unreadable: {e}")
+        return {}
+
+
+def _write_disk(data: Dict[str, Any]):
+    tmp = SCHEDULE_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, SCHEDULE_CACHE_PATH)
+    except Exception as e:
+        log(f"Schedule cache write failed: {e}")
+
+
+def _save():
+    # snapshot under the write lock so an older snapshot never lands after a newer one
+    with _write_lock:
+        with _lock:
+            data = dict(_mem)
+        _write_disk(data)
+
+
+def get_schedule(team_abbr: str) -> Optional[List[Dict[str, Any]]]:
+    """Cached schedule for a team, fetched when missing/expired. None if we have nothing at all."""
+    team_abbr = str(team_abbr).upper().strip()
+    now = time.time()
+    with _lock:
+        if not _mem:
+            _mem.update(_read_disk())
+        entry = _mem.get(team_abbr)
+        if entry and (now - entry.get("fetched_at", 0)) < SCHEDULE_TTL_SECONDS:
+            return entry["games"]
+        if (now - _failed_at.get(team_abbr, 0)) < FETCH_RETRY_SECONDS:
+            return entry["games"] if entry else None
+        fut = _inflight.get(team_abbr)
+        leader = fut is None
+        if leader:
+            fut = _inflight[team_abbr] = Future()
+
+    if not leader:
+        # same team already being fetched: share its result
+        return fut.result()
+
+    # stale copy (or None) is still far better than nothing if the fetch fails
+    games = entry["games"] if entry else None
+    fetched = False
+    try:
+        games = fetch_club_schedule(team_abbr)
+        fetched = True
+        log(f"Schedule refreshed for {team_abbr}: {len(games)} games")
+    except Exception as e:
+        log(f"Schedule fetch failed for {team_abbr}: {e}")
+    finally:
+        with _lock:
+            if fetched:
+                _mem[team_abbr] = {"fetched_at": now, "games": games}
+            else:
+                _failed_at[team_abbr] = now
+            _inflight.pop(team_abbr, None)
+        fut.set_result(games)
+
+    if fetched:
+        _save()
+    return games
+
+
+def next_game_start(team_abbr: str, now: Optional[float] = None) -> Optional[float]:
+    """Start (epoch) of the game in progress or the next one. None if unknown / season over."""
+    now = time.time() if now is None else now
+    games = get_schedule(team_abbr)
+    if not games:
+        return None
+    starts = []
+    for g in games:
+        if g.get("gameState") in ("OFF", "FINAL"):
+            continue
+        start = parse_utc(g.get("startTimeUTC"))
+        if start is not None and start + GAME_WINDOW_SECONDS > now:
+            starts.append(start)
+    return min(starts) if starts else None
+
+
+def seconds_until_warmup(team_abbr: str, now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to sleep before polling /score/now again:
+      - 0    -> inside the warm-up window or a game is on: poll normally
+      - > 0  -> nothing to do until then (capped at MAX_SLEEP_SECONDS)
+      - None -> schedule unknown (fetch failed): fall back to blind polling
+    """
+    now = time.time() if now is None else now
+    games = get_schedule(team_abbr)
+    if games is None:
+        return None
+    start = next_game_start(team_abbr, now)
+    if start is None:
+        # no game left on this schedule (off-season)
+        return MAX_SLEEP_SECONDS
+    wait = start - config.PREGAME_WARMUP_SECONDS - now
+    if wait <= 0:
+        return 0
+    return min(wait, MAX_SLEEP_SECONDS)
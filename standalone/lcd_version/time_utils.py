@@ -0,0 +1,13 @@
+# time_utils.py
+from datetime import datetime
+from typing import Optional
+
+
+def parse_utc(iso: Optional[str]) -> Optional[float]:
+    """'2025-11-07T00:00:00Z' -> epoch seconds (None if missing/bad)."""
+    if not iso:
+        return None
+    try:
+        return datetime.fromisoformat(iso.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None